@@ -11,26 +11,39 @@ from src.game_events.game_event_repository import GameEventRepository
 from src.game_events.jsonc_document_loader import JsoncDocumentLoader
 from src.game_events.templates.game_event_template_catalog_service import GameEventTemplateCatalogService
 from src.game_events.templates.game_event_template_repository import GameEventTemplateRepository
+from src.listeners.api_client_shutdown_event_listener import ApiClientShutdownEventListener
+from src.listeners.balance_flush_event_listener import BalanceFlushEventListener
 from src.listeners.chat_event_listener import ChatEventListener
 from src.listeners.chat_response_event_listener import ChatResponseEventListener
+from src.listeners.game_state_event_listener import GameStateEventListener
 from src.listeners.overlay_event_listener import OverlayEventListener
 from src.listeners.purchase_event_listener import PurchaseEventListener
+from src.listeners.request_trace_event_listener import RequestTraceEventListener
+from src.listeners.resources_stream_event_listener import ResourcesStreamEventListener
 from src.listeners.settings_event_listener import SettingsEventListener
 from src.listeners.twitch_event_listener import TwitchEventListener
 from src.listeners.twitch_status_event_listener import TwitchStatusEventListener
 from src.listeners.voting_event_listener import VotingEventListener
 from src.listeners.window_event_listener import WindowEventListener
-from src.purchases.balance_repository import BalanceRepository
+from src.purchases.balance_ledger_repository import BalanceLedgerRepository
 from src.purchases.balance_service import BalanceService
 from src.purchases.chat_command_handler import ChatCommandHandler
 from src.purchases.events_web_server import EventsWebServer
+from src.purchases.interfaces.balance_repository_interface import BalanceRepositoryInterface
 from src.purchases.purchase_service import PurchaseService
 from src.purchases.silver_earning_service import SilverEarningService
+from src.purchases.sqlite_balance_repository import SqliteBalanceRepository
+from src.rimapi.game_clock_service import GameClockService
+from src.rimapi.game_state_service import GameStateService
+from src.rimapi.resources_stream_service import ResourcesStreamService
 from src.twitch.twitch_chat_service import TwitchChatService
 from src.voting.voting_service import VotingService
 from src.features.overlay.service import Service
 from src.window.chat_window_service import ChatWindowService
 from src.window.events_window_service import EventsWindowService
+from src.window.events.editor_tab.game_api_catalog_store import GameApiCatalogStore
+from src.window.events.rim_api_endpoint_provider import RimApiEndpointProvider
+from src.window.async_event_loop_thread import AsyncEventLoopThread
 from src.window.main_window_service import MainWindowService
 from src.window.rest_api_client import RestApiClient
 from src.window.settings_window import SettingsWindow
@@ -61,11 +74,21 @@ def Bootstrap(projectRoot: Path) -> None:
     votingService = VotingService(definitionsCatalog, eventBus)
 
     apiClient = RestApiClient()
-    eventExecutor = GameEventExecutor(apiClient)
+    apiEventLoop = AsyncEventLoopThread()
+    eventExecutor = GameEventExecutor(apiClient, apiEventLoop)
+    resourcesStream = ResourcesStreamService(settingsService, eventBus)
+    gameStateService = GameStateService(apiClient, RimApiEndpointProvider(settingsService).GetEndpoint)
+    eventExecutor.AddExecutedListener(lambda definition: gameStateService.RefreshAll())
+    gameClockService = GameClockService(gameStateService)
 
     # Purchases system
     balancesFilePath = projectRoot / "user_balances.json"
-    balanceRepository = BalanceRepository(balancesFilePath)
+    balanceRepository: BalanceRepositoryInterface
+    if settingsService.Get().balanceStorage == "sqlite":
+        # Imports user_balances.json and its ledger once, on first open.
+        balanceRepository = SqliteBalanceRepository(projectRoot / "user_balances.db", legacyFilePath=balancesFilePath)
+    else:
+        balanceRepository = BalanceLedgerRepository(balancesFilePath)
     balanceService = BalanceService(balanceRepository)
     silverEarningService = SilverEarningService(balanceService)
     purchaseService = PurchaseService(balanceService, definitionsCatalog, eventExecutor, settingsService)
@@ -78,7 +101,10 @@ def Bootstrap(projectRoot: Path) -> None:
         eventExecutor,
         settingsService,
         apiClient,
+        gameStateService,
         templateCatalogService=templatesCatalog,
+        gameClockService=gameClockService,
+        catalogStore=GameApiCatalogStore(projectRoot / "rimapi_catalog_cache.json"),
         localizerProvider=localizerProvider,
         uiScheduler=uiScheduler,
     )
@@ -110,6 +136,11 @@ def Bootstrap(projectRoot: Path) -> None:
     # Purchase system listeners
     purchaseListener = PurchaseEventListener(eventBus, balanceService, silverEarningService, chatCommandHandler)
     chatResponseListener = ChatResponseEventListener(eventBus, twitchService)
+    resourcesStreamListener = ResourcesStreamEventListener(eventBus, resourcesStream)
+    gameStateListener = GameStateEventListener(eventBus, gameStateService, gameClockService)
+    balanceFlushListener = BalanceFlushEventListener(eventBus, balanceService, silverEarningService)
+    requestTraceListener = RequestTraceEventListener(eventBus, apiClient.GetTracer(), projectRoot / "rimapi_request_trace.json")
+    apiClientShutdownListener = ApiClientShutdownEventListener(eventBus, eventExecutor, apiEventLoop, apiClient)
 
     # Start web server if purchases enabled
     currentSettings = settingsService.Get()
@@ -118,7 +149,7 @@ def Bootstrap(projectRoot: Path) -> None:
 
     application = Application(
         eventBus,
-        [windowListener, overlayListener, settingsListener, twitchListener, chatListener, votingListener, twitchStatusListener, purchaseListener, chatResponseListener],
+        [windowListener, overlayListener, settingsListener, twitchListener, chatListener, votingListener, twitchStatusListener, purchaseListener, chatResponseListener, resourcesStreamListener, gameStateListener, balanceFlushListener, requestTraceListener, apiClientShutdownListener],
         bootstrap=settingsService.PublishCurrent,
     )
     application.Run()
@@ -37,6 +37,9 @@ def BuildEnglishTable() -> LocalizationTable:
             # Balances tab
             "balances.title": "User balances",
             "balances.button.refresh": "Refresh",
+            "balances.button.previous": "Previous",
+            "balances.button.next": "Next",
+            "balances.count.page": "{first}–{last} of {total}",
             "balances.column.user": "User",
             "balances.column.balance": "Balance",
             "balances.empty": "No balances recorded yet",
@@ -134,6 +137,7 @@ def BuildEnglishTable() -> LocalizationTable:
             "events.random.status.noEnabled": "No enabled events (check tags)",
             "events.random.status.newRound": "New round started",
             "events.random.status.noWinner": "No winner (no votes)",
+            "events.random.status.executing": "Executing: {display}...",
             "events.random.status.executed": "Executed: {display} ({summary})",
             "events.random.status.executionFailed": "Execution failed: {error}",
 
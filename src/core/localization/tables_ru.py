@@ -37,6 +37,9 @@ def BuildRussianTable() -> LocalizationTable:
             # Balances tab
             "balances.title": "Баланс пользователей",
             "balances.button.refresh": "Обновить",
+            "balances.button.previous": "Назад",
+            "balances.button.next": "Вперёд",
+            "balances.count.page": "{first}–{last} из {total}",
             "balances.column.user": "Пользователь",
             "balances.column.balance": "Баланс",
             "balances.empty": "Балансов пока нет",
@@ -134,6 +137,7 @@ def BuildRussianTable() -> LocalizationTable:
             "events.random.status.noEnabled": "Нет включённых событий (проверь теги)",
             "events.random.status.newRound": "Начат новый раунд",
             "events.random.status.noWinner": "Победителя нет (нет голосов)",
+            "events.random.status.executing": "Выполняется: {display}...",
             "events.random.status.executed": "Выполнено: {display} ({summary})",
             "events.random.status.executionFailed": "Ошибка выполнения: {error}",
 
@@ -11,7 +11,7 @@ class SettingsRepository:
     def Load(self) -> AppSettings:
         try:
             if not self.path.exists():
-                return AppSettings(False, "", "", "", False, 0, "localhost", 0, "en", True, 8080)
+                return AppSettings(False, "", "", "", False, 0, "localhost", 0, "en", True, 8080, False, "json")
             with self.path.open("r", encoding="utf-8") as handle:
                 data = json.load(handle)
                 return AppSettings(
@@ -26,9 +26,11 @@ class SettingsRepository:
                     str(data.get("uiLanguage", "en")),
                     bool(data.get("purchasesEnabled", True)),
                     int(data.get("purchasesWebPort", 8080)),
+                    bool(data.get("requestTracingEnabled", False)),
+                    str(data.get("balanceStorage", "json") or "json").strip().lower(),
                 )
         except Exception:
-            return AppSettings(False, "", "", "", False, 0, "localhost", 0, "en", True, 8080)
+            return AppSettings(False, "", "", "", False, 0, "localhost", 0, "en", True, 8080, False, "json")
 
     def Save(self, settings: AppSettings) -> None:
         try:
@@ -44,6 +46,8 @@ class SettingsRepository:
                 "uiLanguage": str(getattr(settings, "uiLanguage", "en") or "en"),
                 "purchasesEnabled": bool(getattr(settings, "purchasesEnabled", True)),
                 "purchasesWebPort": int(getattr(settings, "purchasesWebPort", 8080)),
+                "requestTracingEnabled": bool(getattr(settings, "requestTracingEnabled", False)),
+                "balanceStorage": str(getattr(settings, "balanceStorage", "json") or "json"),
             }
             self.path.parent.mkdir(parents=True, exist_ok=True)
             with self.path.open("w", encoding="utf-8") as handle:
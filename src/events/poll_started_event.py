@@ -0,0 +1,15 @@
+from typing import List
+
+from src.core.events.event import Event
+
+
+class PollStartedEvent(Event):
+    """Event fired when a new voting round opens.
+
+    Listeners that track per-round state (who already earned a vote
+    reward) reset it here.
+    """
+
+    def __init__(self, options: List[str]) -> None:
+        super().__init__("poll_started")
+        self.options = list(options)  # option texts shown for this round
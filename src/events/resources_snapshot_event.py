@@ -0,0 +1,16 @@
+from typing import Dict
+
+from src.core.events.event import Event
+
+
+class ResourcesSnapshotEvent(Event):
+    """Event fired for each colony resource snapshot streamed from RimAPI.
+
+    Published from the stream's background thread; UI subscribers must
+    marshal onto the Tk thread themselves.
+    """
+
+    def __init__(self, resources: Dict[str, int], receivedAt: float) -> None:
+        super().__init__("resources_snapshot")
+        self.resources = dict(resources)  # counts by resource key (silver, steel, ...), includes mapCount
+        self.receivedAt = receivedAt  # time.monotonic() when the snapshot arrived
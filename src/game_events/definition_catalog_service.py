@@ -0,0 +1,49 @@
+import threading
+from typing import Generic, List
+
+from src.game_events.definition_repository import DefinitionEntry, DefinitionFingerprint, DefinitionRepository
+
+
+class DefinitionCatalogService(Generic[DefinitionEntry]):
+    """DefinitionCatalogService keeps the entries of a `DefinitionRepository` in memory.
+
+    Every `Reload` bumps `GetVersion`, so callers can key caches on it;
+    `ReloadIfChanged` compares the files' fingerprint first and skips parsing
+    when nothing on disk changed.
+    """
+
+    def __init__(self, repository: DefinitionRepository[DefinitionEntry]) -> None:
+        self._repository = repository
+        self._lock = threading.Lock()
+        self._version = 0
+        self._fingerprint: DefinitionFingerprint = tuple()
+        self._entries: List[DefinitionEntry] = []
+        self.Reload()
+
+    def Reload(self) -> None:
+        fingerprint = self._repository.GetFingerprint()
+        entries = self._repository.LoadAll()
+        with self._lock:
+            self._entries = entries
+            self._fingerprint = fingerprint
+            self._version += 1
+            self._OnReloaded()
+
+    def ReloadIfChanged(self) -> bool:
+        """ReloadIfChanged reloads only when the files on disk differ from the last load."""
+
+        if self._repository.GetFingerprint() == self._fingerprint:
+            return False
+        self.Reload()
+        return True
+
+    def GetVersion(self) -> int:
+        return self._version
+
+    def GetEntries(self) -> List[DefinitionEntry]:
+        return list(self._entries)
+
+    def _OnReloaded(self) -> None:
+        """_OnReloaded drops caches built from the previous entries (called under the lock)."""
+
+        pass
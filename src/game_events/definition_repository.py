@@ -0,0 +1,38 @@
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Generic, List, Tuple, TypeVar
+
+from src.game_events.jsonc_document_loader import JsoncDocumentLoader
+
+
+DefinitionEntry = TypeVar("DefinitionEntry")
+DefinitionFingerprint = Tuple[Tuple[str, int, int], ...]
+
+
+class DefinitionRepository(ABC, Generic[DefinitionEntry]):
+    """DefinitionRepository reads one folder of `*.jsonc` definition files."""
+
+    def __init__(self, directory: Path, loader: JsoncDocumentLoader) -> None:
+        self._directory = directory
+        self._loader = loader
+
+    def GetFingerprint(self) -> DefinitionFingerprint:
+        """GetFingerprint returns a cheap (name, mtime, size) snapshot of the definition files."""
+
+        fingerprint: List[Tuple[str, int, int]] = []
+        for filePath in self._GetDefinitionFiles():
+            try:
+                stat = filePath.stat()
+                fingerprint.append((filePath.name, int(stat.st_mtime_ns), int(stat.st_size)))
+            except OSError:
+                continue
+        return tuple(fingerprint)
+
+    @abstractmethod
+    def LoadAll(self) -> List[DefinitionEntry]:
+        pass
+
+    def _GetDefinitionFiles(self) -> List[Path]:
+        if not self._directory.exists() or not self._directory.is_dir():
+            return []
+        return sorted(self._directory.glob("*.jsonc"))
@@ -1,22 +1,18 @@
 import random
-from typing import List, Optional
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
+from src.game_events.definition_catalog_service import DefinitionCatalogService
 from src.game_events.game_event_entry import GameEventEntry
 from src.game_events.game_event_definition import GameEventDefinition
 from src.game_events.game_event_repository import GameEventRepository
+from src.game_events.weighted_sampler import WeightedSampler
 
 
-class GameEventCatalogService:
-    def __init__(self, repository: GameEventRepository) -> None:
-        self._repository = repository
-        self._entries: List[GameEventEntry] = []
-        self.Reload()
-
-    def Reload(self) -> None:
-        self._entries = self._repository.LoadAll()
-
-    def GetEntries(self) -> List[GameEventEntry]:
-        return list(self._entries)
+class GameEventCatalogService(DefinitionCatalogService[GameEventEntry]):
+    def __init__(self, repository: GameEventRepository, randomSource: Optional[random.Random] = None) -> None:
+        self._random = randomSource if randomSource is not None else random.Random()
+        self._samplers: Dict[Tuple[int, FrozenSet[str]], WeightedSampler[GameEventDefinition]] = {}
+        super().__init__(repository)
 
     def GetAll(self) -> List[GameEventDefinition]:
         return [entry.definition for entry in self._entries]
@@ -35,12 +31,20 @@ class GameEventCatalogService:
                     tags.add(str(tag))
         return sorted(tags)
 
+    def _OnReloaded(self) -> None:
+        self._samplers = {}
+
     def PickRandom(self, tags: Optional[List[str]] = None) -> Optional[GameEventDefinition]:
-        pool = self.GetByTags(tags or [])
-        if not pool:
-            return None
-
-        weights = [max(0.0, float(definition.probability)) for definition in pool]
-        if all(weight == 0.0 for weight in weights):
-            return random.choice(pool)
-        return random.choices(pool, weights=weights, k=1)[0]
+        return self.GetSampler(tags or []).PickOne()
+
+    def GetSampler(self, tags: List[str]) -> WeightedSampler[GameEventDefinition]:
+        """GetSampler returns the weighted sampler for a tag selection, cached per catalog version."""
+
+        required = frozenset(tag for tag in [str(value).strip() for value in tags] if tag)
+        key = (self._version, required)
+        sampler = self._samplers.get(key)
+        if sampler is None:
+            pool = self.GetByTags(list(required))
+            sampler = WeightedSampler(pool, [definition.probability for definition in pool], randomSource=self._random)
+            self._samplers[key] = sampler
+        return sampler
@@ -28,6 +28,34 @@ class GameEventDefinition:
         self.notification = notification or GameEventNotificationOptions.Default(fallback_title=self.label, fallback_message=fallbackMessage)
         self.hidden = bool(hidden)
 
+    def GetRequestDependencies(self) -> List[List[int]]:
+        """GetRequestDependencies returns, per request, the indices it must wait for.
+
+        Without annotations every request waits for the one before it (the
+        original sequential behaviour). Adjacent requests sharing a `group` form
+        one stage that waits for the whole previous stage. An explicit `after`
+        list overrides this; only indices of earlier requests are honoured, so
+        the result is always acyclic.
+        """
+
+        dependencies: List[List[int]] = []
+        previousStage: List[int] = []
+        currentStage: List[int] = []
+        currentGroup: Optional[str] = None
+
+        for index, request in enumerate(self.requests):
+            if request.group is None or request.group != currentGroup or not currentStage:
+                previousStage = currentStage
+                currentStage = []
+            currentGroup = request.group
+            currentStage.append(index)
+
+            if request.after is not None:
+                dependencies.append(sorted({value for value in request.after if 0 <= value < index}))
+            else:
+                dependencies.append(list(previousStage))
+        return dependencies
+
     @staticmethod
     def FromJson(document: Dict[str, Any]) -> "GameEventDefinition":
         eventId = str(document.get("id", "")).strip()
@@ -66,7 +94,20 @@ class GameEventDefinition:
                     body = {}
                 if query is not None and not isinstance(query, dict):
                     query = {}
-                requests.append(GameEventRequest(method=method, path=path, payload=payload, body=body, query={str(key): str(value) for key, value in dict(query).items()}))
+                rawTimeout = item.get("timeoutSeconds", None)
+                timeoutSeconds = float(rawTimeout) if isinstance(rawTimeout, (int, float)) and not isinstance(rawTimeout, bool) else None
+                requests.append(
+                    GameEventRequest(
+                        method=method,
+                        path=path,
+                        payload=payload,
+                        body=body,
+                        query={str(key): str(value) for key, value in dict(query or {}).items()},
+                        timeoutSeconds=timeoutSeconds,
+                        after=GameEventRequest.ParseAfter(item.get("after", None)),
+                        group=item.get("group", None),
+                    )
+                )
 
         return GameEventDefinition(
             eventId=eventId,
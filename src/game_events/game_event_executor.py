@@ -1,56 +1,136 @@
-from typing import Dict, List, Optional
+import asyncio
+import concurrent.futures
+from typing import Awaitable, Callable, Dict, List, Optional, TypeVar
 
 from src.game_events.game_event_definition import GameEventDefinition
 from src.game_events.game_event_request import GameEventRequest
+from src.window.async_event_loop_thread import AsyncEventLoopThread
 from src.window.rest_api_client import RestApiClient
 
 
+RequestResult = TypeVar("RequestResult")
+
+
 class GameEventExecutor:
-    def __init__(self, client: RestApiClient) -> None:
+    """GameEventExecutor sends a definition's requests to RimAPI.
+
+    The native path is `ExecuteAsync` / `ExecuteDetailedAsync` on the shared
+    event loop. `Submit*` hand back a future for callers that must not block,
+    and `Execute` / `ExecuteDetailed` stay as blocking facades.
+
+    Requests run as a dependency graph (see
+    `GameEventDefinition.GetRequestDependencies`): unannotated definitions stay
+    sequential, independent requests run concurrently. Results keep request order.
+
+    Executed listeners run on the loop thread once a definition's requests
+    have finished (successfully or not); keep them short.
+    """
+
+    def __init__(self, client: RestApiClient, eventLoop: Optional[AsyncEventLoopThread] = None) -> None:
         self._client = client
+        self._eventLoop = eventLoop if eventLoop is not None else AsyncEventLoopThread()
+        self._executedListeners: List[Callable[[GameEventDefinition], None]] = []
+
+    def Close(self) -> None:
+        """Close drops the idle connections held for the async path."""
+
+        try:
+            self._eventLoop.Run(self._client.CloseAsync(), timeoutSeconds=2.0)
+        except Exception:
+            pass
+
+    def AddExecutedListener(self, listener: Callable[[GameEventDefinition], None]) -> None:
+        self._executedListeners.append(listener)
+
+    def IsAvailable(self, host: str, port: int) -> bool:
+        """IsAvailable is False while RimAPI's circuit is open and requests would fail fast."""
+
+        return self._client.IsAvailable(host, port)
 
     def Execute(self, host: str, port: int, definition: GameEventDefinition) -> List[str]:
-        results: List[str] = []
+        return self._eventLoop.Run(self.ExecuteAsync(host, port, definition))
+
+    def ExecuteDetailed(self, host: str, port: int, definition: GameEventDefinition) -> List[Dict[str, object]]:
+        return self._eventLoop.Run(self.ExecuteDetailedAsync(host, port, definition))
+
+    def Submit(self, host: str, port: int, definition: GameEventDefinition) -> "concurrent.futures.Future[List[str]]":
+        return self._eventLoop.Submit(self.ExecuteAsync(host, port, definition))
+
+    def SubmitDetailed(self, host: str, port: int, definition: GameEventDefinition) -> "concurrent.futures.Future[List[Dict[str, object]]]":
+        return self._eventLoop.Submit(self.ExecuteDetailedAsync(host, port, definition))
+
+    async def ExecuteAsync(self, host: str, port: int, definition: GameEventDefinition) -> List[str]:
         notificationHeaders = definition.notification.BuildHeaders()
-        hasAppliedNotificationHeaders = False
 
-        for request in definition.requests:
-            headersToApply: Optional[Dict[str, str]] = None
-            if not hasAppliedNotificationHeaders:
-                headersToApply = notificationHeaders
-                hasAppliedNotificationHeaders = True
+        async def runRequest(index: int, request: GameEventRequest) -> str:
+            # Notification headers go with the first request only.
+            headersToApply = notificationHeaders if index == 0 else None
+            return await self.__ExecuteRequest(host, port, request, headers=headersToApply)
 
-            results.append(self.__ExecuteRequest(host, port, request, headers=headersToApply))
-        return results
+        return await self.__RunGraph(definition, runRequest)
 
-    def ExecuteDetailed(self, host: str, port: int, definition: GameEventDefinition) -> List[Dict[str, object]]:
-        results: List[Dict[str, object]] = []
+    async def ExecuteDetailedAsync(self, host: str, port: int, definition: GameEventDefinition) -> List[Dict[str, object]]:
         notificationHeaders = definition.notification.BuildHeaders()
-        hasAppliedNotificationHeaders = False
-
-        for request in definition.requests:
-            headersToApply: Optional[Dict[str, str]] = None
-            if not hasAppliedNotificationHeaders:
-                headersToApply = notificationHeaders
-                hasAppliedNotificationHeaders = True
-
-            results.append(self.__ExecuteRequestDetailed(host, port, request, headers=headersToApply))
-        return results
-
-    def __ExecuteRequest(self, host: str, port: int, request: GameEventRequest, headers: Optional[Dict[str, str]]) -> str:
-        if request.payload == "query":
-            action = {"method": request.method, "path": request.path, "payload": "query"}
-            return self._client.Execute(host, port, action, dict(request.query), headers=headers)
-
-        params = {str(key): str(value) for key, value in dict(request.body).items()}
-        action = {"method": request.method, "path": request.path, "payload": "json"}
-        return self._client.Execute(host, port, action, params, headers=headers)
-
-    def __ExecuteRequestDetailed(self, host: str, port: int, request: GameEventRequest, headers: Optional[Dict[str, str]]) -> Dict[str, object]:
-        if request.payload == "query":
-            action = {"method": request.method, "path": request.path, "payload": "query"}
-            return self._client.ExecuteDetailed(host, port, action, dict(request.query), headers=headers)
-
-        params = {str(key): str(value) for key, value in dict(request.body).items()}
-        action = {"method": request.method, "path": request.path, "payload": "json"}
-        return self._client.ExecuteDetailed(host, port, action, params, headers=headers)
+        dependencies = definition.GetRequestDependencies()
+        loop = asyncio.get_running_loop()
+        startedAt = loop.time()
+
+        async def runRequest(index: int, request: GameEventRequest) -> Dict[str, object]:
+            headersToApply = notificationHeaders if index == 0 else None
+            requestStartedAt = loop.time()
+            result = await self.__ExecuteRequestDetailed(host, port, request, headers=headersToApply)
+            finishedAt = loop.time()
+
+            timed = dict(result)
+            timed["index"] = index
+            timed["after"] = list(dependencies[index])
+            timed["startedMs"] = round((requestStartedAt - startedAt) * 1000.0, 1)
+            timed["elapsedMs"] = round((finishedAt - requestStartedAt) * 1000.0, 1)
+            return timed
+
+        return await self.__RunGraph(definition, runRequest, dependencies)
+
+    async def __RunGraph(
+        self,
+        definition: GameEventDefinition,
+        runRequest: Callable[[int, GameEventRequest], Awaitable[RequestResult]],
+        dependencies: Optional[List[List[int]]] = None,
+    ) -> List[RequestResult]:
+        requests = list(definition.requests)
+        if not requests:
+            return []
+        resolved = dependencies if dependencies is not None else definition.GetRequestDependencies()
+
+        tasks: List["asyncio.Task[RequestResult]"] = []
+
+        async def runAfter(index: int, request: GameEventRequest, waitFor: List["asyncio.Task[RequestResult]"]) -> RequestResult:
+            if waitFor:
+                # A failed dependency does not stop dependants (matches the sequential behaviour).
+                await asyncio.gather(*waitFor, return_exceptions=True)
+            return await runRequest(index, request)
+
+        for index, request in enumerate(requests):
+            waitFor = [tasks[dependency] for dependency in resolved[index]]
+            tasks.append(asyncio.ensure_future(runAfter(index, request, waitFor)))
+
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        finally:
+            self.__NotifyExecuted(definition)
+
+    def __NotifyExecuted(self, definition: GameEventDefinition) -> None:
+        for listener in list(self._executedListeners):
+            try:
+                listener(definition)
+            except Exception as error:
+                print(f"GameEventExecutor: executed listener failed: {error}")
+
+    async def __ExecuteRequest(self, host: str, port: int, request: GameEventRequest, headers: Optional[Dict[str, str]]) -> str:
+        return await self._client.ExecuteEncodedAsync(host, port, request.GetEncoded(), headers=headers, timeoutSeconds=request.timeoutSeconds)
+
+    async def __ExecuteRequestDetailed(self, host: str, port: int, request: GameEventRequest, headers: Optional[Dict[str, str]]) -> Dict[str, object]:
+        return await self._client.ExecuteEncodedDetailedAsync(host, port, request.GetEncoded(), headers=headers, timeoutSeconds=request.timeoutSeconds)
@@ -1,22 +1,14 @@
-from pathlib import Path
 from typing import List
 
+from src.game_events.definition_repository import DefinitionRepository
 from src.game_events.game_event_entry import GameEventEntry
 from src.game_events.game_event_definition import GameEventDefinition
-from src.game_events.jsonc_document_loader import JsoncDocumentLoader
 
 
-class GameEventRepository:
-    def __init__(self, directory: Path, loader: JsoncDocumentLoader) -> None:
-        self._directory = directory
-        self._loader = loader
-
+class GameEventRepository(DefinitionRepository[GameEventEntry]):
     def LoadAll(self) -> List[GameEventEntry]:
-        if not self._directory.exists() or not self._directory.is_dir():
-            return []
-
         entries: List[GameEventEntry] = []
-        for filePath in sorted(self._directory.glob("*.jsonc")):
+        for filePath in self._GetDefinitionFiles():
             try:
                 document = self._loader.Load(filePath)
                 definition = GameEventDefinition.FromJson(document)
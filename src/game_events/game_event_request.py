@@ -1,10 +1,52 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+
+from src.window.encoded_http_request import EncodedHttpRequest
 
 
 class GameEventRequest:
-    def __init__(self, method: str, path: str, payload: str = "json", body: Optional[Dict[str, Any]] = None, query: Optional[Dict[str, str]] = None) -> None:
+    def __init__(
+        self,
+        method: str,
+        path: str,
+        payload: str = "json",
+        body: Optional[Dict[str, Any]] = None,
+        query: Optional[Dict[str, str]] = None,
+        timeoutSeconds: Optional[float] = None,
+        after: Optional[List[int]] = None,
+        group: Optional[str] = None,
+    ) -> None:
         self.method = (method or "GET").upper()
         self.path = path or "/"
         self.payload = payload or "json"  # json | query
         self.body = body or {}
         self.query = query or {}
+        self.timeoutSeconds = float(timeoutSeconds) if timeoutSeconds is not None and float(timeoutSeconds) > 0 else None  # None = client default
+        self.after = [int(index) for index in after] if after is not None else None  # explicit dependencies (request indices)
+        self.group = str(group).strip() if group is not None and str(group).strip() else None  # adjacent requests in one group run concurrently
+        self._encoded: Optional[EncodedHttpRequest] = None
+
+    def GetEncoded(self) -> EncodedHttpRequest:
+        """GetEncoded returns the rendered path and serialized body, built on first use.
+
+        Requests are treated as immutable once built; body values keep their JSON
+        types. The cached encoding is reused by every later execution.
+        """
+
+        encoded = self._encoded
+        if encoded is None:
+            params = self.query if self.payload == "query" else self.body
+            encoded = EncodedHttpRequest.Encode(self.method, self.path, self.payload, params)
+            self._encoded = encoded
+        return encoded
+
+    @staticmethod
+    def ParseAfter(raw: Any) -> Optional[List[int]]:
+        """ParseAfter reads an `after` value (index or list of indices); None when absent or malformed."""
+
+        if raw is None or isinstance(raw, bool):
+            return None
+        if isinstance(raw, int):
+            return [raw]
+        if not isinstance(raw, list):
+            return None
+        return [int(value) for value in raw if isinstance(value, int) and not isinstance(value, bool)]
@@ -1,23 +1,14 @@
-
-
 from typing import List, Optional
 
+from src.game_events.definition_catalog_service import DefinitionCatalogService
 from src.game_events.templates.game_event_template_definition import GameEventTemplateDefinition
 from src.game_events.templates.game_event_template_entry import GameEventTemplateEntry
 from src.game_events.templates.game_event_template_repository import GameEventTemplateRepository
 
 
-class GameEventTemplateCatalogService:
+class GameEventTemplateCatalogService(DefinitionCatalogService[GameEventTemplateEntry]):
     def __init__(self, repository: GameEventTemplateRepository) -> None:
-        self._repository = repository
-        self._entries: List[GameEventTemplateEntry] = []
-        self.Reload()
-
-    def Reload(self) -> None:
-        self._entries = self._repository.LoadAll()
-
-    def GetEntries(self) -> List[GameEventTemplateEntry]:
-        return list(self._entries)
+        super().__init__(repository)
 
     def GetAll(self) -> List[GameEventTemplateDefinition]:
         return [entry.definition for entry in self._entries]
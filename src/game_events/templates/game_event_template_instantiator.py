@@ -50,5 +50,16 @@ class GameEventTemplateInstantiator:
             bodyDict: Dict[str, Any] = resolvedBody if isinstance(resolvedBody, dict) else {}
             queryDictRaw: Dict[str, Any] = resolvedQuery if isinstance(resolvedQuery, dict) else {}
             queryDict = {str(key): str(value) for key, value in queryDictRaw.items()}
-            requests.append(GameEventRequest(method=requestTemplate.method, path=requestTemplate.path, payload=requestTemplate.payload, body=bodyDict, query=queryDict))
+            requests.append(
+                GameEventRequest(
+                    method=requestTemplate.method,
+                    path=requestTemplate.path,
+                    payload=requestTemplate.payload,
+                    body=bodyDict,
+                    query=queryDict,
+                    timeoutSeconds=requestTemplate.timeoutSeconds,
+                    after=requestTemplate.after,
+                    group=requestTemplate.group,
+                )
+            )
         return requests
@@ -1,22 +1,14 @@
-from pathlib import Path
 from typing import List
 
-from src.game_events.jsonc_document_loader import JsoncDocumentLoader
+from src.game_events.definition_repository import DefinitionRepository
 from src.game_events.templates.game_event_template_definition import GameEventTemplateDefinition
 from src.game_events.templates.game_event_template_entry import GameEventTemplateEntry
 
 
-class GameEventTemplateRepository:
-    def __init__(self, directory: Path, loader: JsoncDocumentLoader) -> None:
-        self._directory = directory
-        self._loader = loader
-
+class GameEventTemplateRepository(DefinitionRepository[GameEventTemplateEntry]):
     def LoadAll(self) -> List[GameEventTemplateEntry]:
-        if not self._directory.exists() or not self._directory.is_dir():
-            return []
-
         entries: List[GameEventTemplateEntry] = []
-        for filePath in sorted(self._directory.glob("*.jsonc")):
+        for filePath in self._GetDefinitionFiles():
             try:
                 document = self._loader.Load(filePath)
                 definition = GameEventTemplateDefinition.FromJson(document)
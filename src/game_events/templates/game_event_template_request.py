@@ -1,5 +1,7 @@
 from dataclasses import dataclass
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
+
+from src.game_events.game_event_request import GameEventRequest
 
 
 @dataclass(frozen=True)
@@ -9,6 +11,9 @@ class GameEventTemplateRequest:
     payload: str
     bodyTemplate: Any
     queryTemplate: Any
+    timeoutSeconds: Optional[float] = None
+    after: Optional[List[int]] = None
+    group: Optional[str] = None
 
     @staticmethod
     def FromJson(document: Dict[str, Any]) -> "GameEventTemplateRequest":
@@ -20,4 +25,15 @@ class GameEventTemplateRequest:
         payload = str(document.get("payload", "json") or "json")
         bodyTemplate = document.get("body", {})
         queryTemplate = document.get("query", {})
-        return GameEventTemplateRequest(method=method, path=path, payload=payload, bodyTemplate=bodyTemplate, queryTemplate=queryTemplate)
+        rawTimeout = document.get("timeoutSeconds", None)
+        timeoutSeconds = float(rawTimeout) if isinstance(rawTimeout, (int, float)) and not isinstance(rawTimeout, bool) else None
+        return GameEventTemplateRequest(
+            method=method,
+            path=path,
+            payload=payload,
+            bodyTemplate=bodyTemplate,
+            queryTemplate=queryTemplate,
+            timeoutSeconds=timeoutSeconds,
+            after=GameEventRequest.ParseAfter(document.get("after", None)),
+            group=document.get("group", None),
+        )
@@ -0,0 +1,93 @@
+import heapq
+import math
+import random
+from bisect import bisect_right
+from typing import Generic, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+
+SampledItem = TypeVar("SampledItem")
+
+
+class WeightedSampler(Generic[SampledItem]):
+    """WeightedSampler draws items proportionally to weights precomputed once per pool.
+
+    Single draws use a cumulative table and binary search; draws without
+    replacement use Efraimidis-Spirakis keys, so k distinct items cost one
+    pass over the pool instead of rebuilding weights after every pick.
+    Items with a zero (or negative) weight are only drawn once every
+    positively weighted item is exhausted, uniformly among themselves.
+    """
+
+    def __init__(self, items: Sequence[SampledItem], weights: Sequence[float], randomSource: Optional[random.Random] = None) -> None:
+        if len(items) != len(weights):
+            raise ValueError("WeightedSampler requires one weight per item")
+
+        self._items: List[SampledItem] = list(items)
+        self._random = randomSource if randomSource is not None else random.Random()
+
+        self._positiveIndices: List[int] = []
+        self._inverseWeights: List[float] = []
+        self._zeroIndices: List[int] = []
+        self._cumulative: List[float] = []
+
+        total = 0.0
+        for index, rawWeight in enumerate(weights):
+            weight = float(rawWeight)
+            if weight > 0.0 and math.isfinite(weight):
+                self._positiveIndices.append(index)
+                self._inverseWeights.append(1.0 / weight)
+                total += weight
+                self._cumulative.append(total)
+            else:
+                self._zeroIndices.append(index)
+        self._total = total
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def PickOne(self) -> Optional[SampledItem]:
+        if not self._items:
+            return None
+        if self._total <= 0.0:
+            return self._items[self._random.randrange(len(self._items))]
+
+        threshold = self._random.random() * self._total
+        position = min(bisect_right(self._cumulative, threshold), len(self._cumulative) - 1)
+        return self._items[self._positiveIndices[position]]
+
+    def SampleUnique(self, count: int) -> List[SampledItem]:
+        """SampleUnique draws up to `count` distinct items in weighted order."""
+
+        if count <= 0 or not self._items:
+            return []
+
+        keyed = heapq.nsmallest(count, self.__BuildKeys())
+        chosen = [self._items[index] for _, index in keyed]
+        missing = count - len(chosen)
+        if missing > 0 and self._zeroIndices:
+            for index in self._random.sample(self._zeroIndices, min(missing, len(self._zeroIndices))):
+                chosen.append(self._items[index])
+        return chosen
+
+    def IterateUnique(self) -> Iterator[SampledItem]:
+        """IterateUnique lazily yields every item once, in weighted random order.
+
+        Useful when some draws may be rejected by the caller: keys are computed
+        once and each further item costs a single heap pop.
+        """
+
+        keyed = self.__BuildKeys()
+        heapq.heapify(keyed)
+        while keyed:
+            _, index = heapq.heappop(keyed)
+            yield self._items[index]
+
+        zeroIndices = list(self._zeroIndices)
+        self._random.shuffle(zeroIndices)
+        for index in zeroIndices:
+            yield self._items[index]
+
+    def __BuildKeys(self) -> List[Tuple[float, int]]:
+        # Efraimidis-Spirakis: the largest u ** (1 / w) wins; -log(u) / w is the same order, inverted.
+        randomValue = self._random.random
+        return [(-math.log(1.0 - randomValue()) * inverseWeight, index) for index, inverseWeight in zip(self._positiveIndices, self._inverseWeights)]
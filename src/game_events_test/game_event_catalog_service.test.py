@@ -0,0 +1,47 @@
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+import unittest
+
+projectRoot = Path(__file__).resolve().parents[2]
+if str(projectRoot) not in sys.path:
+    sys.path.append(str(projectRoot))
+
+from src.game_events.game_event_catalog_service import GameEventCatalogService
+from src.game_events.game_event_repository import GameEventRepository
+from src.game_events.jsonc_document_loader import JsoncDocumentLoader
+
+
+class GameEventCatalogServiceTestCase(unittest.TestCase):
+    def testReloadsOnlyWhenDefinitionFilesChange(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            definitionsDirectory = Path(directory)
+            raidPath = definitionsDirectory / "raid.jsonc"
+            self.__WriteDefinition(raidPath, "raid", ["danger"])
+            catalog = GameEventCatalogService(GameEventRepository(definitionsDirectory, JsoncDocumentLoader()))
+            sampler = catalog.GetSampler(["danger"])
+
+            self.assertFalse(catalog.ReloadIfChanged())
+            self.assertEqual(catalog.GetVersion(), 1)
+            self.assertIs(catalog.GetSampler(["danger"]), sampler)
+
+            self.__WriteDefinition(definitionsDirectory / "flu.jsonc", "flu", ["danger"])
+            self.assertTrue(catalog.ReloadIfChanged())
+            self.assertEqual(catalog.GetVersion(), 2)
+            self.assertEqual(sorted(definition.eventId for definition in catalog.GetSampler(["danger"]).IterateUnique()), ["flu", "raid"])
+
+            stat = raidPath.stat()
+            self.__WriteDefinition(raidPath, "raid", ["calm"])
+            os.utime(raidPath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            self.assertTrue(catalog.ReloadIfChanged())
+            self.assertEqual([definition.eventId for definition in catalog.GetByTags(["calm"])], ["raid"])
+
+    def __WriteDefinition(self, filePath: Path, eventId: str, tags: list) -> None:
+        document = {"id": eventId, "label": eventId, "cost": 10, "probability": 1.0, "tags": tags, "requests": []}
+        filePath.write_text(json.dumps(document), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import unittest
+
+projectRoot = Path(__file__).resolve().parents[2]
+if str(projectRoot) not in sys.path:
+    sys.path.append(str(projectRoot))
+
+from src.game_events.game_event_definition import GameEventDefinition
+from src.game_events.game_event_executor import GameEventExecutor
+from src.window.async_event_loop_thread import AsyncEventLoopThread
+from src.window.rest_api_client import RestApiClient
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    receivedBodies = []
+
+    def log_message(self, format: str, *args: object) -> None:
+        return
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length", "0") or 0)
+        raw = self.rfile.read(length) if length > 0 else b""
+        StandInHandler.receivedBodies.append((self.path, json.loads(raw) if raw else None))
+        if self.path.startswith("/api/slow"):
+            time.sleep(0.5)
+
+        body = json.dumps({"success": True}).encode("utf-8")
+        try:
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except OSError:
+            return
+
+
+class GameEventExecutorTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        StandInHandler.receivedBodies = []
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+        self._port = int(self._server.server_address[1])
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        self._eventLoop = AsyncEventLoopThread()
+        self._executor = GameEventExecutor(RestApiClient(), self._eventLoop)
+
+    def tearDown(self) -> None:
+        self._executor.Close()
+        self._eventLoop.Stop()
+        self._server.shutdown()
+        self._server.server_close()
+
+    def testExecuteRunsEveryRequest(self) -> None:
+        definition = GameEventDefinition.FromJson(
+            {
+                "id": "drop_pod_and_letter",
+                "requests": [
+                    {"method": "POST", "path": "/api/things/spawn", "body": {"defName": "Steel", "amount": 50}},
+                    {"method": "POST", "path": "/api/incidents/execute", "payload": "query", "query": {"defName": "Eclipse"}},
+                ],
+            }
+        )
+        results = self._executor.Execute("127.0.0.1", self._port, definition)
+        self.assertEqual(results, ["success: True", "success: True"])
+        self.assertEqual(StandInHandler.receivedBodies[0], ("/api/things/spawn", {"defName": "Steel", "amount": 50}))
+        self.assertEqual(StandInHandler.receivedBodies[1][0], "/api/incidents/execute?defName=Eclipse")
+
+    def testTypedBodiesArriveIntact(self) -> None:
+        body = {"mapId": "{mapId}", "amount": 50, "silent": False, "scale": 1.5, "name": "007", "cells": [[1, 2], [3, 4]], "options": {"forced": True}}
+        definition = GameEventDefinition.FromJson(
+            {"id": "typed", "requests": [{"method": "POST", "path": "/api/maps/{mapId}/spawn", "body": dict(body, mapId=0)}]}
+        )
+        request = definition.requests[0]
+        self.assertIs(request.GetEncoded(), request.GetEncoded())
+
+        self._executor.Execute("127.0.0.1", self._port, definition)
+        self._executor.Execute("127.0.0.1", self._port, definition)
+
+        expected = dict(body)
+        del expected["mapId"]
+        self.assertEqual(StandInHandler.receivedBodies, [("/api/maps/0/spawn", expected)] * 2)
+
+    def testPerRequestTimeout(self) -> None:
+        definition = GameEventDefinition.FromJson({"id": "slow", "requests": [{"method": "POST", "path": "/api/slow", "body": {}, "timeoutSeconds": 0.1}]})
+        detailed = self._executor.ExecuteDetailed("127.0.0.1", self._port, definition)
+        self.assertFalse(detailed[0]["ok"])
+        self.assertEqual(detailed[0]["error"], "timed out")
+
+    def testSubmittedExecutionsShareOneLoop(self) -> None:
+        definition = GameEventDefinition.FromJson({"id": "slow", "requests": [{"method": "POST", "path": "/api/slow", "body": {}}]})
+        started = time.monotonic()
+        futures = [self._executor.Submit("127.0.0.1", self._port, definition) for _ in range(4)]
+        results = [future.result(timeout=5) for future in futures]
+        self.assertEqual(results, [["success: True"]] * 4)
+        self.assertLess(time.monotonic() - started, 1.5)
+
+    def testGroupedRequestsRunConcurrently(self) -> None:
+        definition = GameEventDefinition.FromJson(
+            {
+                "id": "pod_letter_weather",
+                "requests": [
+                    {"method": "POST", "path": "/api/slow/pod", "body": {}, "group": "spawn"},
+                    {"method": "POST", "path": "/api/slow/weather", "body": {}, "group": "spawn"},
+                    {"method": "POST", "path": "/api/letter", "body": {}},
+                ],
+            }
+        )
+        self.assertEqual(definition.GetRequestDependencies(), [[], [], [0, 1]])
+
+        started = time.monotonic()
+        detailed = self._executor.ExecuteDetailed("127.0.0.1", self._port, definition)
+        elapsed = time.monotonic() - started
+
+        self.assertLess(elapsed, 0.9)
+        self.assertEqual([item["index"] for item in detailed], [0, 1, 2])
+        self.assertEqual(detailed[2]["after"], [0, 1])
+        self.assertGreaterEqual(float(detailed[2]["startedMs"]), 400.0)
+        self.assertEqual(StandInHandler.receivedBodies[-1][0], "/api/letter")
+
+    def testUnannotatedRequestsStaySequential(self) -> None:
+        definition = GameEventDefinition.FromJson(
+            {"id": "two_slow", "requests": [{"method": "POST", "path": "/api/slow/a", "body": {}}, {"method": "POST", "path": "/api/slow/b", "body": {}}]}
+        )
+        self.assertEqual(definition.GetRequestDependencies(), [[], [0]])
+        detailed = self._executor.ExecuteDetailed("127.0.0.1", self._port, definition)
+        self.assertGreaterEqual(float(detailed[1]["startedMs"]), 400.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
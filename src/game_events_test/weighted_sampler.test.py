@@ -0,0 +1,47 @@
+import random
+import sys
+from pathlib import Path
+import unittest
+
+projectRoot = Path(__file__).resolve().parents[2]
+if str(projectRoot) not in sys.path:
+    sys.path.append(str(projectRoot))
+
+from src.game_events.weighted_sampler import WeightedSampler
+
+
+class WeightedSamplerTestCase(unittest.TestCase):
+    def testSampleUniqueReturnsDistinctItems(self) -> None:
+        items = [f"event_{index}" for index in range(50)]
+        sampler = WeightedSampler(items, [1.0 + index for index in range(50)], randomSource=random.Random(7))
+        chosen = sampler.SampleUnique(4)
+        self.assertEqual(len(chosen), 4)
+        self.assertEqual(len(set(chosen)), 4)
+
+    def testSeededSamplersAreReproducible(self) -> None:
+        items = ["a", "b", "c", "d", "e", "f"]
+        weights = [5.0, 1.0, 1.0, 3.0, 0.5, 2.0]
+        first = WeightedSampler(items, weights, randomSource=random.Random(42)).SampleUnique(3)
+        second = WeightedSampler(items, weights, randomSource=random.Random(42)).SampleUnique(3)
+        self.assertEqual(first, second)
+
+    def testZeroWeightsOnlyFillAfterPositiveItems(self) -> None:
+        sampler = WeightedSampler(["zero_a", "heavy", "zero_b"], [0.0, 2.0, 0.0], randomSource=random.Random(1))
+        chosen = sampler.SampleUnique(3)
+        self.assertEqual(chosen[0], "heavy")
+        self.assertEqual(set(chosen), {"zero_a", "heavy", "zero_b"})
+        self.assertEqual(list(sampler.IterateUnique())[0], "heavy")
+
+    def testPickOneFollowsWeights(self) -> None:
+        sampler = WeightedSampler(["rare", "common"], [1.0, 9.0], randomSource=random.Random(3))
+        picks = [sampler.PickOne() for _ in range(2000)]
+        self.assertGreater(picks.count("common"), picks.count("rare") * 5)
+
+    def testAllZeroWeightsPickUniformly(self) -> None:
+        sampler = WeightedSampler(["a", "b"], [0.0, 0.0], randomSource=random.Random(5))
+        self.assertIn(sampler.PickOne(), ["a", "b"])
+        self.assertIsNone(WeightedSampler([], []).PickOne())
+
+
+if __name__ == "__main__":
+    unittest.main()
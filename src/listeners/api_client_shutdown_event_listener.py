@@ -0,0 +1,54 @@
+from src.core.events.event_bus import EventBus
+from src.events.app_exit_event import AppExitEvent
+from src.game_events.game_event_executor import GameEventExecutor
+from src.window.async_event_loop_thread import AsyncEventLoopThread
+from src.window.rest_api_client import RestApiClient
+
+
+class ApiClientShutdownEventListener:
+    """Close the RimAPI connections and stop the shared event loop on exit.
+
+    Register it after every other exit listener so their last requests still
+    have a loop and connections to use.
+
+    Args:
+        eventBus (EventBus): shared event bus.
+        eventExecutor (GameEventExecutor): executor whose async connections run on the loop.
+        eventLoop (AsyncEventLoopThread): loop shared by the executor.
+        apiClient (RestApiClient): client owning the blocking connection pool.
+    """
+
+    def __init__(self, eventBus: EventBus, eventExecutor: GameEventExecutor, eventLoop: AsyncEventLoopThread, apiClient: RestApiClient) -> None:
+        self.eventBus = eventBus  # shared bus
+        self.eventExecutor = eventExecutor  # closes the async connections on the loop
+        self.eventLoop = eventLoop  # stopped once nothing is scheduled on it
+        self.apiClient = apiClient  # closes the blocking connection pool last
+
+    def Register(self) -> None:
+        """Subscribe to app exit.
+
+        Returns:
+            None
+        """
+
+        self.eventBus.Subscribe(AppExitEvent, self.OnAppExit)
+
+    def OnAppExit(self, event: AppExitEvent) -> None:
+        """Close the async connections, stop the loop, then close the blocking pool.
+
+        Args:
+            event (AppExitEvent): exit event payload.
+
+        Returns:
+            None
+        """
+
+        self.eventExecutor.Close()
+        try:
+            self.eventLoop.Stop()
+        except Exception as error:
+            print(f"ApiClientShutdownEventListener: Failed to stop the event loop: {error}")
+        try:
+            self.apiClient.Close()
+        except Exception as error:
+            print(f"ApiClientShutdownEventListener: Failed to close connections: {error}")
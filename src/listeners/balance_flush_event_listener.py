@@ -0,0 +1,56 @@
+from src.events.app_exit_event import AppExitEvent
+from src.events.app_started_event import AppStartedEvent
+from src.core.events.event_bus import EventBus
+from src.purchases.balance_service import BalanceService
+from src.purchases.silver_earning_service import SilverEarningService
+
+
+class BalanceFlushEventListener:
+    """Run the balance flusher and the silver award batcher with the application lifecycle.
+
+    Args:
+        eventBus (EventBus): shared event bus.
+        balanceService (BalanceService): balances with the background flusher.
+        silverEarningService (SilverEarningService): batches chat and vote awards.
+    """
+
+    def __init__(self, eventBus: EventBus, balanceService: BalanceService, silverEarningService: SilverEarningService) -> None:
+        self.eventBus = eventBus  # shared bus
+        self.balanceService = balanceService  # flushes changed accounts in the background
+        self.silverEarningService = silverEarningService  # applies pending awards every few hundred ms
+
+    def Register(self) -> None:
+        """Subscribe to app lifecycle events.
+
+        Returns:
+            None
+        """
+
+        self.eventBus.Subscribe(AppStartedEvent, self.OnAppStarted)
+        self.eventBus.Subscribe(AppExitEvent, self.OnAppExit)
+
+    def OnAppStarted(self, event: AppStartedEvent) -> None:
+        """Start batching awards and flushing changed balances in the background.
+
+        Args:
+            event (AppStartedEvent): startup event payload.
+
+        Returns:
+            None
+        """
+
+        self.balanceService.Start()
+        self.silverEarningService.Start()
+
+    def OnAppExit(self, event: AppExitEvent) -> None:
+        """Apply pending awards, then stop the flusher and persist every pending change.
+
+        Args:
+            event (AppExitEvent): exit event payload.
+
+        Returns:
+            None
+        """
+
+        self.silverEarningService.Stop()
+        self.balanceService.Stop()
@@ -0,0 +1,56 @@
+from src.events.app_exit_event import AppExitEvent
+from src.events.app_started_event import AppStartedEvent
+from src.core.events.event_bus import EventBus
+from src.rimapi.game_clock_service import GameClockService
+from src.rimapi.game_state_service import GameStateService
+
+
+class GameStateEventListener:
+    """Start and stop the shared RimAPI game-state poller with the application lifecycle.
+
+    Args:
+        eventBus (EventBus): shared event bus.
+        gameStateService (GameStateService): shared state poller.
+        gameClockService (GameClockService): local game tick estimator.
+    """
+
+    def __init__(self, eventBus: EventBus, gameStateService: GameStateService, gameClockService: GameClockService) -> None:
+        self.eventBus = eventBus  # shared bus
+        self.gameStateService = gameStateService  # shared poller
+        self.gameClockService = gameClockService  # tick estimator fed by the poller
+
+    def Register(self) -> None:
+        """Subscribe to app lifecycle events.
+
+        Returns:
+            None
+        """
+
+        self.eventBus.Subscribe(AppStartedEvent, self.OnAppStarted)
+        self.eventBus.Subscribe(AppExitEvent, self.OnAppExit)
+
+    def OnAppStarted(self, event: AppStartedEvent) -> None:
+        """Start the poller and begin sampling the game clock.
+
+        Args:
+            event (AppStartedEvent): startup event payload.
+
+        Returns:
+            None
+        """
+
+        self.gameStateService.Start()
+        self.gameClockService.Start()
+
+    def OnAppExit(self, event: AppExitEvent) -> None:
+        """Stop polling on application exit.
+
+        Args:
+            event (AppExitEvent): exit event payload.
+
+        Returns:
+            None
+        """
+
+        self.gameClockService.Stop()
+        self.gameStateService.Stop()
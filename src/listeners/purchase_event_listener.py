@@ -1,5 +1,6 @@
 from src.events.chat_message_event import ChatMessageEvent
 from src.events.chat_command_response_event import ChatCommandResponseEvent
+from src.events.poll_started_event import PollStartedEvent
 from src.core.events.event_bus import EventBus
 from src.purchases.interfaces.balance_service_interface import BalanceServiceInterface
 from src.purchases.interfaces.chat_command_handler_interface import ChatCommandHandlerInterface
@@ -20,11 +21,12 @@ class PurchaseEventListener:
         self._balanceService = balanceService
         self._silverEarningService = silverEarningService
         self._chatCommandHandler = chatCommandHandler
-        self._processedVoters: set = set()
+        self._processedVoters: set = set()  # users rewarded for voting in the current poll round
 
     def Register(self) -> None:
-        """Register for chat message events."""
+        """Register for chat message and poll round events."""
         self._eventBus.Subscribe(ChatMessageEvent, self._OnChatMessage)
+        self._eventBus.Subscribe(PollStartedEvent, self._OnPollStarted)
 
     def _OnChatMessage(self, event: ChatMessageEvent) -> None:
         """Handle incoming chat messages - award silver and process commands."""
@@ -49,6 +51,10 @@ class PurchaseEventListener:
             except Exception as error:
                 print(f"PurchaseEventListener: Failed to publish command response: {error}")
 
+    def _OnPollStarted(self, event: PollStartedEvent) -> None:
+        """Handle a new poll round - everyone may earn the vote reward again."""
+        self.ResetVoterTracking()
+
     def _IsVoteMessage(self, content: str) -> bool:
         """Check if message is a poll vote (single digit 1-4)."""
         trimmed = content.strip()
@@ -0,0 +1,66 @@
+from pathlib import Path
+
+from src.core.events.event_bus import EventBus
+from src.events.app_exit_event import AppExitEvent
+from src.events.settings_updated_event import SettingsUpdatedEvent
+from src.window.request_tracer import RequestTracer
+
+
+class RequestTraceEventListener:
+    """Turn RimAPI request tracing on from settings and write the trace on exit.
+
+    Tracing follows the `requestTracingEnabled` setting in settings.json. When
+    it is on, the per-route timing histograms and the recent requests are
+    written to `dumpPath` as the app closes.
+
+    Args:
+        eventBus (EventBus): shared event bus.
+        tracer (RequestTracer): tracer shared by the RimAPI clients.
+        dumpPath (Path): JSON file the trace is written to.
+    """
+
+    def __init__(self, eventBus: EventBus, tracer: RequestTracer, dumpPath: Path) -> None:
+        self.eventBus = eventBus  # shared bus
+        self.tracer = tracer  # records request phase timings while enabled
+        self.dumpPath = dumpPath  # where the trace lands on exit
+
+    def Register(self) -> None:
+        """Subscribe to settings updates and app exit.
+
+        Returns:
+            None
+        """
+
+        self.eventBus.Subscribe(SettingsUpdatedEvent, self.OnSettingsUpdated)
+        self.eventBus.Subscribe(AppExitEvent, self.OnAppExit)
+
+    def OnSettingsUpdated(self, event: SettingsUpdatedEvent) -> None:
+        """Enable or disable tracing to match the settings.
+
+        Args:
+            event (SettingsUpdatedEvent): updated settings payload.
+
+        Returns:
+            None
+        """
+
+        self.tracer.SetEnabled(bool(getattr(event.settings, "requestTracingEnabled", False)))
+
+    def OnAppExit(self, event: AppExitEvent) -> None:
+        """Write the collected trace if tracing was on.
+
+        Args:
+            event (AppExitEvent): exit event payload.
+
+        Returns:
+            None
+        """
+
+        if not self.tracer.IsEnabled():
+            return
+        try:
+            self.dumpPath.parent.mkdir(parents=True, exist_ok=True)
+            self.tracer.WriteJson(self.dumpPath)
+            print(f"RequestTraceEventListener: Wrote request trace to {self.dumpPath}")
+        except Exception as error:
+            print(f"RequestTraceEventListener: Failed to write request trace: {error}")
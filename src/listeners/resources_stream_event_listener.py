@@ -0,0 +1,72 @@
+from src.events.app_exit_event import AppExitEvent
+from src.events.app_started_event import AppStartedEvent
+from src.core.events.event_bus import EventBus
+from src.events.settings_updated_event import SettingsUpdatedEvent
+from src.rimapi.resources_stream_service import ResourcesStreamService
+
+
+class ResourcesStreamEventListener:
+    """Start and stop the RimAPI resources stream with the application lifecycle.
+
+    Args:
+        eventBus (EventBus): shared event bus.
+        streamService (ResourcesStreamService): resource snapshot stream.
+    """
+
+    def __init__(self, eventBus: EventBus, streamService: ResourcesStreamService) -> None:
+        self.eventBus = eventBus  # shared bus
+        self.streamService = streamService  # resources SSE consumer
+        self.endpoint = None  # (rimApiHost, rimApiPort) from the last settings update
+
+    def Register(self) -> None:
+        """Subscribe to app lifecycle and settings events.
+
+        Returns:
+            None
+        """
+
+        self.eventBus.Subscribe(AppStartedEvent, self.OnAppStarted)
+        self.eventBus.Subscribe(AppExitEvent, self.OnAppExit)
+        self.eventBus.Subscribe(SettingsUpdatedEvent, self.OnSettingsUpdated)
+
+    def OnAppStarted(self, event: AppStartedEvent) -> None:
+        """Open the resources stream when the application starts.
+
+        Args:
+            event (AppStartedEvent): startup event payload.
+
+        Returns:
+            None
+        """
+
+        self.streamService.Start()
+
+    def OnSettingsUpdated(self, event: SettingsUpdatedEvent) -> None:
+        """Reconnect when the RimAPI host or port changed; other settings leave the stream alone.
+
+        Args:
+            event (SettingsUpdatedEvent): updated settings payload.
+
+        Returns:
+            None
+        """
+
+        endpoint = (getattr(event.settings, "rimApiHost", None), getattr(event.settings, "rimApiPort", None))
+        previous = self.endpoint
+        self.endpoint = endpoint
+        if previous is None or previous == endpoint:
+            return
+        if self.streamService.IsRunning():
+            self.streamService.Restart()
+
+    def OnAppExit(self, event: AppExitEvent) -> None:
+        """Close the resources stream on application exit.
+
+        Args:
+            event (AppExitEvent): exit event payload.
+
+        Returns:
+            None
+        """
+
+        self.streamService.Stop()
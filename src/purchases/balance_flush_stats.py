@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class BalanceFlushStats:
+    """BalanceFlushStats reports the balance flusher's backlog and timings."""
+
+    pendingUsers: int  # accounts changed since the last successful flush
+    pendingChanges: int  # individual changes behind those accounts
+    flushCount: int
+    failedFlushCount: int
+    lastFlushUsers: int
+    lastFlushSeconds: float
+    maxFlushSeconds: float
+    lastFlushAt: Optional[float]  # time.time() of the last successful flush
+    lastError: Optional[str]
@@ -0,0 +1,248 @@
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import BinaryIO, Dict, Literal, Optional, Tuple
+
+from src.purchases.interfaces.balance_repository_interface import BalanceRepositoryInterface
+
+
+FsyncPolicy = Literal["always", "interval", "never"]
+
+
+class BalanceLedgerRepository(BalanceRepositoryInterface):
+    """Append-only balance storage: a snapshot plus a ledger of deltas.
+
+    Every change is one JSON line (`seq`, user, delta, reason, timestamp)
+    appended to `<name>.ledger`; nothing rewrites the whole file per purchase.
+    Lines reach the OS on every append and are fsynced according to
+    `fsyncPolicy` ("always", at most every `fsyncIntervalSeconds`, or "never").
+
+    After `compactEvery` entries the ledger is rotated aside and a snapshot
+    (`{"version", "sequence", "balances"}`) is written on a background thread
+    via temp file + atomic rename. Startup loads the snapshot and replays any
+    ledger entries with a higher sequence, ignoring a torn last line. A legacy
+    plain `{username: balance}` file is read as a snapshot at sequence 0.
+    """
+
+    SnapshotVersion = 1
+
+    def __init__(
+        self,
+        filePath: Path,
+        fsyncPolicy: FsyncPolicy = "interval",
+        fsyncIntervalSeconds: float = 1.0,
+        compactEvery: int = 10000,
+    ) -> None:
+        self._filePath = filePath
+        self._ledgerPath = filePath.with_name(filePath.name + ".ledger")
+        self._rotatedLedgerPath = filePath.with_name(filePath.name + ".ledger.compacting")
+        self._fsyncPolicy = fsyncPolicy
+        self._fsyncIntervalSeconds = max(0.0, float(fsyncIntervalSeconds))
+        self._compactEvery = max(1, int(compactEvery))
+
+        self._lock = threading.Lock()
+        self._snapshotLock = threading.Lock()  # one rotate + snapshot write at a time; taken before _lock
+        self._balances: Dict[str, int] = {}
+        self._sequence = 0
+        self._entriesSinceSnapshot = 0
+        self._ledger: Optional[BinaryIO] = None
+        self._lastFsyncAt = 0.0
+        self._compactionThread: Optional[threading.Thread] = None
+
+    def Load(self) -> Dict[str, int]:
+        """Load the snapshot and replay the ledger on top of it.
+
+        Returns:
+            Dict[str, int]: Mapping of username to silver balance.
+        """
+        with self._lock:
+            balances, sequence = self.__ReadSnapshot()
+            replayed = 0
+            for path in (self._rotatedLedgerPath, self._ledgerPath):
+                count, sequence = self.__Replay(path, balances, sequence)
+                replayed += count
+
+            self._balances = balances
+            self._sequence = sequence
+            self._entriesSinceSnapshot = replayed
+            return dict(balances)
+
+    def Save(self, balances: Dict[str, int]) -> None:
+        """Replace all balances with a fresh snapshot and an empty ledger.
+
+        Args:
+            balances: Mapping of username to silver balance.
+        """
+        with self._snapshotLock:
+            with self._lock:
+                self._balances = {str(username): int(balance) for username, balance in balances.items()}
+                snapshot, sequence = self.__RotateLedger()
+            self.__WriteSnapshot(snapshot, sequence)
+
+    def RecordDelta(self, username: str, delta: int, reason: str) -> bool:
+        if delta == 0:
+            return True
+
+        try:
+            with self._lock:
+                self._sequence += 1
+                entry = {"seq": self._sequence, "user": username, "delta": int(delta), "reason": reason, "at": round(time.time(), 3)}
+                ledger = self.__GetLedger()
+                ledger.write(json.dumps(entry, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n")
+                ledger.flush()
+                self.__MaybeFsync(ledger)
+
+                self._balances[username] = self._balances.get(username, 0) + int(delta)
+                self._entriesSinceSnapshot += 1
+                shouldCompact = self._entriesSinceSnapshot >= self._compactEvery and self._compactionThread is None
+                if shouldCompact:
+                    self._compactionThread = threading.Thread(target=self.Compact, name="BalanceLedgerCompaction", daemon=True)
+                    self._compactionThread.start()
+            return True
+        except Exception as error:
+            print(f"BalanceLedgerRepository: Failed to append ledger entry: {error}")
+            return False
+
+    def Flush(self) -> None:
+        with self._lock:
+            ledger = self._ledger
+            if ledger is None:
+                return
+            try:
+                ledger.flush()
+                os.fsync(ledger.fileno())
+                self._lastFsyncAt = time.monotonic()
+            except Exception as error:
+                print(f"BalanceLedgerRepository: Failed to flush ledger: {error}")
+
+    def Compact(self) -> None:
+        """Write a snapshot of the current balances and drop the replayed ledger."""
+        try:
+            with self._snapshotLock:
+                with self._lock:
+                    snapshot, sequence = self.__RotateLedger()
+                self.__WriteSnapshot(snapshot, sequence)
+        except Exception as error:
+            print(f"BalanceLedgerRepository: Failed to compact ledger: {error}")
+        finally:
+            with self._lock:
+                if self._compactionThread is threading.current_thread():
+                    self._compactionThread = None
+
+    def Close(self) -> None:
+        self.Flush()
+        with self._lock:
+            ledger = self._ledger
+            self._ledger = None
+        if ledger is not None:
+            try:
+                ledger.close()
+            except Exception:
+                pass
+
+    def __RotateLedger(self) -> Tuple[Dict[str, int], int]:
+        # Called under the lock: entries after this point go to a fresh ledger,
+        # the rotated one stays replayable until the snapshot covering it lands.
+        ledger = self._ledger
+        self._ledger = None
+        if ledger is not None:
+            ledger.flush()
+            os.fsync(ledger.fileno())
+            ledger.close()
+        if self._ledgerPath.exists():
+            if self._rotatedLedgerPath.exists():
+                # A previous compaction died before its snapshot landed; keep both.
+                with self._rotatedLedgerPath.open("ab") as rotated:
+                    rotated.write(self._ledgerPath.read_bytes())
+                self._ledgerPath.unlink()
+            else:
+                os.replace(self._ledgerPath, self._rotatedLedgerPath)
+        self._entriesSinceSnapshot = 0
+        return dict(self._balances), self._sequence
+
+    def __WriteSnapshot(self, balances: Dict[str, int], sequence: int) -> None:
+        self._filePath.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"version": self.SnapshotVersion, "sequence": sequence, "balances": balances}
+        temporaryPath = self._filePath.with_name(self._filePath.name + ".tmp")
+        with temporaryPath.open("wb") as handle:
+            handle.write(json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temporaryPath, self._filePath)
+        try:
+            self._rotatedLedgerPath.unlink()
+        except FileNotFoundError:
+            pass
+
+    def __ReadSnapshot(self) -> Tuple[Dict[str, int], int]:
+        if not self._filePath.exists():
+            return {}, 0
+        try:
+            parsed = json.loads(self._filePath.read_text(encoding="utf-8"))
+        except Exception as error:
+            print(f"BalanceLedgerRepository: Failed to load snapshot: {error}")
+            return {}, 0
+        if not isinstance(parsed, dict):
+            return {}, 0
+
+        sequence = 0
+        rawBalances: object = parsed
+        if parsed.get("version") == self.SnapshotVersion and isinstance(parsed.get("balances"), dict):
+            rawBalances = parsed["balances"]
+            try:
+                sequence = int(parsed.get("sequence") or 0)
+            except (TypeError, ValueError):
+                sequence = 0
+
+        balances: Dict[str, int] = {}
+        for username, balance in rawBalances.items():
+            if isinstance(username, str) and username.strip():
+                try:
+                    balances[username.strip().lower()] = int(balance)
+                except (TypeError, ValueError):
+                    balances[username.strip().lower()] = 0
+        return balances, sequence
+
+    def __Replay(self, path: Path, balances: Dict[str, int], sequence: int) -> Tuple[int, int]:
+        if not path.exists():
+            return 0, sequence
+
+        content = path.read_bytes()
+        complete = content.rfind(b"\n") + 1
+        if complete < len(content):
+            # A crash tore the last append; drop the partial line so new entries start clean.
+            print(f"BalanceLedgerRepository: Dropping torn ledger tail in {path.name}")
+            with path.open("r+b") as handle:
+                handle.truncate(complete)
+
+        replayed = 0
+        for line in content[:complete].splitlines():
+            try:
+                entry = json.loads(line)
+                entrySequence = int(entry["seq"])
+                username = str(entry["user"])
+                delta = int(entry["delta"])
+            except Exception:
+                continue
+            if entrySequence <= sequence:
+                continue
+            balances[username] = balances.get(username, 0) + delta
+            sequence = entrySequence
+            replayed += 1
+        return replayed, sequence
+
+    def __GetLedger(self) -> BinaryIO:
+        if self._ledger is None:
+            self._ledgerPath.parent.mkdir(parents=True, exist_ok=True)
+            self._ledger = self._ledgerPath.open("ab")
+        return self._ledger
+
+    def __MaybeFsync(self, ledger: BinaryIO) -> None:
+        if self._fsyncPolicy == "never":
+            return
+        now = time.monotonic()
+        if self._fsyncPolicy == "always" or now - self._lastFsyncAt >= self._fsyncIntervalSeconds:
+            os.fsync(ledger.fileno())
+            self._lastFsyncAt = now
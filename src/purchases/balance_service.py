@@ -1,20 +1,77 @@
-from typing import Dict
+import itertools
+import threading
+import time
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Set, Tuple
 
+from src.purchases.balance_flush_stats import BalanceFlushStats
 from src.purchases.interfaces.balance_repository_interface import BalanceRepositoryInterface
 from src.purchases.interfaces.balance_service_interface import BalanceServiceInterface
 
 
 class BalanceService(BalanceServiceInterface):
-    """In-memory balance management with periodic persistence."""
+    """In-memory balance management with periodic persistence.
 
-    def __init__(self, repository: BalanceRepositoryInterface) -> None:
+    Each change is offered to the repository as a delta first; repositories
+    that journal deltas (see `BalanceLedgerRepository`) make it durable
+    right away, the others get a `Save` on the next `Persist`. Changed users
+    are tracked individually, and between `Start` and `Stop` a background
+    flusher persists them every `flushIntervalSeconds`, or sooner once
+    `flushAfterChanges` changes are waiting.
+
+    Balance operations are atomic per user: each username hashes to one of
+    `lockStripes` locks, so chat earnings, purchases and refunds for the
+    same user serialize while different users proceed in parallel. Readers
+    get an immutable snapshot that is rebuilt only after balances changed.
+
+    With a lookup repository (`SupportsLookup`, e.g. SQLite) nothing is
+    loaded at startup; `_balances` only caches users seen this session and
+    listings are paged from the repository.
+    """
+
+    def __init__(
+        self,
+        repository: BalanceRepositoryInterface,
+        flushIntervalSeconds: float = 5.0,
+        flushAfterChanges: int = 200,
+        lockStripes: int = 16,
+    ) -> None:
         self._repository = repository
         self._balances: Dict[str, int] = {}
-        self._dirty = False
+        self._stripes = [threading.Lock() for _ in range(max(1, int(lockStripes)))]
+        self._versionCounter = itertools.count(1)
+        self._version = 0
+        self._snapshotLock = threading.Lock()
+        self._snapshotVersion = -1
+        self._snapshot: Mapping[str, int] = MappingProxyType({})
+        self._sortedSnapshot: Tuple[Tuple[str, int], ...] = ()
+        self._sortedSnapshotVersion = -1
+        self._lazy = bool(getattr(repository, "SupportsLookup", False))
+        self._flushIntervalSeconds = max(0.05, float(flushIntervalSeconds))
+        self._flushAfterChanges = max(1, int(flushAfterChanges))
+
+        self._dirtyUsers: Set[str] = set()
+        self._unsavedUsers: Set[str] = set()  # subset the repository did not journal; needs `Save`
+        self._pendingChanges = 0
+        self._dirtyLock = threading.Lock()  # guards the dirty sets; never held during I/O
+        self._flushLock = threading.Lock()  # one flush at a time
+        self._wakeEvent = threading.Event()
+        self._stopEvent: Optional[threading.Event] = None
+        self._flusherThread: Optional[threading.Thread] = None
+
+        self._flushCount = 0
+        self._failedFlushCount = 0
+        self._lastFlushUsers = 0
+        self._lastFlushSeconds = 0.0
+        self._maxFlushSeconds = 0.0
+        self._lastFlushAt: Optional[float] = None
+        self._lastError: Optional[str] = None
         self._LoadFromStorage()
 
     def _LoadFromStorage(self) -> None:
         """Load balances from persistent storage into memory."""
+        if self._lazy:
+            return
         try:
             self._balances = self._repository.Load()
         except Exception as error:
@@ -31,14 +88,16 @@ class BalanceService(BalanceServiceInterface):
             int: Current silver balance.
         """
         normalizedUsername = self._NormalizeUsername(username)
-        return self._balances.get(normalizedUsername, 0)
+        with self._LockFor(normalizedUsername):
+            return self._GetStoredBalance(normalizedUsername)
 
-    def AddSilver(self, username: str, amount: int) -> int:
+    def AddSilver(self, username: str, amount: int, reason: str = "earn") -> int:
         """Add silver to a user's balance.
 
         Args:
             username: The chat username.
             amount: Amount of silver to add.
+            reason: Ledger reason, e.g. "chat", "vote", "refund".
 
         Returns:
             int: New balance after addition.
@@ -47,53 +106,290 @@ class BalanceService(BalanceServiceInterface):
             return self.GetBalance(username)
 
         normalizedUsername = self._NormalizeUsername(username)
-        currentBalance = self._balances.get(normalizedUsername, 0)
-        newBalance = currentBalance + amount
-        self._balances[normalizedUsername] = newBalance
-        self._dirty = True
+        with self._LockFor(normalizedUsername):
+            newBalance = self._GetStoredBalance(normalizedUsername) + amount
+            self._balances[normalizedUsername] = newBalance
+            self._RecordChange(normalizedUsername, amount, reason)
         return newBalance
 
-    def DeductSilver(self, username: str, amount: int) -> bool:
+    def AddSilverBatch(self, amountsByUser: Mapping[str, int], reason: str = "earn") -> None:
+        """Add silver to many users at once.
+
+        Each stripe lock is taken once for all of its users and the batch is
+        marked dirty in one step.
+
+        Args:
+            amountsByUser: Mapping of chat username to amount of silver to add.
+            reason: Ledger reason, e.g. "chat", "vote".
+        """
+        byStripe: Dict[int, Dict[str, int]] = {}
+        for username, amount in amountsByUser.items():
+            if amount <= 0:
+                continue
+            normalizedUsername = self._NormalizeUsername(username)
+            stripeAwards = byStripe.setdefault(hash(normalizedUsername) % len(self._stripes), {})
+            stripeAwards[normalizedUsername] = stripeAwards.get(normalizedUsername, 0) + int(amount)
+        if not byStripe:
+            return
+
+        changedUsers: List[str] = []
+        unsavedUsers: List[str] = []
+        for stripeIndex, stripeAwards in byStripe.items():
+            with self._stripes[stripeIndex]:
+                for normalizedUsername, amount in stripeAwards.items():
+                    self._balances[normalizedUsername] = self._GetStoredBalance(normalizedUsername) + amount
+                    changedUsers.append(normalizedUsername)
+                    if not self._JournalChange(normalizedUsername, amount, reason):
+                        unsavedUsers.append(normalizedUsername)
+        self._MarkDirty(changedUsers, unsavedUsers)
+
+    def DeductSilver(self, username: str, amount: int, reason: str = "purchase") -> bool:
         """Deduct silver from a user's balance if sufficient funds exist.
 
         Args:
             username: The chat username.
             amount: Amount of silver to deduct.
+            reason: Ledger reason, e.g. "purchase".
 
         Returns:
             bool: True if deduction succeeded, False if insufficient funds.
         """
-        if amount <= 0:
-            return True
+        deducted, _ = self.CompareAndDeduct(username, amount, reason)
+        return deducted
 
-        normalizedUsername = self._NormalizeUsername(username)
-        currentBalance = self._balances.get(normalizedUsername, 0)
+    def CompareAndDeduct(self, username: str, amount: int, reason: str = "purchase") -> Tuple[bool, int]:
+        """Atomically check that a user can afford `amount` and deduct it.
 
-        if currentBalance < amount:
-            return False
+        Args:
+            username: The chat username.
+            amount: Amount of silver to deduct.
+            reason: Ledger reason, e.g. "purchase".
+
+        Returns:
+            Tuple[bool, int]: Whether the deduction happened, and the balance
+            after it (or the unchanged balance that was too low).
+        """
+        normalizedUsername = self._NormalizeUsername(username)
+        with self._LockFor(normalizedUsername):
+            currentBalance = self._GetStoredBalance(normalizedUsername)
+            if amount <= 0:
+                return True, currentBalance
+            if currentBalance < amount:
+                return False, currentBalance
 
-        self._balances[normalizedUsername] = currentBalance - amount
-        self._dirty = True
-        return True
+            newBalance = currentBalance - amount
+            self._balances[normalizedUsername] = newBalance
+            self._RecordChange(normalizedUsername, -amount, reason)
+        return True, newBalance
 
     def Persist(self) -> None:
-        """Save current balances to persistent storage."""
-        if not self._dirty:
+        """Save changed balances to persistent storage."""
+        with self._flushLock:
+            with self._dirtyLock:
+                dirtyUsers = self._dirtyUsers
+                unsavedUsers = self._unsavedUsers
+                pendingChanges = self._pendingChanges
+                self._dirtyUsers = set()
+                self._unsavedUsers = set()
+                self._pendingChanges = 0
+            if not dirtyUsers:
+                return
+
+            startedAt = time.perf_counter()
+            try:
+                self._repository.Flush()
+                if unsavedUsers:
+                    if self._lazy:
+                        # Lookup repositories upsert: only the changed users are written.
+                        self._repository.Save({username: self._balances.get(username, 0) for username in unsavedUsers})
+                    else:
+                        self._repository.Save(dict(self.GetAllBalances()))
+            except Exception as error:
+                print(f"BalanceService: Failed to persist balances: {error}")
+                with self._dirtyLock:
+                    self._dirtyUsers |= dirtyUsers
+                    self._unsavedUsers |= unsavedUsers
+                    self._pendingChanges += pendingChanges
+                self._failedFlushCount += 1
+                self._lastError = str(error)
+                return
+
+            elapsedSeconds = time.perf_counter() - startedAt
+            self._flushCount += 1
+            self._lastFlushUsers = len(dirtyUsers)
+            self._lastFlushSeconds = elapsedSeconds
+            self._maxFlushSeconds = max(self._maxFlushSeconds, elapsedSeconds)
+            self._lastFlushAt = time.time()
+            self._lastError = None
+
+    def Start(self) -> None:
+        """Start the background flusher."""
+        if self._flusherThread is not None:
             return
+        stopEvent = threading.Event()
+        self._stopEvent = stopEvent
+        self._flusherThread = threading.Thread(target=self._RunFlusher, args=(stopEvent,), name="BalanceFlusher", daemon=True)
+        self._flusherThread.start()
+
+    def Stop(self) -> None:
+        """Stop the background flusher and persist whatever is still pending."""
+        stopEvent = self._stopEvent
+        thread = self._flusherThread
+        self._stopEvent = None
+        self._flusherThread = None
+        if stopEvent is not None:
+            stopEvent.set()
+            self._wakeEvent.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5.0)
+        self.Persist()
+
+    def GetFlushStats(self) -> BalanceFlushStats:
+        """Get the flusher backlog and timing metrics.
+
+        Returns:
+            BalanceFlushStats: Pending users/changes and flush durations.
+        """
+        return BalanceFlushStats(
+            pendingUsers=len(self._dirtyUsers),
+            pendingChanges=self._pendingChanges,
+            flushCount=self._flushCount,
+            failedFlushCount=self._failedFlushCount,
+            lastFlushUsers=self._lastFlushUsers,
+            lastFlushSeconds=self._lastFlushSeconds,
+            maxFlushSeconds=self._maxFlushSeconds,
+            lastFlushAt=self._lastFlushAt,
+            lastError=self._lastError,
+        )
+
+    def GetAllBalances(self) -> Mapping[str, int]:
+        """Get a read-only snapshot of all user balances.
+
+        The snapshot is shared between callers and only rebuilt after a
+        balance changed, so repeated reads do not copy the map.
 
+        Returns:
+            Mapping[str, int]: Mapping of username to silver balance.
+        """
+        if self._lazy:
+            return MappingProxyType(self._repository.Load())
+
+        with self._snapshotLock:
+            return self._RefreshSnapshot()
+
+    def CountBalances(self) -> int:
+        """Count users with a balance.
+
+        Returns:
+            int: Number of users with a stored balance.
+        """
+        if self._lazy:
+            return self._repository.CountBalances()
+        return len(self._balances)
+
+    def GetBalancesPage(self, offset: int, limit: int) -> List[Tuple[str, int]]:
+        """Get one page of balances, highest first.
+
+        Args:
+            offset: Number of rows to skip.
+            limit: Maximum number of rows to return.
+
+        Returns:
+            List[Tuple[str, int]]: (username, balance) rows ordered by balance, then username.
+        """
+        if self._lazy:
+            return self._repository.GetBalancesPage(offset, limit)
+        rows = self._GetSortedSnapshot()
+        return list(rows[max(0, offset):max(0, offset) + max(0, limit)])
+
+    def GetTopBalances(self, limit: int) -> List[Tuple[str, int]]:
+        """Get the `limit` highest balances.
+
+        Args:
+            limit: Maximum number of rows to return.
+
+        Returns:
+            List[Tuple[str, int]]: (username, balance) rows, highest first.
+        """
+        return self.GetBalancesPage(0, limit)
+
+    def _GetSortedSnapshot(self) -> Tuple[Tuple[str, int], ...]:
+        """Get all balances ordered for listings, re-sorting only after changes."""
+        with self._snapshotLock:
+            snapshot = self._RefreshSnapshot()
+            if self._sortedSnapshotVersion != self._snapshotVersion:
+                self._sortedSnapshot = tuple(sorted(snapshot.items(), key=lambda item: (-item[1], item[0])))
+                self._sortedSnapshotVersion = self._snapshotVersion
+            return self._sortedSnapshot
+
+    def _RefreshSnapshot(self) -> Mapping[str, int]:
+        """Rebuild the shared snapshot if balances changed (caller holds `_snapshotLock`)."""
+        version = self._version
+        if self._snapshotVersion != version:
+            # Copying a str -> int dict is a single C-level operation, so
+            # writers on other stripes cannot tear it.
+            self._snapshot = MappingProxyType(dict(self._balances))
+            self._snapshotVersion = version
+        return self._snapshot
+
+    def _LockFor(self, normalizedUsername: str) -> threading.Lock:
+        """Get the stripe lock guarding a user's balance."""
+        return self._stripes[hash(normalizedUsername) % len(self._stripes)]
+
+    def _GetStoredBalance(self, normalizedUsername: str) -> int:
+        """Get a balance from memory, looking it up in the repository in lazy mode.
+
+        Callers hold the user's stripe lock.
+        """
+        balance = self._balances.get(normalizedUsername)
+        if balance is not None or not self._lazy:
+            return balance or 0
         try:
-            self._repository.Save(dict(self._balances))
-            self._dirty = False
+            balance = self._repository.LoadBalance(normalizedUsername) or 0
         except Exception as error:
-            print(f"BalanceService: Failed to persist balances: {error}")
+            print(f"BalanceService: Failed to look up balance: {error}")
+            return 0
+        self._balances[normalizedUsername] = balance
+        return balance
 
-    def GetAllBalances(self) -> Dict[str, int]:
-        """Get a copy of all user balances.
+    def _RecordChange(self, normalizedUsername: str, delta: int, reason: str) -> None:
+        """Journal a change and mark the user dirty for the next flush.
 
-        Returns:
-            Dict[str, int]: Mapping of username to silver balance.
+        Callers hold the user's stripe lock, so a user's deltas reach the
+        repository in the order they were applied.
         """
-        return dict(self._balances)
+        journaled = self._JournalChange(normalizedUsername, delta, reason)
+        self._MarkDirty([normalizedUsername], [] if journaled else [normalizedUsername])
+
+    def _JournalChange(self, normalizedUsername: str, delta: int, reason: str) -> bool:
+        """Offer a delta to the repository; True if it took the change over."""
+        try:
+            return self._repository.RecordDelta(normalizedUsername, delta, reason)
+        except Exception as error:
+            print(f"BalanceService: Failed to record balance change: {error}")
+            return False
+
+    def _MarkDirty(self, changedUsers: List[str], unsavedUsers: List[str]) -> None:
+        """Queue changed users for the flusher and invalidate the read snapshot."""
+        self._version = next(self._versionCounter)
+        with self._dirtyLock:
+            self._dirtyUsers.update(changedUsers)
+            self._unsavedUsers.update(unsavedUsers)
+            self._pendingChanges += len(changedUsers)
+            if self._pendingChanges >= self._flushAfterChanges:
+                self._wakeEvent.set()
+
+    def _RunFlusher(self, stopEvent: threading.Event) -> None:
+        """Persist dirty users on an interval, or early once enough changes wait."""
+        while not stopEvent.is_set():
+            self._wakeEvent.wait(self._flushIntervalSeconds)
+            self._wakeEvent.clear()
+            if stopEvent.is_set():
+                return
+            try:
+                self.Persist()
+            except Exception as error:
+                print(f"BalanceService: Background flush failed: {error}")
 
     def _NormalizeUsername(self, username: str) -> str:
         """Normalize username to lowercase for consistent lookups."""
@@ -0,0 +1,61 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable
+
+
+class CooldownTracker:
+    """Per-user cooldowns that forget users once their cooldown has passed.
+
+    Entries sit in an ordered dict in the order their cooldowns started; a
+    key is only re-added after its old entry expired, so the oldest entries
+    are always at the front. Each `TryAcquire` pops the expired ones from
+    the front, which keeps memory proportional to the users active within
+    the last `cooldownSeconds`.
+    """
+
+    def __init__(self, cooldownSeconds: float, clock: Callable[[], float] = time.monotonic) -> None:
+        self._cooldownSeconds = max(0.0, float(cooldownSeconds))
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._lastUsedAtByKey: "OrderedDict[str, float]" = OrderedDict()
+
+    def SetCooldown(self, cooldownSeconds: float) -> None:
+        with self._lock:
+            self._cooldownSeconds = max(0.0, float(cooldownSeconds))
+            self.__PruneBefore(self._clock() - self._cooldownSeconds)
+
+    def TryAcquire(self, key: str) -> bool:
+        """Start a cooldown for `key` unless one is still running.
+
+        Args:
+            key: Normalized username.
+
+        Returns:
+            bool: True if the key was not cooling down (and now is).
+        """
+        with self._lock:
+            now = self._clock()
+            self.__PruneBefore(now - self._cooldownSeconds)
+
+            # Anything still present is inside its cooldown.
+            if key in self._lastUsedAtByKey:
+                return False
+
+            self._lastUsedAtByKey[key] = now
+            return True
+
+    def Prune(self) -> None:
+        with self._lock:
+            self.__PruneBefore(self._clock() - self._cooldownSeconds)
+
+    def __len__(self) -> int:
+        return len(self._lastUsedAtByKey)
+
+    def __PruneBefore(self, cutoff: float) -> None:
+        entries = self._lastUsedAtByKey
+        while entries:
+            key, lastUsedAt = next(iter(entries.items()))
+            if lastUsedAt > cutoff:
+                return
+            del entries[key]
@@ -1,9 +1,16 @@
 from abc import ABC, abstractmethod
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
 
 
 class BalanceRepositoryInterface(ABC):
-    """Interface for persistent storage of user balances."""
+    """Interface for persistent storage of user balances.
+
+    Snapshot repositories only implement `Load`/`Save`; everything else has a
+    default built on them. Repositories that can look users up individually
+    set `SupportsLookup` so `BalanceService` skips loading every balance.
+    """
+
+    SupportsLookup = False
 
     @abstractmethod
     def Load(self) -> Dict[str, int]:
@@ -22,3 +29,54 @@ class BalanceRepositoryInterface(ABC):
             balances: Mapping of username to silver balance.
         """
         pass
+
+    def RecordDelta(self, username: str, delta: int, reason: str) -> bool:
+        """Journal a single balance change.
+
+        Args:
+            username: Normalized username.
+            delta: Signed silver change.
+            reason: Short cause, e.g. "chat", "purchase", "refund".
+
+        Returns:
+            bool: True if the repository took over the change (durable after
+            `Flush` at the latest); False if it only supports full snapshots
+            and the caller must `Save` later.
+        """
+        return False
+
+    def LoadBalance(self, username: str) -> Optional[int]:
+        """Look up one user's balance (only used when `SupportsLookup` is set).
+
+        Args:
+            username: Normalized username.
+
+        Returns:
+            Optional[int]: Stored balance, or None if the user has none.
+        """
+        return self.Load().get(username)
+
+    def CountBalances(self) -> int:
+        """Count users with a stored balance.
+
+        Returns:
+            int: Number of stored balances.
+        """
+        return len(self.Load())
+
+    def GetBalancesPage(self, offset: int, limit: int) -> List[Tuple[str, int]]:
+        """Get balances ordered by amount (highest first), then username.
+
+        Args:
+            offset: Number of rows to skip.
+            limit: Maximum number of rows to return.
+
+        Returns:
+            List[Tuple[str, int]]: (username, balance) rows.
+        """
+        rows = sorted(self.Load().items(), key=lambda item: (-item[1], item[0]))
+        return rows[max(0, offset):max(0, offset) + max(0, limit)]
+
+    def Flush(self) -> None:
+        """Push buffered changes to durable storage (no-op for snapshot-only repositories)."""
+        pass
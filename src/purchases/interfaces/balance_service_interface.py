@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import List, Mapping, Tuple
 
 
 class BalanceServiceInterface(ABC):
@@ -17,12 +18,13 @@ class BalanceServiceInterface(ABC):
         pass
 
     @abstractmethod
-    def AddSilver(self, username: str, amount: int) -> int:
+    def AddSilver(self, username: str, amount: int, reason: str = "earn") -> int:
         """Add silver to a user's balance.
 
         Args:
             username: The chat username.
             amount: Amount of silver to add.
+            reason: Ledger reason, e.g. "chat", "vote", "refund".
 
         Returns:
             int: New balance after addition.
@@ -30,28 +32,88 @@ class BalanceServiceInterface(ABC):
         pass
 
     @abstractmethod
-    def DeductSilver(self, username: str, amount: int) -> bool:
+    def AddSilverBatch(self, amountsByUser: Mapping[str, int], reason: str = "earn") -> None:
+        """Add silver to many users at once.
+
+        Args:
+            amountsByUser: Mapping of chat username to amount of silver to add.
+            reason: Ledger reason, e.g. "chat", "vote".
+        """
+        pass
+
+    @abstractmethod
+    def DeductSilver(self, username: str, amount: int, reason: str = "purchase") -> bool:
         """Deduct silver from a user's balance if sufficient funds exist.
 
         Args:
             username: The chat username.
             amount: Amount of silver to deduct.
+            reason: Ledger reason, e.g. "purchase".
 
         Returns:
             bool: True if deduction succeeded, False if insufficient funds.
         """
         pass
 
+    @abstractmethod
+    def CompareAndDeduct(self, username: str, amount: int, reason: str = "purchase") -> Tuple[bool, int]:
+        """Atomically check that a user can afford `amount` and deduct it.
+
+        Args:
+            username: The chat username.
+            amount: Amount of silver to deduct.
+            reason: Ledger reason, e.g. "purchase".
+
+        Returns:
+            Tuple[bool, int]: Whether the deduction happened, and the balance
+            after it (or the unchanged balance that was too low).
+        """
+        pass
+
     @abstractmethod
     def Persist(self) -> None:
         """Save current balances to persistent storage."""
         pass
 
     @abstractmethod
-    def GetAllBalances(self) -> dict[str, int]:
-        """Get a copy of all user balances.
+    def GetAllBalances(self) -> Mapping[str, int]:
+        """Get a read-only snapshot of all user balances.
+
+        Returns:
+            Mapping[str, int]: Mapping of username to silver balance.
+        """
+        pass
+
+    @abstractmethod
+    def CountBalances(self) -> int:
+        """Count users with a balance.
+
+        Returns:
+            int: Number of users with a stored balance.
+        """
+        pass
+
+    @abstractmethod
+    def GetBalancesPage(self, offset: int, limit: int) -> List[Tuple[str, int]]:
+        """Get one page of balances, highest first.
+
+        Args:
+            offset: Number of rows to skip.
+            limit: Maximum number of rows to return.
+
+        Returns:
+            List[Tuple[str, int]]: (username, balance) rows ordered by balance, then username.
+        """
+        pass
+
+    @abstractmethod
+    def GetTopBalances(self, limit: int) -> List[Tuple[str, int]]:
+        """Get the `limit` highest balances.
+
+        Args:
+            limit: Maximum number of rows to return.
 
         Returns:
-            dict[str, int]: Mapping of username to silver balance.
+            List[Tuple[str, int]]: (username, balance) rows, highest first.
         """
         pass
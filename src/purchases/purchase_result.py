@@ -51,3 +51,14 @@ class PurchaseResult:
             cost=0,
             newBalance=0,
         )
+
+    @staticmethod
+    def GameUnavailable(eventId: str) -> "PurchaseResult":
+        """Create a result for a purchase rejected because RimAPI is not reachable."""
+        return PurchaseResult(
+            success=False,
+            message=f"The game is unavailable right now. '{eventId}' was not triggered and no silver was spent.",
+            eventId=eventId,
+            cost=0,
+            newBalance=0,
+        )
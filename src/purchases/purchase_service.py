@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from src.game_events.game_event_catalog_service import GameEventCatalogService
 from src.game_events.game_event_definition import GameEventDefinition
@@ -7,6 +7,7 @@ from src.core.settings.settings_service import SettingsService
 from src.purchases.interfaces.balance_service_interface import BalanceServiceInterface
 from src.purchases.interfaces.purchase_service_interface import PurchaseServiceInterface
 from src.purchases.purchase_result import PurchaseResult
+from src.window.endpoint_health_tracker import EndpointHealthTracker
 
 
 class PurchaseService(PurchaseServiceInterface):
@@ -44,16 +45,24 @@ class PurchaseService(PurchaseServiceInterface):
         if currentBalance < cost:
             return PurchaseResult.InsufficientFunds(eventDefinition.label, cost, currentBalance)
 
-        deductionSucceeded = self._balanceService.DeductSilver(username, cost)
+        host, port = self._GetEndpoint()
+        if not self._eventExecutor.IsAvailable(host, port):
+            # Fail fast instead of taking silver and waiting out timeouts while the game is loading or down.
+            return PurchaseResult.GameUnavailable(eventDefinition.label)
+
+        # The balance may have moved since the check above (another purchase,
+        # a refund); CompareAndDeduct re-checks and deducts under the user's lock.
+        deductionSucceeded, newBalance = self._balanceService.CompareAndDeduct(username, cost, reason="purchase")
         if not deductionSucceeded:
-            return PurchaseResult.InsufficientFunds(eventDefinition.label, cost, currentBalance)
+            return PurchaseResult.InsufficientFunds(eventDefinition.label, cost, newBalance)
 
-        executionResult = self._ExecuteEvent(eventDefinition)
+        executionResult = self._ExecuteEvent(eventDefinition, host, port)
         if not executionResult.success:
-            self._balanceService.AddSilver(username, cost)
+            self._balanceService.AddSilver(username, cost, reason="refund")
+            if EndpointHealthTracker.UnavailableMessage in executionResult.message or not self._eventExecutor.IsAvailable(host, port):
+                return PurchaseResult.GameUnavailable(eventDefinition.label)
             return executionResult
 
-        newBalance = self._balanceService.GetBalance(username)
         self._balanceService.Persist()
 
         return PurchaseResult.Success(eventDefinition.label, cost, newBalance)
@@ -73,16 +82,20 @@ class PurchaseService(PurchaseServiceInterface):
 
         return None
 
-    def _ExecuteEvent(self, eventDefinition: GameEventDefinition) -> PurchaseResult:
+    def _GetEndpoint(self) -> Tuple[str, int]:
+        """Read the RimAPI host/port from settings."""
+        settings = self._settingsService.Get()
+        return settings.rimApiHost, settings.rimApiPort
+
+    def _ExecuteEvent(self, eventDefinition: GameEventDefinition, host: str, port: int) -> PurchaseResult:
         """Execute the game event via REST API."""
         try:
-            settings = self._settingsService.Get()
-            host = settings.rimApiHost
-            port = settings.rimApiPort
-
             results = self._eventExecutor.Execute(host, port, eventDefinition)
             
-            hasError = any("error" in str(result).lower() or "failed" in str(result).lower() for result in results)
+            hasError = any(
+                "error" in str(result).lower() or "failed" in str(result).lower() or EndpointHealthTracker.UnavailableMessage in str(result)
+                for result in results
+            )
             if hasError:
                 errorMessage = "; ".join(results)
                 return PurchaseResult.ExecutionFailed(eventDefinition.eventId, errorMessage)
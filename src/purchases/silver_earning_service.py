@@ -1,21 +1,35 @@
-import time
-from typing import Dict
+import threading
+from typing import Dict, Optional
 
+from src.purchases.cooldown_tracker import CooldownTracker
 from src.purchases.interfaces.balance_service_interface import BalanceServiceInterface
 from src.purchases.interfaces.silver_earning_service_interface import SilverEarningServiceInterface
 from src.purchases.models.silver_earning_configuration import SilverEarningConfiguration
 
 
 class SilverEarningService(SilverEarningServiceInterface):
-    """Awards silver to users based on chat activity and poll participation."""
+    """Awards silver to users based on chat activity and poll participation.
+
+    While started, awards are summed per user and reason in a pending map
+    and applied with one `AddSilverBatch` per reason every
+    `batchIntervalSeconds`, so a chat raid costs a dict update per message
+    instead of a balance write. Before `Start` (and after `Stop`) awards
+    are applied immediately.
+    """
 
     SILVER_PER_CHAT_MESSAGE = 5
     SILVER_PER_POLL_VOTE = 50
     CHAT_REWARD_COOLDOWN_SECONDS = 3.0
+    BATCH_INTERVAL_SECONDS = 0.25
 
-    def __init__(self, balanceService: BalanceServiceInterface) -> None:
+    def __init__(self, balanceService: BalanceServiceInterface, batchIntervalSeconds: float = BATCH_INTERVAL_SECONDS) -> None:
         self._balanceService = balanceService
-        self._lastChatRewardAtByUser: Dict[str, float] = {}
+        self._chatRewardCooldowns = CooldownTracker(self.CHAT_REWARD_COOLDOWN_SECONDS)
+        self._batchIntervalSeconds = max(0.01, float(batchIntervalSeconds))
+        self._pendingLock = threading.Lock()
+        self._pendingByReason: Dict[str, Dict[str, int]] = {}
+        self._stopEvent: Optional[threading.Event] = None
+        self._batchThread: Optional[threading.Thread] = None
         self._silverPerChatMessage = int(self.SILVER_PER_CHAT_MESSAGE)
         self._silverPerPollVote = int(self.SILVER_PER_POLL_VOTE)
         self._chatRewardCooldownSeconds = float(self.CHAT_REWARD_COOLDOWN_SECONDS)
@@ -32,6 +46,7 @@ class SilverEarningService(SilverEarningServiceInterface):
         self._silverPerChatMessage = normalized.silverPerChatMessage
         self._silverPerPollVote = normalized.silverPerPollVote
         self._chatRewardCooldownSeconds = normalized.chatRewardCooldownSeconds
+        self._chatRewardCooldowns.SetCooldown(normalized.chatRewardCooldownSeconds)
         return normalized
 
     def OnChatMessage(self, username: str) -> int:
@@ -47,14 +62,11 @@ class SilverEarningService(SilverEarningServiceInterface):
             return 0
 
         normalizedUsername = str(username).strip().lower()
-        currentTime = time.monotonic()
-        lastRewardAt = self._lastChatRewardAtByUser.get(normalizedUsername, 0.0)
-        if currentTime - lastRewardAt < self._chatRewardCooldownSeconds:
+        if not self._chatRewardCooldowns.TryAcquire(normalizedUsername):
             return 0
 
-        self._lastChatRewardAtByUser[normalizedUsername] = currentTime
         earnedAmount = self._silverPerChatMessage
-        self._balanceService.AddSilver(username, earnedAmount)
+        self._Award(normalizedUsername, earnedAmount, "chat")
         return earnedAmount
 
     def OnPollVote(self, username: str) -> int:
@@ -70,9 +82,59 @@ class SilverEarningService(SilverEarningServiceInterface):
             return 0
 
         earnedAmount = self._silverPerPollVote
-        self._balanceService.AddSilver(username, earnedAmount)
+        self._Award(str(username).strip().lower(), earnedAmount, "vote")
         return earnedAmount
 
+    def Start(self) -> None:
+        """Start applying awards in batches."""
+        if self._batchThread is not None:
+            return
+        stopEvent = threading.Event()
+        self._stopEvent = stopEvent
+        self._batchThread = threading.Thread(target=self._RunBatcher, args=(stopEvent,), name="SilverAwardBatcher", daemon=True)
+        self._batchThread.start()
+
+    def Stop(self) -> None:
+        """Stop batching and apply whatever is still pending."""
+        with self._pendingLock:
+            stopEvent = self._stopEvent
+            thread = self._batchThread
+            self._stopEvent = None
+            self._batchThread = None
+        if stopEvent is not None:
+            stopEvent.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=2.0)
+        self.ApplyPendingAwards()
+
+    def ApplyPendingAwards(self) -> None:
+        """Apply pending awards to balances now."""
+        with self._pendingLock:
+            pendingByReason = self._pendingByReason
+            self._pendingByReason = {}
+        for reason, amountsByUser in pendingByReason.items():
+            try:
+                self._balanceService.AddSilverBatch(amountsByUser, reason=reason)
+            except Exception as error:
+                print(f"SilverEarningService: Failed to apply {len(amountsByUser)} '{reason}' awards: {error}")
+
+    def _Award(self, normalizedUsername: str, amount: int, reason: str) -> None:
+        if amount <= 0:
+            return
+        with self._pendingLock:
+            if self._batchThread is not None:
+                pending = self._pendingByReason.get(reason)
+                if pending is None:
+                    pending = self._pendingByReason[reason] = {}
+                pending[normalizedUsername] = pending.get(normalizedUsername, 0) + amount
+                return
+        self._balanceService.AddSilver(normalizedUsername, amount, reason=reason)
+
+    def _RunBatcher(self, stopEvent: threading.Event) -> None:
+        while not stopEvent.wait(self._batchIntervalSeconds):
+            if self._pendingByReason:
+                self.ApplyPendingAwards()
+
     def _NormalizeConfiguration(self, configuration: SilverEarningConfiguration) -> SilverEarningConfiguration:
         chatAmount = int(configuration.silverPerChatMessage)
         pollAmount = int(configuration.silverPerPollVote)
@@ -0,0 +1,174 @@
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from src.purchases.balance_ledger_repository import BalanceLedgerRepository
+from src.purchases.interfaces.balance_repository_interface import BalanceRepositoryInterface
+
+
+class SqliteBalanceRepository(BalanceRepositoryInterface):
+    """SQLite balance storage for channels with many distinct chatters.
+
+    Balances live in a `balances` table keyed by username (WAL journal, so
+    the UI can read while chat earnings are written). Nothing is loaded up
+    front: `BalanceService` looks users up as they appear. Deltas are
+    summed per user in memory and written as one batched
+    `INSERT ... ON CONFLICT DO UPDATE` transaction on `Flush`, or as soon as
+    `batchSize` users are pending.
+
+    On first open, balances from `legacyFilePath` (the JSON snapshot and its
+    ledger) are imported once; the import is recorded in the `meta` table.
+    """
+
+    SupportsLookup = True
+    MigrationKey = "migratedFromJson"
+
+    def __init__(self, filePath: Path, legacyFilePath: Optional[Path] = None, batchSize: int = 500) -> None:
+        self._filePath = filePath
+        self._legacyFilePath = legacyFilePath
+        self._batchSize = max(1, int(batchSize))
+
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pending: Dict[str, int] = {}
+
+    def Load(self) -> Dict[str, int]:
+        """Load all user balances (used for exports; `BalanceService` looks users up lazily).
+
+        Returns:
+            Dict[str, int]: Mapping of username to silver balance.
+        """
+        with self._lock:
+            connection = self.__GetConnection()
+            self.__WritePending(connection)
+            return {str(username): int(balance) for username, balance in connection.execute("SELECT username, balance FROM balances")}
+
+    def Save(self, balances: Dict[str, int]) -> None:
+        """Upsert the given balances; users not listed are left untouched.
+
+        Args:
+            balances: Mapping of username to silver balance.
+        """
+        rows = [(str(username), int(balance)) for username, balance in balances.items()]
+        with self._lock:
+            connection = self.__GetConnection()
+            self.__WritePending(connection)
+            with connection:
+                connection.executemany(
+                    "INSERT INTO balances(username, balance) VALUES (?, ?) "
+                    "ON CONFLICT(username) DO UPDATE SET balance = excluded.balance",
+                    rows,
+                )
+
+    def RecordDelta(self, username: str, delta: int, reason: str) -> bool:
+        if delta == 0:
+            return True
+
+        with self._lock:
+            self._pending[username] = self._pending.get(username, 0) + int(delta)
+            if len(self._pending) >= self._batchSize:
+                try:
+                    self.__WritePending(self.__GetConnection())
+                except Exception as error:
+                    print(f"SqliteBalanceRepository: Failed to write balance batch: {error}")
+        return True
+
+    def Flush(self) -> None:
+        with self._lock:
+            if self._pending:
+                self.__WritePending(self.__GetConnection())
+
+    def LoadBalance(self, username: str) -> Optional[int]:
+        with self._lock:
+            row = self.__GetConnection().execute("SELECT balance FROM balances WHERE username = ?", (username,)).fetchone()
+            pendingDelta = self._pending.get(username)
+        if row is None:
+            return pendingDelta
+        return int(row[0]) + (pendingDelta or 0)
+
+    def CountBalances(self) -> int:
+        with self._lock:
+            connection = self.__GetConnection()
+            self.__WritePending(connection)
+            return int(connection.execute("SELECT COUNT(*) FROM balances").fetchone()[0])
+
+    def GetBalancesPage(self, offset: int, limit: int) -> List[Tuple[str, int]]:
+        with self._lock:
+            connection = self.__GetConnection()
+            self.__WritePending(connection)
+            cursor = connection.execute(
+                "SELECT username, balance FROM balances ORDER BY balance DESC, username LIMIT ? OFFSET ?",
+                (max(0, int(limit)), max(0, int(offset))),
+            )
+            return [(str(username), int(balance)) for username, balance in cursor]
+
+    def Close(self) -> None:
+        with self._lock:
+            connection = self._connection
+            self._connection = None
+            if connection is None:
+                return
+            try:
+                self.__WritePending(connection)
+            except Exception as error:
+                print(f"SqliteBalanceRepository: Failed to write pending balances: {error}")
+            connection.close()
+
+    def __WritePending(self, connection: sqlite3.Connection) -> None:
+        # Called under the lock. Deltas are summed per user, so one row per
+        # dirty user goes out regardless of how many changes it collected.
+        if not self._pending:
+            return
+        rows = list(self._pending.items())
+        with connection:
+            connection.executemany(
+                "INSERT INTO balances(username, balance) VALUES (?, ?) "
+                "ON CONFLICT(username) DO UPDATE SET balance = balance + excluded.balance",
+                rows,
+            )
+        self._pending = {}
+
+    def __GetConnection(self) -> sqlite3.Connection:
+        if self._connection is not None:
+            return self._connection
+
+        self._filePath.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(str(self._filePath), check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        with connection:
+            connection.execute("CREATE TABLE IF NOT EXISTS balances (username TEXT PRIMARY KEY, balance INTEGER NOT NULL DEFAULT 0) WITHOUT ROWID")
+            connection.execute("CREATE INDEX IF NOT EXISTS balances_by_amount ON balances(balance DESC, username)")
+            connection.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        self.__MigrateLegacy(connection)
+        self._connection = connection
+        return connection
+
+    def __MigrateLegacy(self, connection: sqlite3.Connection) -> None:
+        legacyFilePath = self._legacyFilePath
+        if legacyFilePath is None:
+            return
+        if connection.execute("SELECT 1 FROM meta WHERE key = ?", (self.MigrationKey,)).fetchone() is not None:
+            return
+
+        ledgerPath = legacyFilePath.with_name(legacyFilePath.name + ".ledger")
+        balances: Dict[str, int] = {}
+        if legacyFilePath.exists() or ledgerPath.exists():
+            legacyRepository = BalanceLedgerRepository(legacyFilePath)
+            balances = legacyRepository.Load()
+            legacyRepository.Close()
+
+        with connection:
+            connection.executemany(
+                "INSERT INTO balances(username, balance) VALUES (?, ?) "
+                "ON CONFLICT(username) DO UPDATE SET balance = excluded.balance",
+                list(balances.items()),
+            )
+            connection.execute(
+                "INSERT INTO meta(key, value) VALUES (?, ?)",
+                (self.MigrationKey, f"{legacyFilePath.name} at {time.strftime('%Y-%m-%dT%H:%M:%S')} ({len(balances)} users)"),
+            )
+        if balances:
+            print(f"SqliteBalanceRepository: Imported {len(balances)} balances from {legacyFilePath.name}")
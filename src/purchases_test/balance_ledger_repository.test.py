@@ -0,0 +1,71 @@
+import json
+import sys
+import tempfile
+from pathlib import Path
+import unittest
+
+projectRoot = Path(__file__).resolve().parents[2]
+if str(projectRoot) not in sys.path:
+    sys.path.append(str(projectRoot))
+
+from src.purchases.balance_ledger_repository import BalanceLedgerRepository
+from src.purchases.balance_service import BalanceService
+
+
+class BalanceLedgerRepositoryTestCase(unittest.TestCase):
+    def testChangesSurviveRestartWithoutSnapshotRewrite(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            filePath = Path(directory) / "balances.json"
+            repository = BalanceLedgerRepository(filePath)
+            service = BalanceService(repository)
+            service.AddSilver("Alice", 100, reason="chat")
+            self.assertTrue(service.DeductSilver("alice", 30))
+            service.AddSilver("Bob", 5, reason="vote")
+            service.Persist()
+            repository.Close()
+
+            self.assertFalse(filePath.exists())
+            reasons = [json.loads(line)["reason"] for line in filePath.with_name("balances.json.ledger").read_text().splitlines()]
+            self.assertEqual(reasons, ["chat", "purchase", "vote"])
+
+            reloaded = BalanceLedgerRepository(filePath).Load()
+            self.assertEqual(reloaded, {"alice": 70, "bob": 5})
+
+    def testTornTailIsDroppedAndAppendingContinues(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            filePath = Path(directory) / "balances.json"
+            repository = BalanceLedgerRepository(filePath, fsyncPolicy="always")
+            repository.Load()
+            repository.RecordDelta("alice", 50, "chat")
+            repository.Close()
+            with filePath.with_name("balances.json.ledger").open("ab") as ledger:
+                ledger.write(b'{"seq":2,"user":"alice","del')
+
+            restarted = BalanceLedgerRepository(filePath)
+            self.assertEqual(restarted.Load(), {"alice": 50})
+            restarted.RecordDelta("alice", 7, "vote")
+            restarted.Close()
+            self.assertEqual(BalanceLedgerRepository(filePath).Load(), {"alice": 57})
+
+    def testLegacyFileAndCompactionKeepEveryEntry(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            filePath = Path(directory) / "balances.json"
+            filePath.write_text(json.dumps({"Alice": 10, "bob": 3}), encoding="utf-8")
+
+            repository = BalanceLedgerRepository(filePath, compactEvery=1000)
+            self.assertEqual(repository.Load(), {"alice": 10, "bob": 3})
+            for _ in range(5):
+                repository.RecordDelta("alice", 1, "chat")
+            repository.Compact()
+            repository.RecordDelta("bob", -2, "purchase")
+            repository.Close()
+
+            snapshot = json.loads(filePath.read_text(encoding="utf-8"))
+            self.assertEqual(snapshot["sequence"], 5)
+            self.assertEqual(snapshot["balances"], {"alice": 15, "bob": 3})
+            self.assertFalse(filePath.with_name("balances.json.ledger.compacting").exists())
+            self.assertEqual(BalanceLedgerRepository(filePath).Load(), {"alice": 15, "bob": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+import sys
+import threading
+import time
+from pathlib import Path
+import unittest
+
+projectRoot = Path(__file__).resolve().parents[2]
+if str(projectRoot) not in sys.path:
+    sys.path.append(str(projectRoot))
+
+from src.purchases.balance_service import BalanceService
+from src.purchases.interfaces.balance_repository_interface import BalanceRepositoryInterface
+
+
+class RecordingRepository(BalanceRepositoryInterface):
+    def __init__(self, journals: bool = False) -> None:
+        self.journals = journals
+        self.failSaves = False
+        self.saves = []
+        self.deltas = []
+        self.flushes = 0
+
+    def Load(self):
+        return {"alice": 10}
+
+    def Save(self, balances):
+        if self.failSaves:
+            raise OSError("disk full")
+        self.saves.append(dict(balances))
+
+    def RecordDelta(self, username, delta, reason):
+        self.deltas.append((username, delta, reason))
+        return self.journals
+
+    def Flush(self):
+        self.flushes += 1
+
+
+class BalanceServiceTestCase(unittest.TestCase):
+    def testFlusherPersistsAfterEnoughChangesAndOnStop(self) -> None:
+        repository = RecordingRepository()
+        service = BalanceService(repository, flushIntervalSeconds=60.0, flushAfterChanges=3)
+        service.Start()
+        try:
+            service.AddSilver("Alice", 1, reason="chat")
+            service.AddSilver("bob", 1, reason="chat")
+            self.assertEqual(service.GetFlushStats().pendingUsers, 2)
+            service.AddSilver("alice", 1, reason="chat")
+
+            deadline = time.monotonic() + 2.0
+            while not repository.saves and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertEqual(repository.saves, [{"alice": 12, "bob": 1}])
+            stats = service.GetFlushStats()
+            self.assertEqual((stats.pendingUsers, stats.pendingChanges, stats.flushCount, stats.lastFlushUsers), (0, 0, 1, 2))
+
+            service.AddSilver("carol", 4, reason="vote")
+        finally:
+            service.Stop()
+        self.assertEqual(repository.saves[-1]["carol"], 4)
+        self.assertEqual(service.GetFlushStats().flushCount, 2)
+
+    def testJournaledChangesOnlyFlushAndIdleFlushesAreSkipped(self) -> None:
+        repository = RecordingRepository(journals=True)
+        service = BalanceService(repository)
+        service.Persist()
+        self.assertEqual(repository.flushes, 0)
+
+        self.assertTrue(service.DeductSilver("alice", 4))
+        service.Persist()
+        self.assertEqual((repository.flushes, repository.saves), (1, []))
+        self.assertEqual(repository.deltas, [("alice", -4, "purchase")])
+
+    def testFailedFlushKeepsBacklog(self) -> None:
+        repository = RecordingRepository()
+        repository.failSaves = True
+        service = BalanceService(repository)
+        service.AddSilver("bob", 3)
+        service.Persist()
+
+        stats = service.GetFlushStats()
+        self.assertEqual((stats.pendingUsers, stats.failedFlushCount, stats.lastError), (1, 1, "disk full"))
+
+        repository.failSaves = False
+        service.Persist()
+        self.assertEqual(repository.saves, [{"alice": 10, "bob": 3}])
+        self.assertEqual(service.GetFlushStats().pendingUsers, 0)
+
+    def testConcurrentPurchasesCannotDoubleSpend(self) -> None:
+        service = BalanceService(RecordingRepository(journals=True), lockStripes=4)
+        service.AddSilver("alice", 40)  # 50 in total
+        barrier = threading.Barrier(8)
+        outcomes = []
+
+        def buyer() -> None:
+            barrier.wait()
+            for _ in range(5):
+                outcomes.append(service.CompareAndDeduct("Alice", 10))
+                service.AddSilver(f"viewer{threading.get_ident()}", 1, reason="chat")
+
+        threads = [threading.Thread(target=buyer) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5.0)
+
+        self.assertEqual(sum(1 for deducted, _ in outcomes if deducted), 5)
+        self.assertEqual(sorted(balance for deducted, balance in outcomes if deducted), [0, 10, 20, 30, 40])
+        self.assertEqual(service.GetBalance("alice"), 0)
+        self.assertEqual(service.CompareAndDeduct("alice", 1), (False, 0))
+
+    def testSnapshotIsSharedUntilBalancesChange(self) -> None:
+        service = BalanceService(RecordingRepository())
+        first = service.GetAllBalances()
+        self.assertIs(service.GetAllBalances(), first)
+        with self.assertRaises(TypeError):
+            first["alice"] = 99
+
+        service.AddSilver("bob", 30)
+        second = service.GetAllBalances()
+        self.assertIsNot(second, first)
+        self.assertEqual(dict(second), {"alice": 10, "bob": 30})
+        self.assertEqual(service.GetTopBalances(1), [("bob", 30)])
+
+    def testBatchAwardsMarkDirtyOnce(self) -> None:
+        repository = RecordingRepository(journals=True)
+        service = BalanceService(repository, flushAfterChanges=1000)
+        service.AddSilverBatch({"Alice": 5, "bob": 2, "carol": 0}, reason="chat")
+
+        self.assertEqual(dict(service.GetAllBalances()), {"alice": 15, "bob": 2})
+        self.assertEqual(sorted(repository.deltas), [("alice", 5, "chat"), ("bob", 2, "chat")])
+        stats = service.GetFlushStats()
+        self.assertEqual((stats.pendingUsers, stats.pendingChanges), (2, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+import unittest
+
+projectRoot = Path(__file__).resolve().parents[2]
+if str(projectRoot) not in sys.path:
+    sys.path.append(str(projectRoot))
+
+from src.core.events.event_bus import EventBus
+from src.events.chat_message_event import ChatMessageEvent
+from src.events.poll_started_event import PollStartedEvent
+from src.listeners.purchase_event_listener import PurchaseEventListener
+from src.purchases.cooldown_tracker import CooldownTracker
+from src.test_support.fake_clock import FakeClock
+
+
+class RecordingEarningService:
+    def __init__(self) -> None:
+        self.votes = []
+
+    def OnChatMessage(self, username):
+        return 0
+
+    def OnPollVote(self, username):
+        self.votes.append(username)
+        return 50
+
+
+class SilentCommandHandler:
+    def HandleMessage(self, username, content):
+        return None
+
+
+class CooldownTrackerTestCase(unittest.TestCase):
+    def testEntriesExpireOnceCooldownPassed(self) -> None:
+        clock = FakeClock()
+        tracker = CooldownTracker(3.0, clock=clock)
+
+        self.assertTrue(tracker.TryAcquire("alice"))
+        self.assertFalse(tracker.TryAcquire("alice"))
+        clock.now += 2.0
+        self.assertTrue(tracker.TryAcquire("bob"))
+        clock.now += 1.0
+        self.assertTrue(tracker.TryAcquire("alice"))
+        self.assertEqual(len(tracker), 2)
+
+        clock.now += 3.0
+        tracker.Prune()
+        self.assertEqual(len(tracker), 0)
+
+    def testMemoryFollowsActiveChatters(self) -> None:
+        clock = FakeClock()
+        tracker = CooldownTracker(3.0, clock=clock)
+        for index in range(100000):
+            clock.now += 0.01  # 100 new chatters per second
+            tracker.TryAcquire(f"viewer{index}")
+        self.assertLessEqual(len(tracker), 301)
+
+        tracker.SetCooldown(0.5)
+        self.assertLessEqual(len(tracker), 51)
+
+    def testVoteRewardResetsEachPollRound(self) -> None:
+        eventBus = EventBus()
+        earningService = RecordingEarningService()
+        listener = PurchaseEventListener(eventBus, SimpleNamespace(), earningService, SilentCommandHandler())
+        listener.Register()
+
+        eventBus.Publish(ChatMessageEvent("Alice", "1"))
+        eventBus.Publish(ChatMessageEvent("alice", "2"))
+        self.assertEqual(earningService.votes, ["Alice"])
+
+        eventBus.Publish(PollStartedEvent(["Raid", "Cargo pod"]))
+        eventBus.Publish(ChatMessageEvent("alice", "2"))
+        self.assertEqual(earningService.votes, ["Alice", "alice"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import sys
+import time
+from pathlib import Path
+import unittest
+
+projectRoot = Path(__file__).resolve().parents[2]
+if str(projectRoot) not in sys.path:
+    sys.path.append(str(projectRoot))
+
+from src.purchases.models.silver_earning_configuration import SilverEarningConfiguration
+from src.purchases.silver_earning_service import SilverEarningService
+
+
+class RecordingBalanceService:
+    def __init__(self) -> None:
+        self.added = []
+        self.batches = []
+
+    def AddSilver(self, username, amount, reason="earn"):
+        self.added.append((username, amount, reason))
+        return amount
+
+    def AddSilverBatch(self, amountsByUser, reason="earn"):
+        self.batches.append((dict(amountsByUser), reason))
+
+
+class SilverEarningServiceTestCase(unittest.TestCase):
+    def testAwardsAreAppliedImmediatelyUntilStarted(self) -> None:
+        balances = RecordingBalanceService()
+        service = SilverEarningService(balances)
+
+        self.assertEqual(service.OnChatMessage(" Alice "), 5)
+        self.assertEqual(service.OnChatMessage("alice"), 0)  # cooldown
+        self.assertEqual(service.OnPollVote("Bob"), 50)
+        self.assertEqual(balances.added, [("alice", 5, "chat"), ("bob", 50, "vote")])
+        self.assertEqual(balances.batches, [])
+
+    def testRaidIsAppliedInOneBatchPerReason(self) -> None:
+        balances = RecordingBalanceService()
+        service = SilverEarningService(balances, batchIntervalSeconds=0.1)
+        service.UpdateConfiguration(SilverEarningConfiguration(silverPerChatMessage=2, silverPerPollVote=10, chatRewardCooldownSeconds=0.0))
+        service.Start()
+        try:
+            startedAt = time.perf_counter()
+            for index in range(5000):
+                service.OnChatMessage(f"viewer{index % 100}")
+            perMessageUs = (time.perf_counter() - startedAt) * 1_000_000 / 5000
+            service.OnPollVote("viewer1")
+
+            deadline = time.monotonic() + 2.0
+            while len(balances.batches) < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            service.Stop()
+
+        chatTotals = {}
+        for amountsByUser, reason in balances.batches:
+            if reason == "chat":
+                for username, amount in amountsByUser.items():
+                    chatTotals[username] = chatTotals.get(username, 0) + amount
+        self.assertEqual(len(chatTotals), 100)
+        self.assertTrue(all(amount == 100 for amount in chatTotals.values()))
+        self.assertIn(({"viewer1": 10}, "vote"), balances.batches)
+        self.assertEqual(balances.added, [])
+        self.assertLess(perMessageUs, 50.0)
+
+    def testStopAppliesPendingAwards(self) -> None:
+        balances = RecordingBalanceService()
+        service = SilverEarningService(balances, batchIntervalSeconds=60.0)
+        service.Start()
+        service.OnChatMessage("carol")
+        self.assertEqual(balances.batches, [])
+
+        service.Stop()
+        self.assertEqual(balances.batches, [({"carol": 5}, "chat")])
+        service.OnChatMessage("dave")
+        self.assertEqual(balances.added, [("dave", 5, "chat")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import json
+import sys
+import tempfile
+from pathlib import Path
+import unittest
+
+projectRoot = Path(__file__).resolve().parents[2]
+if str(projectRoot) not in sys.path:
+    sys.path.append(str(projectRoot))
+
+from src.purchases.balance_service import BalanceService
+from src.purchases.sqlite_balance_repository import SqliteBalanceRepository
+
+
+class SqliteBalanceRepositoryTestCase(unittest.TestCase):
+    def testMigratesLegacyJsonOnceAndLooksUsersUpLazily(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            legacyPath = Path(directory) / "user_balances.json"
+            legacyPath.write_text(json.dumps({"Alice": 40, "bob": 12}), encoding="utf-8")
+            databasePath = Path(directory) / "user_balances.db"
+
+            repository = SqliteBalanceRepository(databasePath, legacyFilePath=legacyPath)
+            service = BalanceService(repository)
+            self.assertEqual(service._balances, {})
+            self.assertEqual(service.GetBalance("ALICE"), 40)
+            self.assertTrue(service.DeductSilver("alice", 15))
+            self.assertFalse(service.DeductSilver("bob", 13))
+            service.AddSilver("carol", 5, reason="chat")
+            service.Persist()
+            repository.Close()
+
+            legacyPath.write_text(json.dumps({"alice": 999}), encoding="utf-8")
+            reopened = SqliteBalanceRepository(databasePath, legacyFilePath=legacyPath)
+            self.assertEqual(reopened.Load(), {"alice": 25, "bob": 12, "carol": 5})
+            reopened.Close()
+
+    def testPendingDeltasAreBatchedPerUser(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            repository = SqliteBalanceRepository(Path(directory) / "balances.db", batchSize=3)
+            for _ in range(10):
+                repository.RecordDelta("alice", 2, "chat")
+            repository.RecordDelta("bob", 1, "vote")
+            self.assertEqual(len(repository._pending), 2)
+            self.assertEqual(repository.LoadBalance("alice"), 20)
+
+            repository.RecordDelta("carol", 3, "chat")
+            self.assertEqual(repository._pending, {})
+            self.assertEqual(repository.LoadBalance("carol"), 3)
+            self.assertIsNone(repository.LoadBalance("dave"))
+            repository.Close()
+
+    def testPagesAndTopBalances(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            repository = SqliteBalanceRepository(Path(directory) / "balances.db")
+            repository.Save({f"user{index:03d}": index % 7 for index in range(50)})
+            service = BalanceService(repository)
+
+            self.assertEqual(service.CountBalances(), 50)
+            self.assertEqual(service.GetTopBalances(2), [("user006", 6), ("user013", 6)])
+            pages = service.GetBalancesPage(0, 20) + service.GetBalancesPage(20, 20) + service.GetBalancesPage(40, 20)
+            self.assertEqual(len(pages), 50)
+            self.assertEqual(pages, sorted(pages, key=lambda item: (-item[1], item[0])))
+            repository.Close()
+
+
+if __name__ == "__main__":
+    unittest.main()
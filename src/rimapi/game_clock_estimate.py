@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class GameClockEstimate:
+    """GameClockEstimate is the locally interpolated game tick with its error bound."""
+
+    tick: int
+    errorTicks: int  # the true tick is expected within tick ± errorTicks
+    ticksPerSecond: float  # 0.0 while paused
+    timeSpeed: int  # 0 = paused, 1..4 = Normal..Ultrafast
+    sampleAgeSeconds: float  # time since the last /api/ticks sample
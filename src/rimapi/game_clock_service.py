@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.rimapi.game_clock_estimate import GameClockEstimate
+from src.rimapi.game_state_service import GameStateService
+from src.rimapi.game_state_value import GameStateValue
+
+
+class GameClockService:
+    """GameClockService estimates the current game tick without network calls.
+
+    It samples `/api/ticks` through `GameStateService` every
+    `sampleIntervalSeconds` and learns the real tick rate for each time speed
+    (RimWorld falls short of the nominal rate under load). Between samples
+    `Now()` interpolates from the last sample; the error bound grows with the
+    observed rate error. A sample that lands outside the bound, or a speed or
+    pause change, re-anchors the estimate and asks for a quicker follow-up
+    sample. Ticks going backwards mean another save was loaded; game reload
+    listeners are told so caches of colony data can be dropped.
+    """
+
+    TicksPath = "/api/ticks"
+    BaseTicksPerSecond = 60.0
+    # RimWorld TimeSpeed multipliers: Paused, Normal, Fast, Superfast, Ultrafast.
+    SpeedMultipliers: Dict[int, float] = {0: 0.0, 1: 1.0, 2: 3.0, 3: 6.0, 4: 15.0}
+    _SpeedNames: Dict[str, int] = {"paused": 0, "normal": 1, "fast": 2, "superfast": 3, "ultrafast": 4}
+
+    def __init__(
+        self,
+        gameState: GameStateService,
+        sampleIntervalSeconds: float = 15.0,
+        resyncIntervalSeconds: float = 1.0,
+        sampleErrorSeconds: float = 0.25,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._gameState = gameState
+        self._sampleIntervalSeconds = max(1.0, float(sampleIntervalSeconds))
+        self._resyncIntervalSeconds = max(0.1, float(resyncIntervalSeconds))
+        self._sampleErrorSeconds = max(0.0, float(sampleErrorSeconds))
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._isWatching = False
+        self._anchorTick: Optional[int] = None
+        self._anchorAt = 0.0
+        self._timeSpeed = 1
+        self._ratesBySpeed: Dict[int, float] = {}
+        self._rateErrorRatio = 0.25  # relative rate uncertainty, shrinks as samples agree
+        self._gameReloadListeners: List[Callable[[], None]] = []
+
+    def Start(self) -> None:
+        with self._lock:
+            if self._isWatching:
+                return
+            self._isWatching = True
+        self._gameState.Watch(self.TicksPath, self.__OnSample, self._sampleIntervalSeconds)
+
+    def Stop(self) -> None:
+        with self._lock:
+            if not self._isWatching:
+                return
+            self._isWatching = False
+        self._gameState.Unwatch(self.TicksPath, self.__OnSample)
+
+    def AddGameReloadListener(self, listener: Callable[[], None]) -> None:
+        self._gameReloadListeners.append(listener)
+
+    def Observe(self, response: object) -> bool:
+        """Observe feeds one `/api/ticks` answer; True when it forced a re-sync."""
+
+        parsed = self.__Parse(response)
+        if parsed is None:
+            return False
+        tick, timeSpeed = parsed
+        now = self._clock()
+
+        with self._lock:
+            isReload = self._anchorTick is not None and tick < self._anchorTick
+            if self._anchorTick is None or timeSpeed != self._timeSpeed or isReload:
+                resync = self._anchorTick is not None
+            else:
+                elapsed = now - self._anchorAt
+                predictedRate = self.__GetRate(timeSpeed)
+                predictedTick = self._anchorTick + predictedRate * elapsed
+                bound = self.__GetErrorTicks(predictedRate, elapsed)
+                resync = abs(tick - predictedTick) > bound
+                if elapsed > 0.0 and timeSpeed > 0:
+                    self.__LearnRate(timeSpeed, (tick - self._anchorTick) / elapsed, predictedRate)
+
+            self._anchorTick = tick
+            self._anchorAt = now
+            self._timeSpeed = timeSpeed
+
+        if isReload:
+            self.__NotifyGameReload()
+        return resync
+
+    def GetEstimate(self) -> Optional[GameClockEstimate]:
+        with self._lock:
+            if self._anchorTick is None:
+                return None
+            elapsed = max(0.0, self._clock() - self._anchorAt)
+            rate = self.__GetRate(self._timeSpeed)
+            return GameClockEstimate(
+                tick=int(self._anchorTick + rate * elapsed),
+                errorTicks=int(round(self.__GetErrorTicks(rate, elapsed))),
+                ticksPerSecond=rate,
+                timeSpeed=self._timeSpeed,
+                sampleAgeSeconds=elapsed,
+            )
+
+    def Now(self) -> Optional[int]:
+        """Now returns the interpolated current tick (None before the first sample)."""
+
+        estimate = self.GetEstimate()
+        return estimate.tick if estimate is not None else None
+
+    def SecondsUntil(self, tick: int) -> Optional[float]:
+        """SecondsUntil estimates real seconds until `tick` (None while paused or unsynced)."""
+
+        estimate = self.GetEstimate()
+        if estimate is None or estimate.ticksPerSecond <= 0.0:
+            return None
+        return max(0.0, (int(tick) - estimate.tick) / estimate.ticksPerSecond)
+
+    def __NotifyGameReload(self) -> None:
+        for listener in list(self._gameReloadListeners):
+            try:
+                listener()
+            except Exception as error:
+                print(f"GameClockService: game reload listener failed: {error}")
+
+    def __OnSample(self, state: GameStateValue) -> None:
+        if self.Observe(state.value):
+            self._gameState.PollWithin(self.TicksPath, self._resyncIntervalSeconds)
+
+    def __GetRate(self, timeSpeed: int) -> float:
+        if timeSpeed <= 0:
+            return 0.0
+        learned = self._ratesBySpeed.get(timeSpeed)
+        if learned is not None:
+            return learned
+        return self.BaseTicksPerSecond * self.SpeedMultipliers.get(timeSpeed, 1.0)
+
+    def __GetErrorTicks(self, rate: float, elapsedSeconds: float) -> float:
+        # One tick of quantisation, request latency, and the drift the rate error allows.
+        return 1.0 + rate * (self._sampleErrorSeconds + self._rateErrorRatio * elapsedSeconds)
+
+    def __LearnRate(self, timeSpeed: int, measuredRate: float, predictedRate: float) -> None:
+        if measuredRate <= 0.0:
+            return
+        # The game never outruns its nominal speed by much; a bigger jump is a
+        # loaded save or a missed pause, not a rate to learn.
+        nominalRate = self.BaseTicksPerSecond * self.SpeedMultipliers.get(timeSpeed, 1.0)
+        measuredRate = min(measuredRate, nominalRate * 1.25)
+        previous = self._ratesBySpeed.get(timeSpeed)
+        self._ratesBySpeed[timeSpeed] = measuredRate if previous is None else previous * 0.7 + measuredRate * 0.3
+        if predictedRate > 0.0:
+            ratio = abs(measuredRate - predictedRate) / predictedRate
+            self._rateErrorRatio = min(1.0, max(0.01, self._rateErrorRatio * 0.7 + ratio * 0.3))
+
+    def __Parse(self, response: object) -> Optional[Tuple[int, int]]:
+        if not isinstance(response, dict) or response.get("success") is False:
+            return None
+        tickValue = response.get("ticksGame", response.get("ticksAbs", response.get("tick")))
+        try:
+            tick = int(tickValue)
+        except (TypeError, ValueError):
+            return None
+
+        speedValue = response.get("timeSpeed", 1)
+        if isinstance(speedValue, str):
+            timeSpeed = self._SpeedNames.get(speedValue.strip().lower(), 1)
+        else:
+            try:
+                timeSpeed = max(0, min(4, int(speedValue)))
+            except (TypeError, ValueError):
+                timeSpeed = 1
+        if response.get("paused") is True:
+            timeSpeed = 0
+        return tick, timeSpeed
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import concurrent.futures
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.rimapi.game_state_value import GameStateValue
+from src.rimapi.polled_endpoint import PolledEndpoint
+from src.window.rest_api_client import RestApiClient
+
+
+class GameStateService:
+    """GameStateService polls RimAPI state endpoints on one shared scheduler.
+
+    Panels `Watch` a path (`/api/protection`, `/api/ticks`, ...) instead of
+    running their own polling threads. Each path is fetched at the shortest
+    interval any watcher asked for, never twice at the same time, and only
+    while someone watches it. The last answer is cached with its timestamp;
+    watchers are called (on a poll worker thread) only when it changes.
+
+    One-shot lookups stay with their callers: `GameApiDataSource` fetches
+    `/api/maps` when an editor list is built (behind its TTL cache) and
+    `/api/status` once per endpoint to fingerprint saved catalogs. Neither is
+    state a panel follows over time, so watching them would only add polls.
+    """
+
+    DefaultIntervals: Dict[str, float] = {
+        "/api/protection": 2.5,
+        "/api/ticks": 1.0,
+        "/api/status": 5.0,
+        "/api/maps": 30.0,
+    }
+    DefaultIntervalSeconds = 5.0
+    MinIntervalSeconds = 0.05
+
+    def __init__(self, apiClient: RestApiClient, getEndpoint: Callable[[], Tuple[str, int]], workerCount: int = 4) -> None:
+        self._apiClient = apiClient
+        self._getEndpoint = getEndpoint
+        self._workerCount = max(1, int(workerCount))
+
+        self._condition = threading.Condition()
+        self._endpoints: Dict[str, PolledEndpoint] = {}
+        self._stopEvent: Optional[threading.Event] = None
+        self._thread: Optional[threading.Thread] = None
+        self._workers: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+    def Start(self) -> None:
+        with self._condition:
+            if self._thread is not None:
+                return
+            stopEvent = threading.Event()
+            self._stopEvent = stopEvent
+            self._workers = concurrent.futures.ThreadPoolExecutor(max_workers=self._workerCount, thread_name_prefix="GameStatePoll")
+            self._thread = threading.Thread(target=self.__Run, args=(stopEvent, self._workers), name="GameStateScheduler", daemon=True)
+            self._thread.start()
+
+    def Stop(self) -> None:
+        with self._condition:
+            stopEvent = self._stopEvent
+            thread = self._thread
+            workers = self._workers
+            self._stopEvent = None
+            self._thread = None
+            self._workers = None
+            if stopEvent is not None:
+                stopEvent.set()
+            # Polls still running (or cancelled below) belong to the stopped run;
+            # a later Start must be free to poll these paths again.
+            for endpoint in self._endpoints.values():
+                endpoint.inFlight = False
+                endpoint.nextDueAt = 0.0
+            self._condition.notify_all()
+
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=1.0)
+        if workers is not None:
+            workers.shutdown(wait=False, cancel_futures=True)
+
+    def IsRunning(self) -> bool:
+        return self._thread is not None
+
+    def Watch(self, path: str, callback: Callable[[GameStateValue], None], intervalSeconds: Optional[float] = None) -> None:
+        """Watch starts polling `path` (if needed) and reports changes to `callback`.
+
+        A cached value is delivered to the new watcher right away.
+        """
+
+        interval = self.__ResolveInterval(path, intervalSeconds)
+        with self._condition:
+            endpoint = self._endpoints.get(path)
+            if endpoint is None:
+                endpoint = PolledEndpoint(path)
+                self._endpoints[path] = endpoint
+            isNewlyWatched = not endpoint.watchers
+            endpoint.watchers.append((callback, interval))
+            latest = endpoint.latest
+            if isNewlyWatched or latest is None or time.monotonic() - latest.updatedAt >= interval:
+                endpoint.nextDueAt = 0.0
+            else:
+                endpoint.nextDueAt = min(endpoint.nextDueAt, latest.updatedAt + interval)
+            self._condition.notify_all()
+
+        if latest is not None:
+            self.__Notify([callback], latest)
+
+    def Unwatch(self, path: str, callback: Callable[[GameStateValue], None]) -> None:
+        with self._condition:
+            endpoint = self._endpoints.get(path)
+            if endpoint is None:
+                return
+            for index, (watcher, _) in enumerate(endpoint.watchers):
+                if watcher == callback:
+                    del endpoint.watchers[index]
+                    break
+            self._condition.notify_all()
+
+    def Get(self, path: str) -> Optional[GameStateValue]:
+        """Get returns the cached value for `path` (None before the first poll)."""
+
+        with self._condition:
+            endpoint = self._endpoints.get(path)
+            return endpoint.latest if endpoint is not None else None
+
+    def Refresh(self, path: str) -> None:
+        """Refresh polls a watched path now; a request already in flight is reused."""
+
+        with self._condition:
+            endpoint = self._endpoints.get(path)
+            if endpoint is None or not endpoint.watchers:
+                return
+            endpoint.nextDueAt = 0.0
+            self._condition.notify_all()
+
+    def RefreshAll(self) -> None:
+        """RefreshAll polls every watched path now (after an action changed the game)."""
+
+        with self._condition:
+            for endpoint in self._endpoints.values():
+                if endpoint.watchers:
+                    endpoint.nextDueAt = 0.0
+            self._condition.notify_all()
+
+    def PollWithin(self, path: str, delaySeconds: float) -> None:
+        """PollWithin brings the next poll of `path` forward to at most `delaySeconds` from now.
+
+        Watchers that adapt their own pace watch with a long interval and call
+        this after each change.
+        """
+
+        with self._condition:
+            endpoint = self._endpoints.get(path)
+            if endpoint is None or not endpoint.watchers:
+                return
+            dueAt = time.monotonic() + max(self.MinIntervalSeconds, float(delaySeconds))
+            endpoint.nextDueAt = min(endpoint.nextDueAt, dueAt)
+            self._condition.notify_all()
+
+    def __Run(self, stopEvent: threading.Event, workers: concurrent.futures.ThreadPoolExecutor) -> None:
+        while True:
+            with self._condition:
+                if stopEvent.is_set():
+                    return
+                due, waitSeconds = self.__CollectDue(time.monotonic())
+                if not due:
+                    self._condition.wait(waitSeconds)
+                    continue
+
+            for endpoint in due:
+                try:
+                    workers.submit(self.__Poll, endpoint, stopEvent)
+                except RuntimeError:
+                    # Executor shut down by Stop().
+                    return
+
+    def __CollectDue(self, now: float) -> Tuple[List[PolledEndpoint], Optional[float]]:
+        due: List[PolledEndpoint] = []
+        waitSeconds: Optional[float] = None
+        for endpoint in self._endpoints.values():
+            if not endpoint.watchers or endpoint.inFlight:
+                continue
+            if endpoint.nextDueAt <= now:
+                endpoint.inFlight = True
+                due.append(endpoint)
+                continue
+            remaining = endpoint.nextDueAt - now
+            waitSeconds = remaining if waitSeconds is None else min(waitSeconds, remaining)
+        return due, waitSeconds
+
+    def __Poll(self, endpoint: PolledEndpoint, stopEvent: threading.Event) -> None:
+        try:
+            host, port = self._getEndpoint()
+            value = self._apiClient.GetJson(host, port, endpoint.path)
+        except Exception as error:
+            value = {"success": False, "status": 0, "error": str(error)}
+
+        now = time.monotonic()
+        callbacks: List[Callable[[GameStateValue], None]] = []
+        with self._condition:
+            isCurrentRun = not stopEvent.is_set()
+            previous = endpoint.latest
+            if previous is not None and previous.value == value:
+                endpoint.latest = GameStateValue(endpoint.path, value, now, previous.changedAt)
+            else:
+                endpoint.latest = GameStateValue(endpoint.path, value, now, now)
+                callbacks = [watcher for watcher, _ in endpoint.watchers]
+            if isCurrentRun:
+                # Schedule from completion so a slow endpoint never piles up requests;
+                # a Refresh() that arrived while in flight is answered by this result.
+                endpoint.inFlight = False
+                endpoint.nextDueAt = now + endpoint.GetIntervalSeconds()
+            latest = endpoint.latest
+            self._condition.notify_all()
+
+        self.__Notify(callbacks, latest)
+
+    def __Notify(self, callbacks: List[Callable[[GameStateValue], None]], value: GameStateValue) -> None:
+        for callback in callbacks:
+            try:
+                callback(value)
+            except Exception as error:
+                print(f"GameStateService: watcher for {value.path} failed: {error}")
+
+    def __ResolveInterval(self, path: str, intervalSeconds: Optional[float]) -> float:
+        if intervalSeconds is None:
+            intervalSeconds = self.DefaultIntervals.get(path, self.DefaultIntervalSeconds)
+        return max(self.MinIntervalSeconds, float(intervalSeconds))
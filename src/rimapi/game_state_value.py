@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class GameStateValue:
+    """GameStateValue is the last answer cached for one polled RimAPI path."""
+
+    path: str
+    value: object
+    updatedAt: float  # time.monotonic() of the poll that produced `value`
+    changedAt: float  # time.monotonic() when `value` last differed from the previous poll
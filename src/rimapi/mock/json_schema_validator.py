@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+
+class JsonSchemaValidator:
+    """JsonSchemaValidator checks values against the OpenAPI schema subset used in Paths/.
+
+    Supports type (with int32 range for integers), nullable, properties,
+    required, items, enum, minimum and maximum. Unknown keywords are ignored,
+    so it errs on the side of accepting. Errors are returned as JSON-pointer
+    style messages rather than raised.
+    """
+
+    _Int32Range = (-(2 ** 31), 2 ** 31 - 1)
+
+    def Validate(self, value: Any, schema: Dict[str, Any], location: str = "$") -> List[str]:
+        errors: List[str] = []
+        self.__Check(value, schema or {}, location, errors)
+        return errors
+
+    def __Check(self, value: Any, schema: Dict[str, Any], location: str, errors: List[str]) -> None:
+        if value is None:
+            if not schema.get("nullable", False) and "type" in schema:
+                errors.append(f"{location}: null is not allowed")
+            return
+
+        expectedType = schema.get("type")
+        if expectedType is not None and not self.__IsType(value, str(expectedType)):
+            errors.append(f"{location}: expected {expectedType}, got {type(value).__name__}")
+            return
+
+        if "enum" in schema and isinstance(schema["enum"], list) and value not in schema["enum"]:
+            errors.append(f"{location}: {value!r} is not one of {schema['enum']}")
+
+        if expectedType == "integer" and schema.get("format") == "int32":
+            low, high = self._Int32Range
+            if not low <= value <= high:
+                errors.append(f"{location}: {value} is out of int32 range")
+
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            if "minimum" in schema and value < schema["minimum"]:
+                errors.append(f"{location}: {value} is below minimum {schema['minimum']}")
+            if "maximum" in schema and value > schema["maximum"]:
+                errors.append(f"{location}: {value} is above maximum {schema['maximum']}")
+
+        if isinstance(value, dict):
+            properties = schema.get("properties") if isinstance(schema.get("properties"), dict) else {}
+            for name in schema.get("required", []) or []:
+                if name not in value:
+                    errors.append(f"{location}.{name}: is required")
+            for name, propertyValue in value.items():
+                propertySchema = properties.get(name)
+                if isinstance(propertySchema, dict):
+                    self.__Check(propertyValue, propertySchema, f"{location}.{name}", errors)
+
+        if isinstance(value, list) and isinstance(schema.get("items"), dict):
+            for index, item in enumerate(value):
+                self.__Check(item, schema["items"], f"{location}[{index}]", errors)
+
+    def __IsType(self, value: Any, expectedType: str) -> bool:
+        if expectedType == "object":
+            return isinstance(value, dict)
+        if expectedType == "array":
+            return isinstance(value, list)
+        if expectedType == "string":
+            return isinstance(value, str)
+        if expectedType == "boolean":
+            return isinstance(value, bool)
+        if expectedType == "integer":
+            return isinstance(value, int) and not isinstance(value, bool)
+        if expectedType == "number":
+            return isinstance(value, (int, float)) and not isinstance(value, bool)
+        return True
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, List, Optional
+
+
+class MockRoute:
+    """MockRoute is one operation (method + path template) read from a Paths/ fragment."""
+
+    def __init__(
+        self,
+        method: str,
+        pathTemplate: str,
+        requestSchema: Optional[Dict[str, Any]] = None,
+        requestRequired: bool = False,
+        responseSchema: Optional[Dict[str, Any]] = None,
+        responseExample: Any = None,
+        responseContentType: str = "application/json",
+        parameters: Optional[List[Dict[str, Any]]] = None,
+        statuses: Optional[List[int]] = None,
+    ) -> None:
+        self.method = (method or "GET").upper()
+        self.pathTemplate = pathTemplate or "/"
+        self.requestSchema = requestSchema
+        self.requestRequired = bool(requestRequired)
+        self.responseSchema = responseSchema
+        self.responseExample = responseExample
+        self.responseContentType = responseContentType or "application/json"
+        self.parameters = list(parameters or [])
+        self.statuses = list(statuses or [200])
+        self._pattern = re.compile("^" + re.sub(r"\\\{([A-Za-z0-9_]+)\\\}", r"(?P<\1>[^/]+)", re.escape(self.pathTemplate)) + "$")
+        self._literalLength = len(re.sub(r"\{[^}]+\}", "", self.pathTemplate))
+
+    def Match(self, path: str) -> Optional[Dict[str, str]]:
+        """Match returns the path parameters when `path` (without query) fits this template."""
+
+        match = self._pattern.match(path)
+        if match is None:
+            return None
+        return dict(match.groupdict())
+
+    def GetSpecificity(self) -> int:
+        # Literal segments beat placeholders: /api/pawns/kinds wins over /api/pawns/{pawnId}.
+        return self._literalLength
+
+    def GetParameterSchemas(self, location: str) -> Dict[str, Dict[str, Any]]:
+        schemas: Dict[str, Dict[str, Any]] = {}
+        for parameter in self.parameters:
+            if isinstance(parameter, dict) and parameter.get("in") == location and parameter.get("name"):
+                schema = parameter.get("schema") if isinstance(parameter.get("schema"), dict) else {}
+                schemas[str(parameter["name"])] = dict(schema, required=bool(parameter.get("required", False)))
+        return schemas
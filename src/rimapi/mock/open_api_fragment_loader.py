@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.game_events.jsonc_document_loader import JsoncDocumentLoader
+from src.rimapi.mock.mock_route import MockRoute
+
+
+class OpenApiFragmentLoader:
+    """OpenApiFragmentLoader turns the Paths/*.json OpenAPI fragments into MockRoutes.
+
+    Each fragment is a `paths` object (`{"/api/x": {"post": {...}}}`). Only the
+    parts the mock needs are read: request body schema, query/path parameters,
+    the 200 response schema/example and the documented statuses.
+    """
+
+    def __init__(self, directory: Path, loader: Optional[JsoncDocumentLoader] = None) -> None:
+        self._directory = directory
+        self._loader = loader if loader is not None else JsoncDocumentLoader()
+
+    def LoadAll(self) -> List[MockRoute]:
+        if not self._directory.exists() or not self._directory.is_dir():
+            return []
+
+        routes: List[MockRoute] = []
+        for filePath in sorted(self._directory.glob("*.json")):
+            try:
+                document = self._loader.Load(filePath)
+            except Exception as error:
+                print(f"OpenApiFragmentLoader: Skipping {filePath.name}: {error}")
+                continue
+            for pathTemplate, operations in document.items():
+                if not isinstance(operations, dict):
+                    continue
+                for method, operation in operations.items():
+                    if isinstance(operation, dict):
+                        routes.append(self.__BuildRoute(str(method), str(pathTemplate), operation))
+        return routes
+
+    def __BuildRoute(self, method: str, pathTemplate: str, operation: Dict[str, Any]) -> MockRoute:
+        requestSchema: Optional[Dict[str, Any]] = None
+        requestRequired = False
+        requestBody = operation.get("requestBody")
+        if isinstance(requestBody, dict):
+            requestRequired = bool(requestBody.get("required", False))
+            requestSchema, _, _ = self.__ReadContent(requestBody.get("content"))
+
+        responses = operation.get("responses") if isinstance(operation.get("responses"), dict) else {}
+        statuses: List[int] = []
+        for status in responses:
+            try:
+                statuses.append(int(status))
+            except (TypeError, ValueError):
+                continue
+
+        responseSchema, responseExample, contentType = None, None, "application/json"
+        success = responses.get("200")
+        if isinstance(success, dict):
+            responseSchema, responseExample, contentType = self.__ReadContent(success.get("content"))
+
+        parameters = operation.get("parameters") if isinstance(operation.get("parameters"), list) else []
+        return MockRoute(
+            method,
+            pathTemplate,
+            requestSchema=requestSchema,
+            requestRequired=requestRequired,
+            responseSchema=responseSchema,
+            responseExample=responseExample,
+            responseContentType=contentType,
+            parameters=parameters,
+            statuses=statuses,
+        )
+
+    def __ReadContent(self, content: Any) -> Tuple[Optional[Dict[str, Any]], Any, str]:
+        if not isinstance(content, dict) or not content:
+            return None, None, "application/json"
+
+        contentType = "application/json" if "application/json" in content else str(next(iter(content)))
+        media = content.get(contentType)
+        if not isinstance(media, dict):
+            return None, None, contentType
+
+        schema = media.get("schema") if isinstance(media.get("schema"), dict) else None
+        example = media.get("example")
+        examples = media.get("examples")
+        if example is None and isinstance(examples, dict):
+            for candidate in examples.values():
+                if isinstance(candidate, dict) and "value" in candidate:
+                    example = candidate["value"]
+                    break
+        return schema, example, contentType
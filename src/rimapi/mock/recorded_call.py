@@ -0,0 +1,17 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+
+@dataclass(frozen=True)
+class RecordedCall:
+    """RecordedCall is one request received by the mock server."""
+
+    method: str
+    path: str
+    route: str
+    query: Dict[str, str]
+    body: Any
+    status: int
+    receivedAt: float
+    elapsedSeconds: float
+    validationErrors: List[str] = field(default_factory=list)
@@ -0,0 +1,388 @@
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+import urllib.parse
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+if __name__ == "__main__":
+    sys.path.append(str(Path(__file__).resolve().parents[3]))
+
+from src.rimapi.mock.json_schema_validator import JsonSchemaValidator
+from src.rimapi.mock.mock_route import MockRoute
+from src.rimapi.mock.open_api_fragment_loader import OpenApiFragmentLoader
+from src.rimapi.mock.recorded_call import RecordedCall
+from src.rimapi.mock.route_behavior import RouteBehavior
+from src.rimapi.mock.sample_response_builder import SampleResponseBuilder
+
+
+class RimApiMockServer:
+    """RimApiMockServer is a local stand-in for RimAPI built from the Paths/ fragments.
+
+    Every documented operation answers with a schema-valid sample (see
+    `SampleResponseBuilder`); request bodies, query and path parameters are
+    validated against the fragment schemas and rejected with 400 like the real
+    API. Per-route `RouteBehavior` adds latency and random errors, and
+    unavailable windows make every route except `/api/ping` answer 503 as
+    RimAPI does while a save is loading. All calls are recorded.
+
+    `/api/ticks` and `/api/protection` report a game clock that advances at
+    `ticksPerSecond` times the current game speed; `text/event-stream` routes
+    stream their sample `samples` times, `intervalMs` apart.
+    """
+
+    UnavailablePayload = {"success": False, "error": "Game context is not available yet"}
+
+    def __init__(
+        self,
+        pathsDirectory: Path,
+        host: str = "127.0.0.1",
+        randomSource: Optional[random.Random] = None,
+        ticksPerSecond: float = 60.0,
+        maxRecordedCalls: int = 100000,
+    ) -> None:
+        self._host = host
+        self._random = randomSource if randomSource is not None else random.Random()
+        self._routes: List[MockRoute] = OpenApiFragmentLoader(pathsDirectory).LoadAll()
+        self._validator = JsonSchemaValidator()
+        self._samples = SampleResponseBuilder()
+        self._lock = threading.Lock()
+        self._calls: Deque[RecordedCall] = deque(maxlen=max(1, int(maxRecordedCalls)))
+        self._defaultBehavior = RouteBehavior()
+        self._routeBehaviors: Dict[str, RouteBehavior] = {}
+        self._unavailableWindows: List[Tuple[float, float]] = []
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+        self._ticksPerSecond = float(ticksPerSecond)
+        self._gameSpeed = 1
+        self._clockAnchorTicks = 0.0
+        self._clockAnchorAt = time.monotonic()
+
+        self._samples.RegisterDynamic("GET", "/api/ticks", self.__BuildTicks)
+        self._samples.RegisterDynamic("GET", "/api/protection", self.__BuildProtection)
+
+    def Start(self, port: int = 0) -> int:
+        """Start serves on a daemon thread and returns the bound port (0 picks a free one)."""
+
+        self.Stop()
+        server = ThreadingHTTPServer((self._host, int(port)), self._CreateHandlerFactory())
+        server.daemon_threads = True
+        self._server = server
+        self._thread = threading.Thread(target=server.serve_forever, name="RimApiMockServer", daemon=True)
+        self._thread.start()
+        return self.GetPort()
+
+    def Stop(self) -> None:
+        server = self._server
+        if server is None:
+            return
+        self._server = None
+        self._thread = None
+        try:
+            server.shutdown()
+            server.server_close()
+        except Exception:
+            pass
+
+    def GetPort(self) -> int:
+        server = self._server
+        return int(server.server_address[1]) if server is not None else 0
+
+    def GetRoutes(self) -> List[MockRoute]:
+        return list(self._routes)
+
+    def SetDefaultBehavior(self, behavior: RouteBehavior) -> None:
+        with self._lock:
+            self._defaultBehavior = behavior
+
+    def SetRouteBehavior(self, method: str, pathTemplate: str, behavior: RouteBehavior) -> None:
+        with self._lock:
+            self._routeBehaviors[f"{method.upper()} {pathTemplate}"] = behavior
+
+    def AddUnavailableWindow(self, startAfterSeconds: float, durationSeconds: float) -> None:
+        """AddUnavailableWindow schedules a 503 period relative to now."""
+
+        startsAt = time.monotonic() + max(0.0, float(startAfterSeconds))
+        with self._lock:
+            self._unavailableWindows.append((startsAt, startsAt + max(0.0, float(durationSeconds))))
+
+    def ClearUnavailableWindows(self) -> None:
+        with self._lock:
+            self._unavailableWindows = []
+
+    def IsUnavailable(self) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            self._unavailableWindows = [window for window in self._unavailableWindows if window[1] > now]
+            return any(startsAt <= now < endsAt for startsAt, endsAt in self._unavailableWindows)
+
+    def SetGameSpeed(self, speed: int) -> None:
+        """SetGameSpeed changes the simulated speed (0 = paused, 1..4 like RimWorld)."""
+
+        with self._lock:
+            now = time.monotonic()
+            self._clockAnchorTicks += (now - self._clockAnchorAt) * self._ticksPerSecond * self._gameSpeed
+            self._clockAnchorAt = now
+            self._gameSpeed = max(0, int(speed))
+
+    def GetCalls(self) -> List[RecordedCall]:
+        with self._lock:
+            return list(self._calls)
+
+    def GetCallCounts(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for call in self.GetCalls():
+            key = f"{call.method} {call.route}"
+            counts[key] = counts.get(key, 0) + 1
+        return counts
+
+    def ResetCalls(self) -> None:
+        with self._lock:
+            self._calls.clear()
+
+    def _CreateHandlerFactory(self) -> type:
+        """Create a request handler class bound to this server."""
+        mockServer = self
+
+        class RimApiMockRequestHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_GET(self) -> None:
+                mockServer._Handle(self)
+
+            def do_POST(self) -> None:
+                mockServer._Handle(self)
+
+            def do_PUT(self) -> None:
+                mockServer._Handle(self)
+
+            def do_DELETE(self) -> None:
+                mockServer._Handle(self)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                """Suppress default logging."""
+                pass
+
+        return RimApiMockRequestHandler
+
+    def _Handle(self, handler: BaseHTTPRequestHandler) -> None:
+        receivedAt = time.monotonic()
+        method = str(handler.command).upper()
+        parsedUrl = urllib.parse.urlsplit(handler.path)
+        path = parsedUrl.path
+        query = {name: values[-1] for name, values in urllib.parse.parse_qs(parsedUrl.query, keep_blank_values=True).items()}
+
+        length = int(handler.headers.get("Content-Length", "0") or 0)
+        rawBody = handler.rfile.read(length) if length > 0 else b""
+
+        route, pathParameters, allowsOtherMethod = self.__FindRoute(method, path)
+        body: Any = None
+        errors: List[str] = []
+        payload: Any = None
+        isStream = False
+
+        if route is None:
+            status = 405 if allowsOtherMethod else 404
+            payload = {"success": False, "error": "Method not allowed" if allowsOtherMethod else "Not found"}
+        elif path != "/api/ping" and self.IsUnavailable():
+            status, payload = 503, self.UnavailablePayload
+        else:
+            try:
+                body = json.loads(rawBody.decode("utf-8")) if rawBody.strip() else None
+            except Exception as error:
+                errors.append(f"$: invalid JSON ({error})")
+            if not errors:
+                errors = self.__ValidateRequest(route, body, query, pathParameters)
+
+            if errors:
+                status, payload = 400, {"success": False, "error": errors[0], "errors": errors}
+            else:
+                status, payload = self.__Simulate(route)
+                isStream = status == 200 and route.responseContentType == "text/event-stream"
+
+        # Record before answering so a client that has its response always finds the call.
+        with self._lock:
+            self._calls.append(
+                RecordedCall(
+                    method=method,
+                    path=path,
+                    route=route.pathTemplate if route is not None else path,
+                    query=query,
+                    body=body,
+                    status=status,
+                    receivedAt=receivedAt,
+                    elapsedSeconds=time.monotonic() - receivedAt,
+                    validationErrors=errors,
+                )
+            )
+
+        if isStream and route is not None:
+            self.__Stream(handler, route, query, payload)
+        else:
+            self.__WriteJson(handler, status, payload)
+
+    def __FindRoute(self, method: str, path: str) -> Tuple[Optional[MockRoute], Dict[str, str], bool]:
+        best: Optional[MockRoute] = None
+        bestParameters: Dict[str, str] = {}
+        allowsOtherMethod = False
+        for route in self._routes:
+            parameters = route.Match(path)
+            if parameters is None:
+                continue
+            if route.method != method:
+                allowsOtherMethod = True
+                continue
+            if best is None or route.GetSpecificity() > best.GetSpecificity():
+                best, bestParameters = route, parameters
+        return best, bestParameters, allowsOtherMethod
+
+    def __ValidateRequest(self, route: MockRoute, body: Any, query: Dict[str, str], pathParameters: Dict[str, str]) -> List[str]:
+        errors: List[str] = []
+        if route.requestSchema is not None:
+            if body is None:
+                if route.requestRequired:
+                    errors.append("$: request body is required")
+            else:
+                errors.extend(self._validator.Validate(body, route.requestSchema))
+
+        for location, values in (("query", query), ("path", pathParameters)):
+            for name, schema in route.GetParameterSchemas(location).items():
+                if name not in values:
+                    if schema.get("required"):
+                        errors.append(f"{location}.{name}: is required")
+                    continue
+                coerced = self.__CoerceParameter(values[name], schema)
+                errors.extend(self._validator.Validate(coerced, schema, f"{location}.{name}"))
+        return errors
+
+    def __CoerceParameter(self, raw: str, schema: Dict[str, Any]) -> Any:
+        schemaType = schema.get("type")
+        try:
+            if schemaType == "integer":
+                return int(raw)
+            if schemaType == "number":
+                return float(raw)
+        except ValueError:
+            return raw
+        if schemaType == "boolean" and raw.lower() in ("true", "false"):
+            return raw.lower() == "true"
+        return raw
+
+    def __Simulate(self, route: MockRoute) -> Tuple[int, Any]:
+        with self._lock:
+            behavior = self._routeBehaviors.get(f"{route.method} {route.pathTemplate}", self._defaultBehavior)
+            delay = behavior.latencySeconds + (self._random.uniform(0.0, behavior.jitterSeconds) if behavior.jitterSeconds > 0 else 0.0)
+            isError = behavior.errorRate > 0 and self._random.random() < behavior.errorRate
+
+        if delay > 0:
+            time.sleep(delay)
+        if isError:
+            return behavior.errorStatus, {"success": False, "error": "Simulated failure"}
+        return 200, self._samples.Build(route)
+
+    def __Stream(self, handler: BaseHTTPRequestHandler, route: MockRoute, query: Dict[str, str], sample: Any) -> None:
+        parameters = route.GetParameterSchemas("query")
+        samples = int(query.get("samples", parameters.get("samples", {}).get("default", 1)))
+        intervalSeconds = int(query.get("intervalMs", parameters.get("intervalMs", {}).get("default", 1000))) / 1000.0
+        block = sample if isinstance(sample, str) else f"data: {json.dumps(sample)}\n\n"
+
+        handler.close_connection = True
+        handler.send_response(200)
+        handler.send_header("Content-Type", "text/event-stream")
+        handler.send_header("Cache-Control", "no-cache")
+        handler.send_header("Connection", "close")
+        handler.end_headers()
+        try:
+            for index in range(max(1, samples)):
+                if index > 0:
+                    time.sleep(intervalSeconds)
+                handler.wfile.write(block.encode("utf-8"))
+                handler.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            return
+
+    def __WriteJson(self, handler: BaseHTTPRequestHandler, status: int, payload: Any) -> None:
+        data = json.dumps(payload).encode("utf-8")
+        try:
+            handler.send_response(status)
+            handler.send_header("Content-Type", "application/json")
+            handler.send_header("Content-Length", str(len(data)))
+            handler.end_headers()
+            handler.wfile.write(data)
+        except (BrokenPipeError, ConnectionResetError):
+            handler.close_connection = True
+
+    def __GetTicks(self) -> int:
+        with self._lock:
+            return int(self._clockAnchorTicks + (time.monotonic() - self._clockAnchorAt) * self._ticksPerSecond * self._gameSpeed)
+
+    def __BuildTicks(self) -> Dict[str, Any]:
+        ticks = self.__GetTicks()
+        with self._lock:
+            speed = self._gameSpeed
+        return {
+            "success": True,
+            "ticksGame": ticks,
+            "days": round(ticks / 60000.0, 3),
+            "timeSpeed": speed,
+            "paused": speed == 0,
+        }
+
+    def __BuildProtection(self) -> Dict[str, Any]:
+        return {
+            "success": True,
+            "externalBadEventsActive": False,
+            "allBadIncidentsActive": False,
+            "nowTick": self.__GetTicks(),
+            "externalBadEventsUntilTick": 0,
+            "allBadIncidentsUntilTick": 0,
+        }
+
+
+def Main() -> None:
+    parser = argparse.ArgumentParser(description="Run a local RimAPI stand-in built from Paths/*.json.")
+    parser.add_argument("--paths", default=str(Path(__file__).resolve().parents[3] / "Paths"))
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--unavailable-after", type=float, default=None, help="Start a 503 window after N seconds.")
+    parser.add_argument("--unavailable-for", type=float, default=10.0)
+    arguments = parser.parse_args()
+
+    server = RimApiMockServer(Path(arguments.paths), host=arguments.host)
+    server.SetDefaultBehavior(
+        RouteBehavior(
+            latencySeconds=arguments.latency_ms / 1000.0,
+            jitterSeconds=arguments.jitter_ms / 1000.0,
+            errorRate=arguments.error_rate,
+        )
+    )
+    if arguments.unavailable_after is not None:
+        server.AddUnavailableWindow(arguments.unavailable_after, arguments.unavailable_for)
+
+    port = server.Start(arguments.port)
+    print(f"RimApiMockServer: Serving {len(server.GetRoutes())} routes on http://{arguments.host}:{port}")
+    try:
+        while True:
+            time.sleep(1.0)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.Stop()
+        for route, count in sorted(server.GetCallCounts().items()):
+            print(f"  {count:6d}  {route}")
+
+
+if __name__ == "__main__":
+    Main()
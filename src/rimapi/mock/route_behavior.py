@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class RouteBehavior:
+    """RouteBehavior is the simulated latency and failure profile of a mock route.
+
+    `latencySeconds` plus a uniform `jitterSeconds` is slept before answering;
+    with probability `errorRate` the route answers `errorStatus` instead.
+    """
+
+    latencySeconds: float = 0.0
+    jitterSeconds: float = 0.0
+    errorRate: float = 0.0
+    errorStatus: int = 500
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import copy
+from typing import Any, Callable, Dict, Optional
+
+from src.rimapi.mock.mock_route import MockRoute
+
+
+class SampleResponseBuilder:
+    """SampleResponseBuilder produces a 200 body for a MockRoute.
+
+    Order of preference: a registered dynamic sample for the route, the
+    fragment's documented example, a value generated from the response
+    schema, a built-in sample for read endpoints the app parses (most
+    fragments document no response schema), and finally `{"success": true}`.
+    """
+
+    _BuiltInSamples: Dict[str, Any] = {
+        "GET /api/ping": {"success": True, "message": "pong"},
+        "GET /api/status": {"success": True, "gameLoaded": True, "mapCount": 1, "colonistCount": 3},
+        "GET /api/maps": [{"mapId": 0, "name": "Colony", "isPlayerHome": True}],
+        "GET /api/maps/{mapId}": {"mapId": 0, "name": "Colony", "isPlayerHome": True},
+        "GET /api/factions": [{"defName": "OutlanderCivil", "name": "Outlander Union"}, {"defName": "Pirate", "name": "Pirates"}],
+        "GET /api/colonists": [{"pawnId": 101, "name": "Dani", "kindDefName": "Colonist", "faction": "PlayerColony"}],
+        "GET /api/pawns": [{"pawnId": 101, "name": "Dani", "kindDefName": "Colonist", "faction": "PlayerColony"}],
+        "GET /api/pawns/kinds": [{"defName": "Colonist"}, {"defName": "Villager"}, {"defName": "Mercenary_Gunner"}],
+        "GET /api/raids/catalog": {
+            "raidStrategies": [{"defName": "ImmediateAttack"}, {"defName": "Siege"}],
+            "arrivalModes": [{"defName": "EdgeWalkIn"}, {"defName": "CenterDrop"}],
+            "factions": [{"defName": "Pirate"}, {"defName": "TribeRough"}],
+        },
+        "GET /api/protection": {
+            "success": True,
+            "externalBadEventsActive": False,
+            "allBadIncidentsActive": False,
+            "nowTick": 0,
+            "externalBadEventsUntilTick": 0,
+            "allBadIncidentsUntilTick": 0,
+        },
+    }
+
+    def __init__(self) -> None:
+        self._dynamicSamples: Dict[str, Callable[[], Any]] = {}
+
+    def RegisterDynamic(self, method: str, pathTemplate: str, factory: Callable[[], Any]) -> None:
+        """RegisterDynamic makes a route answer with `factory()` (e.g. a ticking game clock)."""
+
+        self._dynamicSamples[f"{method.upper()} {pathTemplate}"] = factory
+
+    def Build(self, route: MockRoute) -> Any:
+        key = f"{route.method} {route.pathTemplate}"
+        factory = self._dynamicSamples.get(key)
+        if factory is not None:
+            return factory()
+        if route.responseExample is not None:
+            return copy.deepcopy(route.responseExample)
+        if route.responseSchema is not None:
+            return self.FromSchema(route.responseSchema)
+        if key in self._BuiltInSamples:
+            return copy.deepcopy(self._BuiltInSamples[key])
+        return {"success": True}
+
+    def FromSchema(self, schema: Optional[Dict[str, Any]]) -> Any:
+        """FromSchema generates a minimal value that satisfies the schema."""
+
+        if not isinstance(schema, dict):
+            return None
+        if "example" in schema:
+            return copy.deepcopy(schema["example"])
+        if "default" in schema:
+            return copy.deepcopy(schema["default"])
+        if isinstance(schema.get("enum"), list) and schema["enum"]:
+            return schema["enum"][0]
+
+        schemaType = schema.get("type")
+        if schemaType == "object" or "properties" in schema:
+            properties = schema.get("properties") if isinstance(schema.get("properties"), dict) else {}
+            return {name: self.FromSchema(propertySchema) for name, propertySchema in properties.items()}
+        if schemaType == "array":
+            return [self.FromSchema(schema.get("items"))] if isinstance(schema.get("items"), dict) else []
+        if schemaType == "integer":
+            return int(schema.get("minimum", 1))
+        if schemaType == "number":
+            return float(schema.get("minimum", 1.0))
+        if schemaType == "boolean":
+            return False
+        if schemaType == "string":
+            return "sample"
+        return None
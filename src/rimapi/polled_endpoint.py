@@ -0,0 +1,19 @@
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Tuple
+
+from src.rimapi.game_state_value import GameStateValue
+
+
+@dataclass
+class PolledEndpoint:
+    """PolledEndpoint is the scheduler state `GameStateService` keeps per path."""
+
+    path: str
+    watchers: List[Tuple[Callable[[GameStateValue], None], float]] = field(default_factory=list)
+    nextDueAt: float = 0.0
+    inFlight: bool = False
+    latest: Optional[GameStateValue] = None
+
+    def GetIntervalSeconds(self) -> float:
+        # The most demanding watcher sets the pace for everyone.
+        return min((interval for _, interval in self.watchers), default=0.0)
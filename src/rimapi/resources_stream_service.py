@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import http.client
+import json
+import random
+import socket
+import threading
+import time
+import urllib.parse
+from typing import Dict, Optional, Tuple
+
+from src.core.events.event_bus import EventBus
+from src.core.settings.settings_service import SettingsService
+from src.events.resources_snapshot_event import ResourcesSnapshotEvent
+from src.rimapi.server_sent_event import ServerSentEvent
+from src.rimapi.server_sent_event_parser import ServerSentEventParser
+
+
+class ResourcesStreamService:
+    """ResourcesStreamService keeps one long-lived SSE connection to `/api/resources/stream`.
+
+    Every `resources` event is decoded and published as a `ResourcesSnapshotEvent`.
+    RimAPI closes the stream after `samples` snapshots; the service then
+    reconnects right away. Connection failures, non-200 answers (503 while a
+    save loads) and stalled streams reconnect with exponential backoff plus
+    jitter, honouring a server `retry:` hint when one is sent.
+    """
+
+    StreamPath = "/api/resources/stream"
+
+    def __init__(
+        self,
+        settingsService: SettingsService,
+        eventBus: EventBus,
+        samplesPerConnection: int = 600,
+        intervalMs: int = 1000,
+        initialBackoffSeconds: float = 1.0,
+        maxBackoffSeconds: float = 30.0,
+        randomSource: Optional[random.Random] = None,
+    ) -> None:
+        self._settingsService = settingsService
+        self._eventBus = eventBus
+        self._samplesPerConnection = min(600, max(1, int(samplesPerConnection)))
+        self._intervalMs = min(60000, max(100, int(intervalMs)))
+        self._initialBackoffSeconds = max(0.05, float(initialBackoffSeconds))
+        self._maxBackoffSeconds = max(self._initialBackoffSeconds, float(maxBackoffSeconds))
+        self._random = randomSource if randomSource is not None else random.Random()
+
+        self._lock = threading.Lock()
+        self._stopEvent: Optional[threading.Event] = None
+        self._thread: Optional[threading.Thread] = None
+        self._connection: Optional[http.client.HTTPConnection] = None
+        self._latest: Optional[ResourcesSnapshotEvent] = None
+
+    def Start(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            stopEvent = threading.Event()
+            self._stopEvent = stopEvent
+            self._thread = threading.Thread(target=self.__Run, args=(stopEvent,), name="ResourcesStream", daemon=True)
+            self._thread.start()
+
+    def Stop(self) -> None:
+        with self._lock:
+            stopEvent = self._stopEvent
+            thread = self._thread
+            connection = self._connection
+            self._stopEvent = None
+            self._thread = None
+
+        if stopEvent is None:
+            return
+        stopEvent.set()
+        self.__Abort(connection)
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=1.0)
+
+    def Restart(self) -> None:
+        self.Stop()
+        self.Start()
+
+    def IsRunning(self) -> bool:
+        return self._thread is not None
+
+    def GetLatest(self) -> Optional[ResourcesSnapshotEvent]:
+        """GetLatest returns the most recent snapshot (None until one arrives)."""
+
+        return self._latest
+
+    def __Run(self, stopEvent: threading.Event) -> None:
+        parser = ServerSentEventParser()
+        backoffSeconds = self._initialBackoffSeconds
+        while not stopEvent.is_set():
+            receivedAny = False
+            try:
+                receivedAny = self.__Consume(stopEvent, parser)
+                failure = ""
+            except Exception as error:
+                failure = str(error) or type(error).__name__
+            finally:
+                with self._lock:
+                    self._connection = None
+
+            if stopEvent.is_set():
+                return
+            if receivedAny and not failure:
+                # Normal end of stream after `samples` snapshots: reconnect immediately.
+                backoffSeconds = self._initialBackoffSeconds
+                continue
+
+            retryMs = parser.GetRetryMs()
+            delay = max(backoffSeconds, retryMs / 1000.0 if retryMs else 0.0)
+            delay = delay * (0.5 + self._random.random() * 0.5)
+            if failure:
+                print(f"ResourcesStreamService: {failure}; reconnecting in {delay:.1f}s")
+            stopEvent.wait(delay)
+            backoffSeconds = min(self._maxBackoffSeconds, backoffSeconds * 2.0)
+
+    def __Consume(self, stopEvent: threading.Event, parser: ServerSentEventParser) -> bool:
+        host, port = self.__GetEndpoint()
+        # A snapshot every intervalMs; three missed intervals means the stream stalled.
+        readTimeout = self._intervalMs / 1000.0 * 3.0 + 5.0
+        connection = http.client.HTTPConnection(host, port, timeout=readTimeout)
+        with self._lock:
+            if stopEvent.is_set():
+                return False
+            self._connection = connection
+
+        try:
+            query = urllib.parse.urlencode({"samples": self._samplesPerConnection, "intervalMs": self._intervalMs})
+            headers = {"Accept": "text/event-stream", "Cache-Control": "no-cache"}
+            lastEventId = parser.GetLastEventId()
+            if lastEventId:
+                headers["Last-Event-ID"] = lastEventId
+            connection.request("GET", f"{self.StreamPath}?{query}", headers=headers)
+            response = connection.getresponse()
+            if response.status != 200:
+                response.read()
+                raise ConnectionError(f"HTTP {response.status} {response.reason}")
+
+            parser.Reset()
+            receivedAny = False
+            while not stopEvent.is_set():
+                chunk = response.read1(8192)
+                if not chunk:
+                    return receivedAny
+                for event in parser.Feed(chunk):
+                    if self.__Publish(event):
+                        receivedAny = True
+            return receivedAny
+        finally:
+            connection.close()
+
+    def __Publish(self, event: ServerSentEvent) -> bool:
+        if event.event not in ("resources", "message"):
+            return False
+        try:
+            payload = json.loads(event.data)
+        except ValueError:
+            return False
+        if not isinstance(payload, dict):
+            return False
+
+        resources: Dict[str, int] = {}
+        for key, value in payload.items():
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                resources[str(key)] = int(value)
+
+        snapshot = ResourcesSnapshotEvent(resources, time.monotonic())
+        self._latest = snapshot
+        self._eventBus.Publish(snapshot)
+        return True
+
+    def __GetEndpoint(self) -> Tuple[str, int]:
+        try:
+            settings = self._settingsService.Get()
+            host = str(getattr(settings, "rimApiHost", "localhost") or "localhost").strip() or "localhost"
+            port = int(getattr(settings, "rimApiPort", 0) or 0)
+            return host, port if 0 < port <= 65535 else 8765
+        except Exception:
+            return "localhost", 8765
+
+    def __Abort(self, connection: Optional[http.client.HTTPConnection]) -> None:
+        # Unblock a read waiting on the socket from another thread.
+        sock = getattr(connection, "sock", None) if connection is not None else None
+        if sock is None:
+            return
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class ServerSentEvent:
+    """ServerSentEvent is one dispatched `text/event-stream` event."""
+
+    event: str
+    data: str
+    eventId: Optional[str] = None
+    retryMs: Optional[int] = None
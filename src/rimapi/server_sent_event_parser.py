@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import re
+from typing import List, Optional
+
+from src.rimapi.server_sent_event import ServerSentEvent
+
+
+class ServerSentEventParser:
+    """ServerSentEventParser decodes a `text/event-stream` body incrementally.
+
+    Feed it bytes as they arrive; it keeps only the unfinished line and the
+    event being assembled, so memory stays bounded no matter how long the
+    stream runs. Follows the WHATWG rules: CRLF/LF/CR line endings, `:`
+    comments, multi-line `data`, `id`, `retry`, and a blank line dispatches.
+    """
+
+    _LineBreak = re.compile(rb"\r\n|\r|\n")
+
+    def __init__(self) -> None:
+        self._pending = b""
+        self._pendingCarriageReturn = False
+        self._eventType = ""
+        self._dataLines: List[str] = []
+        self._lastEventId: Optional[str] = None
+        self._retryMs: Optional[int] = None
+
+    def Feed(self, chunk: bytes) -> List[ServerSentEvent]:
+        events: List[ServerSentEvent] = []
+        if not chunk:
+            return events
+
+        buffer = self._pending + chunk
+        if self._pendingCarriageReturn and buffer.startswith(b"\n"):
+            # The CR of a CRLF pair ended the previous chunk.
+            buffer = buffer[1:]
+        self._pendingCarriageReturn = False
+
+        start = 0
+        for match in self._LineBreak.finditer(buffer):
+            self.__ProcessLine(buffer[start:match.start()].decode("utf-8", "replace"), events)
+            start = match.end()
+            if match.group() == b"\r" and start == len(buffer):
+                self._pendingCarriageReturn = True
+
+        self._pending = buffer[start:]
+        return events
+
+    def GetLastEventId(self) -> Optional[str]:
+        return self._lastEventId
+
+    def GetRetryMs(self) -> Optional[int]:
+        return self._retryMs
+
+    def Reset(self) -> None:
+        """Reset drops partial input (after a reconnect); the last event id is kept."""
+
+        self._pending = b""
+        self._pendingCarriageReturn = False
+        self._eventType = ""
+        self._dataLines = []
+
+    def __ProcessLine(self, line: str, events: List[ServerSentEvent]) -> None:
+        if line == "":
+            self.__Dispatch(events)
+            return
+        if line.startswith(":"):
+            return
+
+        field, separator, value = line.partition(":")
+        if separator and value.startswith(" "):
+            value = value[1:]
+
+        if field == "event":
+            self._eventType = value
+        elif field == "data":
+            self._dataLines.append(value)
+        elif field == "id":
+            if "\0" not in value:
+                self._lastEventId = value
+        elif field == "retry":
+            if value.isdigit():
+                self._retryMs = int(value)
+
+    def __Dispatch(self, events: List[ServerSentEvent]) -> None:
+        if self._dataLines:
+            events.append(
+                ServerSentEvent(
+                    event=self._eventType or "message",
+                    data="\n".join(self._dataLines),
+                    eventId=self._lastEventId,
+                    retryMs=self._retryMs,
+                )
+            )
+        self._eventType = ""
+        self._dataLines = []
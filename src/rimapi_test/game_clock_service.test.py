@@ -0,0 +1,59 @@
+import sys
+from pathlib import Path
+import unittest
+
+projectRoot = Path(__file__).resolve().parents[2]
+if str(projectRoot) not in sys.path:
+    sys.path.append(str(projectRoot))
+
+from src.rimapi.game_clock_service import GameClockService
+from src.test_support.fake_clock import FakeClock
+
+
+def BuildTicks(tick: int, timeSpeed: int) -> dict:
+    return {"success": True, "ticksGame": tick, "timeSpeed": timeSpeed, "paused": timeSpeed == 0}
+
+
+class GameClockServiceTestCase(unittest.TestCase):
+    def testInterpolatesAndLearnsTheRealTickRate(self) -> None:
+        clock = FakeClock(50.0)
+        service = GameClockService(gameState=None, clock=clock)
+        self.assertIsNone(service.Now())
+
+        # Fast speed nominally runs 180 ticks/s; this colony only manages 150.
+        tick = 1000
+        service.Observe(BuildTicks(tick, 2))
+        for _ in range(10):
+            clock.now += 15.0
+            tick += 150 * 15
+            service.Observe(BuildTicks(tick, 2))
+
+        clock.now += 4.0
+        estimate = service.GetEstimate()
+        self.assertAlmostEqual(estimate.ticksPerSecond, 150.0, delta=1.0)
+        self.assertAlmostEqual(estimate.tick, tick + 600, delta=5)
+        self.assertLessEqual(abs(estimate.tick - (tick + 600)), estimate.errorTicks)
+        self.assertAlmostEqual(service.SecondsUntil(tick + 600 + 1500), 10.0, delta=0.2)
+
+    def testPauseAndSpeedChangesResync(self) -> None:
+        clock = FakeClock(50.0)
+        service = GameClockService(gameState=None, clock=clock)
+        self.assertFalse(service.Observe(BuildTicks(0, 1)))
+
+        clock.now += 5.0
+        self.assertTrue(service.Observe(BuildTicks(300, 0)))
+        clock.now += 30.0
+        self.assertEqual(service.Now(), 300)
+        self.assertIsNone(service.SecondsUntil(1000))
+
+        self.assertTrue(service.Observe(BuildTicks(300, 3)))
+        clock.now += 1.0
+        self.assertEqual(service.Now(), 300 + 360)
+
+        # A sample far outside the error bound re-anchors the estimate.
+        self.assertTrue(service.Observe(BuildTicks(5000, 3)))
+        self.assertEqual(service.Now(), 5000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import sys
+import time
+from pathlib import Path
+
+projectRoot = Path(__file__).resolve().parents[2]
+if str(projectRoot) not in sys.path:
+    sys.path.append(str(projectRoot))
+
+from src.game_events.game_event_executor import GameEventExecutor
+from src.game_events.game_event_repository import GameEventRepository
+from src.game_events.jsonc_document_loader import JsoncDocumentLoader
+from src.rimapi.mock.rimapi_mock_server import RimApiMockServer
+from src.rimapi.mock.route_behavior import RouteBehavior
+from src.window.async_event_loop_thread import AsyncEventLoopThread
+from src.window.rest_api_client import RestApiClient
+
+
+def Main() -> None:
+    """Run every shipped definition against the mock RimAPI and report throughput.
+
+    Usage: game_event_throughput.bench.py [rounds] [latencyMs]
+    """
+
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    latencyMs = float(sys.argv[2]) if len(sys.argv) > 2 else 5.0
+
+    server = RimApiMockServer(projectRoot / "Paths")
+    server.SetDefaultBehavior(RouteBehavior(latencySeconds=latencyMs / 1000.0, jitterSeconds=latencyMs / 2000.0))
+    port = server.Start()
+
+    definitions = [entry.definition for entry in GameEventRepository(projectRoot / "game_event_definitions", JsoncDocumentLoader()).LoadAll()]
+    eventLoop = AsyncEventLoopThread()
+    executor = GameEventExecutor(RestApiClient(), eventLoop)
+
+    try:
+        started = time.perf_counter()
+        for _ in range(rounds):
+            for definition in definitions:
+                executor.Execute("127.0.0.1", port, definition)
+        sequential = time.perf_counter() - started
+
+        server.ResetCalls()
+        started = time.perf_counter()
+        futures = [executor.Submit("127.0.0.1", port, definition) for _ in range(rounds) for definition in definitions]
+        for future in futures:
+            future.result(timeout=60)
+        concurrent = time.perf_counter() - started
+
+        executions = rounds * len(definitions)
+        calls = server.GetCalls()
+        rejected = [call for call in calls if call.status != 200]
+        print(f"definitions={len(definitions)} rounds={rounds} latency={latencyMs}ms")
+        print(f"sequential Execute   {executions} events  {sequential * 1000:8.1f} ms  {executions / sequential:8.1f} events/s")
+        print(f"concurrent Submit    {executions} events  {concurrent * 1000:8.1f} ms  {executions / concurrent:8.1f} events/s")
+        print(f"requests={len(calls)} non-200={len(rejected)}")
+        for call in rejected[:10]:
+            print(f"  {call.status} {call.method} {call.path}: {'; '.join(call.validationErrors)}")
+    finally:
+        executor.Close()
+        eventLoop.Stop()
+        server.Stop()
+
+
+if __name__ == "__main__":
+    Main()
@@ -0,0 +1,81 @@
+import sys
+import threading
+import time
+from pathlib import Path
+import unittest
+
+projectRoot = Path(__file__).resolve().parents[2]
+if str(projectRoot) not in sys.path:
+    sys.path.append(str(projectRoot))
+
+from src.rimapi.game_state_service import GameStateService
+from src.rimapi.mock.rimapi_mock_server import RimApiMockServer
+from src.rimapi.mock.route_behavior import RouteBehavior
+from src.window.rest_api_client import RestApiClient
+
+
+class GameStateServiceTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = RimApiMockServer(projectRoot / "Paths")
+        port = self.server.Start()
+        self.client = RestApiClient()
+        self.service = GameStateService(self.client, lambda: ("127.0.0.1", port))
+        self.service.Start()
+
+    def tearDown(self) -> None:
+        self.service.Stop()
+        self.client.Close()
+        self.server.Stop()
+
+    def __CountCalls(self, route: str) -> int:
+        return self.server.GetCallCounts().get(f"GET {route}", 0)
+
+    def testNotifiesOnlyWhenValueChanges(self) -> None:
+        self.server.SetGameSpeed(0)
+        changes = []
+        self.service.Watch("/api/protection", changes.append, intervalSeconds=0.05)
+        deadline = time.monotonic() + 5.0
+        while self.__CountCalls("/api/protection") < 4 and time.monotonic() < deadline:
+            time.sleep(0.02)
+
+        self.assertGreaterEqual(self.__CountCalls("/api/protection"), 4)
+        self.assertEqual(len(changes), 1)
+        self.assertEqual(changes[0].value["success"], True)
+
+        self.server.SetGameSpeed(1)
+        deadline = time.monotonic() + 5.0
+        while len(changes) < 2 and time.monotonic() < deadline:
+            time.sleep(0.02)
+        self.assertGreaterEqual(len(changes), 2)
+
+    def testSharesOneInFlightRequestAcrossWatchersAndRefreshes(self) -> None:
+        self.server.SetDefaultBehavior(RouteBehavior(latencySeconds=0.3))
+        first = threading.Event()
+        second = threading.Event()
+        self.service.Watch("/api/status", lambda value: first.set(), intervalSeconds=60.0)
+        self.service.Watch("/api/status", lambda value: second.set(), intervalSeconds=60.0)
+        for _ in range(10):
+            self.service.Refresh("/api/status")
+
+        self.assertTrue(first.wait(5.0))
+        self.assertTrue(second.wait(5.0))
+        self.assertEqual(self.__CountCalls("/api/status"), 1)
+
+    def testRestartPollsPathsThatWereInFlightAtStop(self) -> None:
+        self.server.SetDefaultBehavior(RouteBehavior(latencySeconds=0.3))
+        self.service.Watch("/api/status", lambda value: None, intervalSeconds=60.0)
+        deadline = time.monotonic() + 5.0
+        while self.__CountCalls("/api/status") < 1 and time.monotonic() < deadline:
+            time.sleep(0.02)
+        self.service.Stop()
+
+        self.server.SetDefaultBehavior(RouteBehavior())
+        self.service.Start()
+        deadline = time.monotonic() + 5.0
+        while self.__CountCalls("/api/status") < 2 and time.monotonic() < deadline:
+            time.sleep(0.02)
+        self.assertEqual(self.__CountCalls("/api/status"), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
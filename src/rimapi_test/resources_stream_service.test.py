@@ -0,0 +1,67 @@
+import sys
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+import unittest
+
+projectRoot = Path(__file__).resolve().parents[2]
+if str(projectRoot) not in sys.path:
+    sys.path.append(str(projectRoot))
+
+from src.core.events.event_bus import EventBus
+from src.events.resources_snapshot_event import ResourcesSnapshotEvent
+from src.rimapi.mock.rimapi_mock_server import RimApiMockServer
+from src.rimapi.resources_stream_service import ResourcesStreamService
+from src.rimapi.server_sent_event_parser import ServerSentEventParser
+
+
+class StaticSettingsService:
+    def __init__(self, port: int) -> None:
+        self._settings = SimpleNamespace(rimApiHost="127.0.0.1", rimApiPort=port)
+
+    def Get(self) -> SimpleNamespace:
+        return self._settings
+
+
+class ResourcesStreamServiceTestCase(unittest.TestCase):
+    def testParserHandlesSplitChunks(self) -> None:
+        parser = ServerSentEventParser()
+        stream = b": keep-alive\r\nevent: resources\r\ndata: {\"silver\":\r\ndata: 5}\r\nid: 7\r\nretry: 1500\r\n\r\ndata: plain\n\n"
+        events = []
+        for index in range(len(stream)):
+            events.extend(parser.Feed(stream[index:index + 1]))
+
+        self.assertEqual([(event.event, event.data) for event in events], [("resources", "{\"silver\":\n5}"), ("message", "plain")])
+        self.assertEqual(events[0].eventId, "7")
+        self.assertEqual(parser.GetRetryMs(), 1500)
+
+    def testPublishesSnapshotsAndReconnectsAfterStreamEnds(self) -> None:
+        server = RimApiMockServer(projectRoot / "Paths")
+        port = server.Start()
+        eventBus = EventBus()
+        received = []
+        enough = threading.Event()
+
+        def onSnapshot(event: ResourcesSnapshotEvent) -> None:
+            received.append(event)
+            if len(received) >= 3:
+                enough.set()
+
+        eventBus.Subscribe(ResourcesSnapshotEvent, onSnapshot)
+        service = ResourcesStreamService(StaticSettingsService(port), eventBus, samplesPerConnection=2, intervalMs=100)
+        try:
+            service.Start()
+            self.assertTrue(enough.wait(5.0))
+        finally:
+            service.Stop()
+            server.Stop()
+
+        self.assertEqual(received[0].resources["silver"], 1500)
+        self.assertEqual(received[0].resources["mapCount"], 2)
+        streamCalls = [call for call in server.GetCalls() if call.route == "/api/resources/stream"]
+        self.assertGreaterEqual(len(streamCalls), 2)
+        self.assertFalse(service.IsRunning())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import http.client
+import json
+import sys
+from pathlib import Path
+import unittest
+
+projectRoot = Path(__file__).resolve().parents[2]
+if str(projectRoot) not in sys.path:
+    sys.path.append(str(projectRoot))
+
+from src.rimapi.mock.rimapi_mock_server import RimApiMockServer
+from src.rimapi.mock.route_behavior import RouteBehavior
+
+
+class RimApiMockServerTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self._server = RimApiMockServer(projectRoot / "Paths")
+        self._port = self._server.Start()
+
+    def tearDown(self) -> None:
+        self._server.Stop()
+
+    def __Call(self, method: str, target: str, body: object = None):
+        connection = http.client.HTTPConnection("127.0.0.1", self._port, timeout=5)
+        try:
+            data = json.dumps(body).encode("utf-8") if body is not None else None
+            connection.request(method, target, body=data, headers={"Content-Type": "application/json"})
+            response = connection.getresponse()
+            return response.status, response.read().decode("utf-8")
+        finally:
+            connection.close()
+
+    def testValidatesRequestBodiesAgainstSchemas(self) -> None:
+        status, _ = self.__Call("POST", "/api/incidents/execute", {"mapId": 0, "incidentDefName": "Eclipse", "silent": True})
+        self.assertEqual(status, 200)
+
+        status, body = self.__Call("POST", "/api/incidents/execute", {"mapId": "0", "silent": "yes"})
+        self.assertEqual(status, 400)
+        errors = json.loads(body)["errors"]
+        self.assertIn("$.incidentDefName: is required", errors)
+        self.assertTrue(any(error.startswith("$.mapId: expected integer") for error in errors))
+
+        calls = self._server.GetCalls()
+        self.assertEqual([call.status for call in calls], [200, 400])
+        self.assertEqual(calls[0].route, "/api/incidents/execute")
+        self.assertEqual(calls[0].body["incidentDefName"], "Eclipse")
+
+    def testLiteralRoutesWinOverPlaceholders(self) -> None:
+        status, body = self.__Call("GET", "/api/pawns/kinds?presentOnly=true")
+        self.assertEqual(status, 200)
+        self.assertIsInstance(json.loads(body), list)
+        self.assertEqual(self._server.GetCalls()[-1].route, "/api/pawns/kinds")
+
+        status, _ = self.__Call("GET", "/api/maps/abc")
+        self.assertEqual(status, 400)
+
+    def testUnavailableWindowAndInjectedErrors(self) -> None:
+        self._server.AddUnavailableWindow(0.0, 60.0)
+        self.assertEqual(self.__Call("GET", "/api/status")[0], 503)
+        self.assertEqual(self.__Call("GET", "/api/ping")[0], 200)
+        self._server.ClearUnavailableWindows()
+
+        self._server.SetRouteBehavior("GET", "/api/maps", RouteBehavior(errorRate=1.0, errorStatus=500))
+        self.assertEqual(self.__Call("GET", "/api/maps")[0], 500)
+        self.assertEqual(self.__Call("GET", "/api/status")[0], 200)
+
+    def testStreamsEventSamples(self) -> None:
+        status, body = self.__Call("GET", "/api/resources/stream?samples=3&intervalMs=100")
+        self.assertEqual(status, 200)
+        self.assertEqual(body.count("event: resources"), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
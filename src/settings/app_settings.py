@@ -14,6 +14,8 @@ class AppSettings:
         uiLanguage: str = "en",
         purchasesEnabled: bool = True,
         purchasesWebPort: int = 8080,
+        requestTracingEnabled: bool = False,
+        balanceStorage: str = "json",
     ) -> None:
         self.borderless = borderless  # borderless overlay toggle
         self.twitchToken = twitchToken  # oauth token for twitch chat
@@ -26,3 +28,5 @@ class AppSettings:
         self.uiLanguage = uiLanguage  # UI language code (e.g. 'en')
         self.purchasesEnabled = purchasesEnabled  # enable chat purchases system
         self.purchasesWebPort = purchasesWebPort  # port for events web server
+        self.requestTracingEnabled = requestTracingEnabled  # record RimAPI request timings, written out on exit
+        self.balanceStorage = balanceStorage  # silver balance backend: 'json' (ledger) or 'sqlite'
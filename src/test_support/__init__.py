@@ -0,0 +1 @@
+# Test support - helpers shared by the *_test suites
@@ -0,0 +1,8 @@
+class FakeClock:
+    """FakeClock stands in for `time.monotonic`; tests move time by setting `now`."""
+
+    def __init__(self, now: float = 100.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
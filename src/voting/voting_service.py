@@ -2,6 +2,7 @@ from typing import Dict, List, Tuple
 
 from src.events.close_overlay_event import CloseOverlayEvent
 from src.core.events.event_bus import EventBus
+from src.events.poll_started_event import PollStartedEvent
 from src.events.show_overlay_event import ShowOverlayEvent
 from src.game_events.game_event_catalog_service import GameEventCatalogService
 from src.game_events.game_event_definition import GameEventDefinition
@@ -50,6 +51,10 @@ class VotingService:
         self._counts = [0 for _ in self._activeOptions]
         self._userVotes = {}
         self._recentVoters = []
+        try:
+            self.eventBus.Publish(PollStartedEvent(self._activeOptions))
+        except Exception as error:
+            print(f"VotingService: Failed to publish poll start: {error}")
         self.__Publish()
 
     def StopPoll(self) -> None:
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+
+
+CoroutineResult = TypeVar("CoroutineResult")
+
+
+class AsyncEventLoopThread:
+    """AsyncEventLoopThread runs one shared asyncio loop on a daemon thread.
+
+    Blocking callers (Tk handlers, the Twitch thread, test runners) submit
+    coroutines and get a `concurrent.futures.Future` back, so many executions
+    share a single loop instead of each spawning its own thread.
+    """
+
+    def __init__(self, name: str = "StreamApiAsyncLoop") -> None:
+        self._name = name
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def Submit(self, coroutine: Coroutine[Any, Any, CoroutineResult]) -> "concurrent.futures.Future[CoroutineResult]":
+        """Submit schedules the coroutine on the shared loop (starting it on first use)."""
+
+        loop = self.__EnsureStarted()
+        return asyncio.run_coroutine_threadsafe(coroutine, loop)
+
+    def Run(self, coroutine: Coroutine[Any, Any, CoroutineResult], timeoutSeconds: Optional[float] = None) -> CoroutineResult:
+        """Run blocks until the coroutine finishes on the shared loop.
+
+        Must not be called from the loop thread itself.
+        """
+
+        if self.IsLoopThread():
+            coroutine.close()
+            raise RuntimeError("AsyncEventLoopThread.Run cannot block on its own loop thread")
+
+        future = self.Submit(coroutine)
+        try:
+            return future.result(timeout=timeoutSeconds)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+    def IsLoopThread(self) -> bool:
+        thread = self._thread
+        return thread is not None and threading.get_ident() == thread.ident
+
+    def Stop(self) -> None:
+        with self._lock:
+            loop = self._loop
+            thread = self._thread
+            self._loop = None
+            self._thread = None
+
+        if loop is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=2.0)
+
+    def __EnsureStarted(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is not None:
+                return self._loop
+
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+
+            def runLoop() -> None:
+                asyncio.set_event_loop(loop)
+                loop.call_soon(ready.set)
+                try:
+                    loop.run_forever()
+                finally:
+                    try:
+                        loop.close()
+                    except Exception:
+                        pass
+
+            thread = threading.Thread(target=runLoop, name=self._name, daemon=True)
+            thread.start()
+            ready.wait()
+
+            self._loop = loop
+            self._thread = thread
+            return loop
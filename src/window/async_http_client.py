@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from src.window.http_connection_pool import HttpResponseData
+from src.window.request_tracer import RequestTrace
+
+
+class _RequestNotSent(Exception):
+    """Raised (from the socket error) when a request failed before it was written."""
+
+
+class _PooledStream:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.reader = reader
+        self.writer = writer
+
+    def Close(self) -> None:
+        try:
+            self.writer.close()
+        except Exception:
+            pass
+
+
+class AsyncHttpClient:
+    """AsyncHttpClient is a minimal HTTP/1.1 client on asyncio streams.
+
+    Keeps idle keep-alive connections per (host, port) and limits in-flight
+    requests per endpoint with a semaphore, so a burst of purchases or test
+    runs cannot flood RimAPI. Each request has its own timeout; cancelling
+    the awaiting task closes the connection it was using. Must be used from
+    a single event loop.
+
+    A stale pooled connection is retried once on a fresh one only when the
+    request was never written or the method is idempotent; a POST the
+    server may already have run is not repeated.
+    """
+
+    IdempotentMethods = frozenset({"GET", "HEAD", "OPTIONS"})
+    _StaleErrors = (asyncio.IncompleteReadError, ConnectionResetError, ConnectionAbortedError, BrokenPipeError)
+
+    def __init__(self, maxConcurrentPerEndpoint: int = 4, maxIdlePerEndpoint: int = 4, connectTimeoutSeconds: float = 5.0) -> None:
+        self._maxConcurrentPerEndpoint = max(1, int(maxConcurrentPerEndpoint))
+        self._maxIdlePerEndpoint = max(0, int(maxIdlePerEndpoint))
+        self._connectTimeoutSeconds = float(connectTimeoutSeconds) if float(connectTimeoutSeconds) > 0 else 5.0
+        self._semaphores: Dict[Tuple[str, int], asyncio.Semaphore] = {}
+        self._idle: Dict[Tuple[str, int], List[_PooledStream]] = {}
+
+    async def Request(
+        self,
+        host: str,
+        port: int,
+        method: str,
+        target: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        timeoutSeconds: float = 10.0,
+        trace: Optional[RequestTrace] = None,
+    ) -> HttpResponseData:
+        """Request performs one HTTP call; raises asyncio.TimeoutError / OSError on failure.
+
+        Phase timings (semaphore wait included as queue time) are added to `trace` when given.
+        """
+
+        key = (str(host), int(port))
+        semaphore = self._semaphores.get(key)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self._maxConcurrentPerEndpoint)
+            self._semaphores[key] = semaphore
+
+        timeout = float(timeoutSeconds) if float(timeoutSeconds) > 0 else None
+        if trace is None:
+            async with semaphore:
+                return await asyncio.wait_for(self.__RequestWithRetry(key, method, target, body, headers, timeout, None), timeout)
+
+        queuedAt = time.monotonic()
+        async with semaphore:
+            trace.queue += time.monotonic() - queuedAt
+            return await asyncio.wait_for(self.__RequestWithRetry(key, method, target, body, headers, timeout, trace), timeout)
+
+    async def CloseAll(self) -> None:
+        pooled = [stream for streams in self._idle.values() for stream in streams]
+        self._idle = {}
+        for stream in pooled:
+            stream.Close()
+
+    def GetIdleCount(self, host: str, port: int) -> int:
+        return len(self._idle.get((str(host), int(port)), []))
+
+    async def __RequestWithRetry(
+        self,
+        key: Tuple[str, int],
+        method: str,
+        target: str,
+        body: Optional[bytes],
+        headers: Optional[Mapping[str, str]],
+        timeout: Optional[float],
+        trace: Optional[RequestTrace],
+    ) -> HttpResponseData:
+        stream = self.__TakeIdle(key)
+        if stream is not None:
+            try:
+                return await self.__Exchange(key, stream, method, target, body, headers, trace)
+            except _RequestNotSent:
+                # Pooled socket was closed by the server while idle; retry once on a fresh one.
+                pass
+            except self._StaleErrors:
+                # The request went out; only repeat it when doing so is harmless.
+                if str(method).upper() not in self.IdempotentMethods:
+                    raise
+
+        connectTimeout = min(self._connectTimeoutSeconds, timeout) if timeout is not None else self._connectTimeoutSeconds
+        connectStartedAt = time.monotonic() if trace is not None else 0.0
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(key[0], key[1]), connectTimeout)
+        if trace is not None:
+            trace.connect += time.monotonic() - connectStartedAt
+        try:
+            return await self.__Exchange(key, _PooledStream(reader, writer), method, target, body, headers, trace)
+        except _RequestNotSent as error:
+            raise error.__cause__ from None
+
+    async def __Exchange(
+        self,
+        key: Tuple[str, int],
+        stream: _PooledStream,
+        method: str,
+        target: str,
+        body: Optional[bytes],
+        headers: Optional[Mapping[str, str]],
+        trace: Optional[RequestTrace],
+    ) -> HttpResponseData:
+        keepStream = False
+        try:
+            sentAt = time.monotonic() if trace is not None else 0.0
+            try:
+                if stream.writer.is_closing():
+                    raise ConnectionResetError("Connection closed before request")
+                stream.writer.write(self.__EncodeRequest(key, method, target, body, headers))
+                await stream.writer.drain()
+            except self._StaleErrors as error:
+                raise _RequestNotSent() from error
+
+            status, reason, responseHeaders, keepAlive = await self.__ReadHead(stream.reader)
+            headersAt = time.monotonic() if trace is not None else 0.0
+            data = await self.__ReadBody(stream.reader, method, status, responseHeaders)
+            if trace is not None:
+                trace.firstByte += headersAt - sentAt
+                trace.body += time.monotonic() - headersAt
+                trace.status = status
+                trace.bytes = len(data)
+            if "content-length" not in responseHeaders and "chunked" not in responseHeaders.get("transfer-encoding", "").lower():
+                keepAlive = False
+
+            keepStream = keepAlive
+            return HttpResponseData(status=status, reason=reason, body=data, headers=responseHeaders)
+        finally:
+            if keepStream:
+                self.__Release(key, stream)
+            else:
+                stream.Close()
+
+    def __EncodeRequest(self, key: Tuple[str, int], method: str, target: str, body: Optional[bytes], headers: Optional[Mapping[str, str]]) -> bytes:
+        lines = [f"{method} {target} HTTP/1.1", f"Host: {key[0]}:{key[1]}", "Accept-Encoding: identity"]
+        hasContentLength = False
+        for name, value in dict(headers or {}).items():
+            if str(name).lower() == "content-length":
+                hasContentLength = True
+            lines.append(f"{name}: {value}")
+        if body is not None or method in ("POST", "PUT", "PATCH"):
+            if not hasContentLength:
+                lines.append(f"Content-Length: {len(body or b'')}")
+        head = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+        return head + (body or b"")
+
+    async def __ReadHead(self, reader: asyncio.StreamReader) -> Tuple[int, str, Dict[str, str], bool]:
+        while True:
+            statusLine = await reader.readline()
+            if not statusLine:
+                raise ConnectionResetError("Connection closed before response")
+
+            parts = statusLine.decode("latin-1").strip().split(" ", 2)
+            if len(parts) < 2 or not parts[0].startswith("HTTP/"):
+                raise ConnectionResetError(f"Malformed status line: {statusLine!r}")
+            version = parts[0]
+            status = int(parts[1])
+            reason = parts[2] if len(parts) > 2 else ""
+
+            responseHeaders: Dict[str, str] = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                responseHeaders[name.strip().lower()] = value.strip()
+
+            # Skip interim 1xx responses (e.g. 100 Continue).
+            if 100 <= status < 200:
+                continue
+
+            connectionHeader = responseHeaders.get("connection", "").lower()
+            if version == "HTTP/1.0":
+                keepAlive = connectionHeader == "keep-alive"
+            else:
+                keepAlive = connectionHeader != "close"
+            return status, reason, responseHeaders, keepAlive
+
+    async def __ReadBody(self, reader: asyncio.StreamReader, method: str, status: int, responseHeaders: Dict[str, str]) -> bytes:
+        if method == "HEAD" or status in (204, 304):
+            return b""
+
+        if "chunked" in responseHeaders.get("transfer-encoding", "").lower():
+            chunks: List[bytes] = []
+            while True:
+                sizeLine = await reader.readline()
+                size = int(sizeLine.split(b";", 1)[0].strip() or b"0", 16)
+                if size == 0:
+                    # Drain optional trailers.
+                    while True:
+                        trailer = await reader.readline()
+                        if trailer in (b"\r\n", b"\n", b""):
+                            break
+                    return b"".join(chunks)
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+
+        contentLength = responseHeaders.get("content-length")
+        if contentLength is not None:
+            return await reader.readexactly(int(contentLength))
+        return await reader.read()
+
+    def __TakeIdle(self, key: Tuple[str, int]) -> Optional[_PooledStream]:
+        streams = self._idle.get(key)
+        while streams:
+            stream = streams.pop()
+            if not stream.reader.at_eof() and not stream.writer.is_closing():
+                return stream
+            stream.Close()
+        return None
+
+    def __Release(self, key: Tuple[str, int], stream: _PooledStream) -> None:
+        streams = self._idle.setdefault(key, [])
+        if len(streams) < self._maxIdlePerEndpoint:
+            streams.append(stream)
+            return
+        stream.Close()
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import tkinter as tk
 from tkinter import ttk
-from typing import Dict, List, Tuple
 
 from src.purchases.interfaces.balance_service_interface import BalanceServiceInterface
 from src.core.localization.localizer import Localizer
@@ -10,12 +9,17 @@ from src.window.theme import Theme
 
 
 class BalancesTabController:
+    PageSize = 200
+
     def __init__(self, balanceService: BalanceServiceInterface, localizer: Localizer) -> None:
         self._balanceService = balanceService
         self._localizer = localizer
         self._tree: ttk.Treeview | None = None
         self._countLabel: tk.Label | None = None
         self._emptyLabel: tk.Label | None = None
+        self._previousButton: ttk.Button | None = None
+        self._nextButton: ttk.Button | None = None
+        self._pageOffset = 0
 
     def Build(self, parent: tk.Frame) -> None:
         palette = Theme.Palette
@@ -46,6 +50,22 @@ class BalancesTabController:
         )
         refreshButton.pack(side=tk.RIGHT, padx=(0, 8))
 
+        self._nextButton = ttk.Button(
+            header,
+            text=self._localizer.Text("balances.button.next"),
+            command=lambda: self._ChangePage(1),
+            style="Neutral.TButton",
+        )
+        self._nextButton.pack(side=tk.RIGHT, padx=(0, 8))
+
+        self._previousButton = ttk.Button(
+            header,
+            text=self._localizer.Text("balances.button.previous"),
+            command=lambda: self._ChangePage(-1),
+            style="Neutral.TButton",
+        )
+        self._previousButton.pack(side=tk.RIGHT, padx=(0, 4))
+
         body = tk.Frame(parent, bg=palette.surfaceDeep)
         body.grid(row=1, column=0, sticky="nsew", padx=10, pady=(0, 10))
         body.columnconfigure(0, weight=1)
@@ -87,13 +107,15 @@ class BalancesTabController:
         self.Refresh()
 
     def Refresh(self) -> None:
-        balances = self._balanceService.GetAllBalances()
-        rows = self._SortBalances(balances)
-
         tree = self._tree
         if tree is None:
             return
 
+        total = self._balanceService.CountBalances()
+        if self._pageOffset >= total:
+            self._pageOffset = max(0, (total - 1) // self.PageSize * self.PageSize)
+        rows = self._balanceService.GetBalancesPage(self._pageOffset, self.PageSize)
+
         for itemId in tree.get_children():
             tree.delete(itemId)
 
@@ -102,7 +124,16 @@ class BalancesTabController:
             tree.insert("", tk.END, values=(username, balance), tags=(tag,))
 
         if self._countLabel is not None:
-            self._countLabel.config(text=str(len(rows)))
+            if total > self.PageSize:
+                text = self._localizer.Text("balances.count.page", first=self._pageOffset + 1, last=self._pageOffset + len(rows), total=total)
+            else:
+                text = str(total)
+            self._countLabel.config(text=text)
+
+        if self._previousButton is not None:
+            self._previousButton.state(["!disabled"] if self._pageOffset > 0 else ["disabled"])
+        if self._nextButton is not None:
+            self._nextButton.state(["!disabled"] if self._pageOffset + len(rows) < total else ["disabled"])
 
         if self._emptyLabel is not None:
             if rows:
@@ -110,6 +141,6 @@ class BalancesTabController:
             else:
                 self._emptyLabel.lift()
 
-    def _SortBalances(self, balances: Dict[str, int]) -> List[Tuple[str, int]]:
-        rows = [(str(username), int(balance)) for username, balance in balances.items()]
-        return sorted(rows, key=lambda item: (-item[1], item[0].lower()))
\ No newline at end of file
+    def _ChangePage(self, direction: int) -> None:
+        self._pageOffset = max(0, self._pageOffset + direction * self.PageSize)
+        self.Refresh()
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import json
+import urllib.parse
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+
+class EncodedHttpRequest:
+    """EncodedHttpRequest is a request rendered down to what goes on the wire.
+
+    `target` is the path with placeholders substituted and the query attached;
+    `body` is the already serialized payload (None for bodiless requests);
+    `route` is the unrendered path template, used to group latency traces.
+    Treat instances as read-only: one encoding is sent any number of times.
+    """
+
+    def __init__(self, method: str, target: str, body: Optional[bytes] = None, contentType: Optional[str] = None, route: Optional[str] = None) -> None:
+        self.method = (method or "GET").upper()
+        self.target = target or "/"
+        self.body = body
+        self.contentType = contentType
+        self.route = route if route else self.target.split("?", 1)[0]
+
+    @staticmethod
+    def Encode(method: str, pathTemplate: str, payloadKind: str, params: Optional[Mapping[str, Any]]) -> "EncodedHttpRequest":
+        """Encode renders a request once, keeping JSON values typed.
+
+        `{name}` placeholders in the path are filled from params and removed
+        from the payload. Remaining params go to the query string for GET and
+        `query` payloads, otherwise into a JSON body as-is (numbers, booleans,
+        lists and nested objects are not stringified).
+        """
+
+        safeMethod = (method or "GET").upper()
+        route = str(pathTemplate or "/")
+        path, remaining = EncodedHttpRequest.RenderPath(route, params)
+
+        if safeMethod == "GET" or payloadKind != "json":
+            target = EncodedHttpRequest.AttachQuery(path, remaining)
+            body = None if safeMethod == "GET" else b""
+            return EncodedHttpRequest(safeMethod, target, body, route=route)
+
+        data = json.dumps(remaining).encode("utf-8")
+        return EncodedHttpRequest(safeMethod, path, data, "application/json", route=route)
+
+    @staticmethod
+    def RenderPath(pathTemplate: str, params: Optional[Mapping[str, Any]]) -> Tuple[str, Dict[str, Any]]:
+        rendered = pathTemplate
+        remaining: Dict[str, Any] = {str(key): value for key, value in dict(params or {}).items()}
+        for key, value in list(remaining.items()):
+            placeholder = "{" + key + "}"
+            if placeholder in rendered:
+                rendered = rendered.replace(placeholder, urllib.parse.quote(str(value)))
+                del remaining[key]
+        return rendered, remaining
+
+    @staticmethod
+    def AttachQuery(path: str, params: Mapping[str, Any]) -> str:
+        if not params:
+            return path
+        encoded = urllib.parse.urlencode({str(key): str(value) for key, value in params.items()})
+        return f"{path}?{encoded}"
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Literal, Optional, Tuple
+
+
+CircuitDecision = Literal["allow", "probe", "reject"]
+
+
+class _EndpointHealth:
+    def __init__(self) -> None:
+        self.consecutiveFailures = 0
+        self.isOpen = False
+        self.retryAt = 0.0
+        self.openSeconds = 0.0
+        self.isProbing = False
+
+
+class _LatencyWindow:
+    def __init__(self, size: int) -> None:
+        self.latencies: Deque[float] = deque(maxlen=size)
+        self.cachedPercentile: Optional[float] = None
+
+
+class EndpointHealthTracker:
+    """EndpointHealthTracker is a per-(host, port) circuit breaker with latency stats.
+
+    After `failureThreshold` consecutive failures the circuit opens and callers
+    are rejected without touching the network. Once the open period passes,
+    exactly one caller gets a "probe" decision and is expected to check the
+    endpoint (e.g. `GET /api/status`) and report back via `RecordProbe`; a
+    failed probe doubles the open period up to `maxOpenSeconds`.
+
+    `GetTimeout` derives a request timeout from recent successful latencies
+    of the same route (method + templated path), a high percentile times a
+    safety factor, clamped between `minTimeoutSeconds` and the caller's
+    configured default. Fast status polls therefore never shrink the timeout
+    of a large catalog GET, and non-idempotent requests always get the full
+    default because a retry after a premature timeout could repeat them.
+    """
+
+    UnavailableMessage = "game unavailable (RimAPI is not responding)"
+    _IdempotentMethods = ("GET", "HEAD", "OPTIONS")
+
+    def __init__(
+        self,
+        failureThreshold: int = 3,
+        openSeconds: float = 5.0,
+        maxOpenSeconds: float = 30.0,
+        minTimeoutSeconds: float = 3.0,
+        latencyPercentile: float = 0.95,
+        latencyMultiplier: float = 4.0,
+        minLatencySamples: int = 8,
+        latencyWindow: int = 64,
+        clock: Optional[Callable[[], float]] = None,
+    ) -> None:
+        self._failureThreshold = max(1, int(failureThreshold))
+        self._openSeconds = max(0.0, float(openSeconds))
+        self._maxOpenSeconds = max(self._openSeconds, float(maxOpenSeconds))
+        self._minTimeoutSeconds = max(0.1, float(minTimeoutSeconds))
+        self._latencyPercentile = min(1.0, max(0.0, float(latencyPercentile)))
+        self._latencyMultiplier = max(1.0, float(latencyMultiplier))
+        self._minLatencySamples = max(1, int(minLatencySamples))
+        self._latencyWindow = max(self._minLatencySamples, int(latencyWindow))
+        self._clock = clock if clock is not None else time.monotonic
+        self._lock = threading.Lock()
+        self._endpoints: Dict[Tuple[str, int], _EndpointHealth] = {}
+        self._routes: Dict[Tuple[str, int, str, str], _LatencyWindow] = {}
+
+    def Decide(self, host: str, port: int) -> CircuitDecision:
+        """Decide says whether a request may go out now.
+
+        "allow": circuit closed. "reject": circuit open, fail fast.
+        "probe": open period elapsed and this caller should check health first.
+        """
+
+        with self._lock:
+            health = self.__Get(host, port)
+            if not health.isOpen:
+                return "allow"
+            if health.isProbing or self._clock() < health.retryAt:
+                return "reject"
+            health.isProbing = True
+            return "probe"
+
+    def RecordSuccess(self, host: str, port: int, latencySeconds: float, method: str = "GET", route: str = "") -> None:
+        with self._lock:
+            health = self.__Get(host, port)
+            health.consecutiveFailures = 0
+            window = self.__GetWindow(host, port, method, route)
+            window.latencies.append(max(0.0, float(latencySeconds)))
+            window.cachedPercentile = None
+            if health.isOpen and not health.isProbing:
+                # A request that was already in flight when the circuit opened came back fine.
+                self.__Close(health)
+
+    def RecordFailure(self, host: str, port: int) -> None:
+        with self._lock:
+            health = self.__Get(host, port)
+            health.consecutiveFailures += 1
+            if not health.isOpen and health.consecutiveFailures >= self._failureThreshold:
+                self.__Open(health, self._openSeconds)
+                print(f"EndpointHealthTracker: circuit opened for {host}:{port} after {health.consecutiveFailures} failures")
+
+    def RecordProbe(self, host: str, port: int, isHealthy: bool) -> None:
+        with self._lock:
+            health = self.__Get(host, port)
+            health.isProbing = False
+            if isHealthy:
+                self.__Close(health)
+                print(f"EndpointHealthTracker: circuit closed for {host}:{port}")
+                return
+            self.__Open(health, min(self._maxOpenSeconds, max(self._openSeconds, health.openSeconds * 2.0)))
+
+    def IsAvailable(self, host: str, port: int) -> bool:
+        """IsAvailable is False while the circuit is open and not yet due for a probe."""
+
+        with self._lock:
+            health = self.__Get(host, port)
+            return not health.isOpen or (not health.isProbing and self._clock() >= health.retryAt)
+
+    def GetTimeout(self, host: str, port: int, defaultSeconds: float, method: str = "GET", route: str = "") -> float:
+        """GetTimeout returns an adaptive timeout for the route, never above defaultSeconds."""
+
+        ceiling = float(defaultSeconds)
+        if str(method).upper() not in self._IdempotentMethods:
+            return ceiling
+        with self._lock:
+            window = self.__GetWindow(host, port, method, route)
+            if len(window.latencies) < self._minLatencySamples:
+                return ceiling
+            if window.cachedPercentile is None:
+                ordered = sorted(window.latencies)
+                rank = max(0, math.ceil(self._latencyPercentile * len(ordered)) - 1)
+                window.cachedPercentile = ordered[rank]
+            percentile = window.cachedPercentile
+
+        adaptive = max(self._minTimeoutSeconds, percentile * self._latencyMultiplier)
+        return min(ceiling, adaptive) if ceiling > 0 else adaptive
+
+    def __Get(self, host: str, port: int) -> _EndpointHealth:
+        key = (str(host), int(port))
+        health = self._endpoints.get(key)
+        if health is None:
+            health = _EndpointHealth()
+            self._endpoints[key] = health
+        return health
+
+    def __GetWindow(self, host: str, port: int, method: str, route: str) -> _LatencyWindow:
+        key = (str(host), int(port), str(method).upper(), str(route))
+        window = self._routes.get(key)
+        if window is None:
+            window = _LatencyWindow(self._latencyWindow)
+            self._routes[key] = window
+        return window
+
+    def __Open(self, health: _EndpointHealth, openSeconds: float) -> None:
+        health.isOpen = True
+        health.openSeconds = openSeconds
+        health.retryAt = self._clock() + openSeconds
+
+    def __Close(self, health: _EndpointHealth) -> None:
+        health.isOpen = False
+        health.isProbing = False
+        health.consecutiveFailures = 0
+        health.openSeconds = 0.0
@@ -8,6 +8,8 @@ from typing import Callable, Dict, List, Optional
 from src.core.settings.settings_service import SettingsService
 from src.game_events.game_event_definition import GameEventDefinition
 from src.game_events.game_event_executor import GameEventExecutor
+from src.rimapi.game_clock_service import GameClockService
+from src.window.events.editor_tab.game_api_catalog_store import GameApiCatalogStore
 from src.window.events.editor_tab.game_api_data_source import GameApiDataSource
 from src.window.events.editor_tab.editor_event_template import EditorEventTemplate
 from src.window.events.editor_tab.editor_template_catalog import EditorTemplateCatalog
@@ -26,10 +28,15 @@ class EditorTab:
         apiClient: RestApiClient,
         setStatus: Callable[[str], None],
         localizer: Localizer | None = None,
+        gameClock: GameClockService | None = None,
+        catalogStore: GameApiCatalogStore | None = None,
     ) -> None:
         self._settingsService = settingsService
         self._executor = executor
-        self._dataSource = GameApiDataSource(settingsService, apiClient)
+        self._dataSource = GameApiDataSource(settingsService, apiClient, catalogStore)
+        if gameClock is not None:
+            # Another save means other pawns, maps and possibly mod defs.
+            gameClock.AddGameReloadListener(self._dataSource.InvalidateAll)
         self._setStatus = setStatus
         self._localizer = localizer
 
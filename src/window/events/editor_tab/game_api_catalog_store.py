@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+
+class GameApiCatalogStore:
+    """GameApiCatalogStore persists RimAPI def catalogs between launches.
+
+    Catalogs are stored per endpoint ("host:port") together with the game/mod
+    fingerprint they were fetched under. Writes are debounced and atomic
+    (temp file + replace) so a warm-up that saves several large catalogs
+    rewrites the file once.
+    """
+
+    FileVersion = 1
+    # `/api/status` fields that identify the game build and mod list; volatile
+    # ones (gameLoaded, counts) are left out.
+    FingerprintKeys = ("gameVersion", "rimApiVersion", "version", "modsHash", "activeMods", "mods", "modPackageIds")
+
+    def __init__(self, filePath: Path, flushDelaySeconds: float = 1.0) -> None:
+        self._filePath = filePath
+        self._flushDelaySeconds = max(0.0, float(flushDelaySeconds))
+
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, Dict[str, object]]] = None
+        self._flushTimer: Optional[threading.Timer] = None
+
+    @staticmethod
+    def BuildFingerprint(status: object) -> Optional[str]:
+        """BuildFingerprint hashes the identifying `/api/status` fields (None if unavailable)."""
+
+        if not isinstance(status, dict) or status.get("success") is False:
+            return None
+        identifying = {key: status[key] for key in GameApiCatalogStore.FingerprintKeys if key in status}
+        encoded = json.dumps(identifying, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha1(encoded.encode("utf-8")).hexdigest()[:16]
+
+    def Load(self, endpointKey: str) -> Tuple[Optional[str], Dict[str, object]]:
+        """Load returns (fingerprint, catalogs by cache key) saved for the endpoint."""
+
+        with self._lock:
+            entry = self.__GetEntries().get(endpointKey)
+            if entry is None:
+                return None, {}
+            fingerprint = entry.get("fingerprint")
+            catalogs = entry.get("catalogs")
+            return (str(fingerprint) if fingerprint is not None else None), dict(catalogs) if isinstance(catalogs, dict) else {}
+
+    def Put(self, endpointKey: str, fingerprint: Optional[str], key: str, value: object) -> None:
+        with self._lock:
+            entries = self.__GetEntries()
+            entry = entries.get(endpointKey)
+            if entry is not None and fingerprint is None:
+                # Fetched before the fingerprint was known: it is still the live game's.
+                fingerprint = entry.get("fingerprint")
+            if entry is None or entry.get("fingerprint") != fingerprint:
+                # A different game/mod set: catalogs saved under the old one are void.
+                entry = {"fingerprint": fingerprint, "catalogs": {}}
+                entries[endpointKey] = entry
+            catalogs = entry["catalogs"]
+            if isinstance(catalogs, dict):
+                catalogs[key] = value
+            self.__ScheduleFlush()
+
+    def Reset(self, endpointKey: str, fingerprint: Optional[str]) -> None:
+        """Reset drops the endpoint's catalogs and records the new fingerprint."""
+
+        with self._lock:
+            self.__GetEntries()[endpointKey] = {"fingerprint": fingerprint, "catalogs": {}}
+            self.__ScheduleFlush()
+
+    def Rekey(self, endpointKey: str, fingerprint: str) -> None:
+        """Rekey records the fingerprint for catalogs saved before it was known, keeping them."""
+
+        with self._lock:
+            entries = self.__GetEntries()
+            entry = entries.get(endpointKey)
+            if entry is None:
+                entries[endpointKey] = {"fingerprint": fingerprint, "catalogs": {}}
+            else:
+                entry["fingerprint"] = fingerprint
+            self.__ScheduleFlush()
+
+    def Flush(self) -> None:
+        with self._lock:
+            timer = self._flushTimer
+            self._flushTimer = None
+            if timer is not None:
+                timer.cancel()
+            entries = self._entries
+            if entries is None:
+                return
+            content = json.dumps({"version": self.FileVersion, "endpoints": entries}, ensure_ascii=False, separators=(",", ":"))
+
+        try:
+            self._filePath.parent.mkdir(parents=True, exist_ok=True)
+            temporaryPath = self._filePath.with_name(self._filePath.name + ".tmp")
+            temporaryPath.write_text(content, encoding="utf-8")
+            os.replace(temporaryPath, self._filePath)
+        except Exception as error:
+            print(f"GameApiCatalogStore: Failed to save catalogs: {error}")
+
+    def __ScheduleFlush(self) -> None:
+        if self._flushTimer is not None:
+            return
+        timer = threading.Timer(self._flushDelaySeconds, self.Flush)
+        timer.daemon = True
+        self._flushTimer = timer
+        timer.start()
+
+    def __GetEntries(self) -> Dict[str, Dict[str, object]]:
+        if self._entries is None:
+            self._entries = self.__Read()
+        return self._entries
+
+    def __Read(self) -> Dict[str, Dict[str, object]]:
+        if not self._filePath.exists():
+            return {}
+        try:
+            parsed = json.loads(self._filePath.read_text(encoding="utf-8"))
+        except Exception as error:
+            print(f"GameApiCatalogStore: Failed to load catalogs: {error}")
+            return {}
+        if not isinstance(parsed, dict) or parsed.get("version") != self.FileVersion:
+            return {}
+        endpoints = parsed.get("endpoints")
+        if not isinstance(endpoints, dict):
+            return {}
+        return {str(key): value for key, value in endpoints.items() if isinstance(value, dict)}
@@ -1,25 +1,97 @@
 from __future__ import annotations
 
+import concurrent.futures
+import threading
 import time
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from src.core.settings.settings_service import SettingsService
+from src.window.events.editor_tab.game_api_catalog_store import GameApiCatalogStore
+from src.window.events.editor_tab.option_search_index import OptionSearchIndex
 from src.window.rest_api_client import RestApiClient
 
 
 class GameApiDataSource:
-    def __init__(self, settingsService: SettingsService, client: RestApiClient) -> None:
+    """GameApiDataSource fetches and caches RimAPI lookup lists for the editor widgets.
+
+    Safe to call from many worker threads: concurrent callers for the same
+    key share one in-flight fetch (single-flight) instead of each hitting RimAPI.
+
+    Each key has its own TTL (`_TtlSeconds`): def catalogs barely change while
+    a game runs, pawns and maps do. Expired entries are still returned at once
+    while a background refresh replaces them (stale-while-revalidate). Failed
+    answers are never cached. The cache is dropped when the RimAPI endpoint
+    changes and through `Invalidate` / `InvalidateAll` (e.g. after a game reload).
+
+    String lookups are also served as `OptionSearchIndex`es (the `...Index`
+    getters). An index is built once per cached entry, keyed by cache key and
+    entry timestamp, and shared by every widget showing that list.
+
+    With a `GameApiCatalogStore`, def catalogs saved by an earlier launch are
+    served (as already expired) the moment an endpoint is first used, so they
+    revalidate in the background; a changed `/api/status` fingerprint discards them.
+    """
+
+    DefaultTtlSeconds = 10.0
+    WarmUpConcurrency = 4
+    StatusPath = "/api/status"
+    PersistedKeyPrefixes = ("thingsCatalog", "hediffsCatalog", "incidentsCatalog", "raidsCatalog", "factions")
+
+    # Matched on the full key first, then on the part before the first ":".
+    _TtlSeconds: Dict[str, float] = {
+        "maps": 10.0,
+        "pawns": 10.0,
+        "pawnKinds:True": 30.0,
+        "pawnKinds": 600.0,
+        "factions": 600.0,
+        "raidsCatalog": 600.0,
+        "thingsCatalog": 600.0,
+        "incidentsCatalog": 600.0,
+        "hediffsCatalog": 600.0,
+    }
+
+    # Raid catalog list -> (response fields to look in, item keys to read).
+    _RaidCatalogFields: Dict[str, Tuple[List[str], List[str]]] = {
+        "raidStrategyDefName": (["raidStrategies", "strategies", "strategyDefs"], ["defName", "name", "id"]),
+        "arrivalModeDefName": (["arrivalModes", "arrivals", "arrivalModeDefs"], ["defName", "name", "id"]),
+        "factionDefName": (["factions", "raidFactions"], ["defName", "factionDefName", "name", "id"]),
+    }
+
+    def __init__(self, settingsService: SettingsService, client: RestApiClient, catalogStore: Optional[GameApiCatalogStore] = None) -> None:
         self._settingsService = settingsService
         self._client = client
+        self._catalogStore = catalogStore
 
+        self._lock = threading.Lock()
         self._cache: Dict[str, Tuple[float, object]] = {}
-        self._cacheSeconds: float = 10.0
+        self._indexes: Dict[Tuple[str, str], Tuple[float, OptionSearchIndex]] = {}
+        # Keyed by endpoint too: a fetch started against the previous endpoint
+        # must not be joined by callers of the new one.
+        self._inFlight: Dict[Tuple[Tuple[str, int], str], concurrent.futures.Future[object]] = {}
+        self._generation = 0
+        self._cachedEndpoint: Optional[Tuple[str, int]] = None
+        self._fingerprint: Optional[str] = None
+        self._refreshWorkers: Optional[concurrent.futures.ThreadPoolExecutor] = None
 
     def InvalidateAll(self) -> None:
-        self._cache = {}
+        with self._lock:
+            self._cache = {}
+            self._indexes = {}
+            # Fetches already in flight must not repopulate the cleared cache.
+            self._generation += 1
+
+    def Invalidate(self, *keyPrefixes: str) -> None:
+        """Invalidate drops cached keys starting with any of `keyPrefixes` (e.g. "pawns", "maps")."""
+
+        with self._lock:
+            for key in [key for key in self._cache if key.startswith(keyPrefixes)]:
+                del self._cache[key]
+            for indexKey in [indexKey for indexKey in self._indexes if indexKey[0].startswith(keyPrefixes)]:
+                del self._indexes[indexKey]
+            self._generation += 1
 
     def WarmUpAll(self) -> None:
-        """WarmUpAll prefetches common lookup lists.
+        """WarmUpAll prefetches common lookup lists concurrently.
 
         Intended to run off the UI thread so subsequent widget builds use cached results.
         """
@@ -36,61 +108,104 @@ class GameApiDataSource:
             lambda: self.GetPawns(forceRefresh=True),
         ]
 
-        for warmUpCall in warmUpCalls:
-            try:
-                warmUpCall()
-            except Exception:
-                continue
+        # A private pool: warm-up callers may wait on a fetch another caller leads.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.WarmUpConcurrency, thread_name_prefix="GameApiWarmUp") as workers:
+            futures = [workers.submit(warmUpCall) for warmUpCall in warmUpCalls]
+            for future in futures:
+                try:
+                    future.result()
+                except Exception:
+                    continue
 
     def GetMaps(self, forceRefresh: bool = False) -> List[Tuple[str, int]]:
-        data = self.__GetCached("maps", lambda: self.__GetJson("/api/maps"), forceRefresh)
+        data = self.__GetCached("maps", lambda endpoint: self.__GetJson(endpoint, "/api/maps"), forceRefresh)
         return self.__ExtractMapTuples(data)
 
     def GetFactions(self, forceRefresh: bool = False) -> List[str]:
-        data = self.__GetCached("factions", lambda: self.__GetJson("/api/factions"), forceRefresh)
-        return self.__ExtractStringList(data, preferredKeys=["defName", "factionDefName", "name", "id"])
+        return self.GetFactionsIndex(forceRefresh).GetOptions()
+
+    def GetFactionsIndex(self, forceRefresh: bool = False) -> OptionSearchIndex:
+        return self.__GetSearchIndex(
+            "factions",
+            lambda endpoint: self.__GetJson(endpoint, "/api/factions"),
+            forceRefresh,
+            lambda data: self.__ExtractStringList(data, preferredKeys=["defName", "factionDefName", "name", "id"]),
+        )
 
     def GetPawnKinds(self, presentOnly: bool = False, forceRefresh: bool = False) -> List[str]:
+        return self.GetPawnKindsIndex(presentOnly, forceRefresh).GetOptions()
+
+    def GetPawnKindsIndex(self, presentOnly: bool = False, forceRefresh: bool = False) -> OptionSearchIndex:
         key = f"pawnKinds:{presentOnly}"
         query = {"presentOnly": "true"} if presentOnly else {}
-        data = self.__GetCached(key, lambda: self.__GetJson("/api/pawns/kinds", query=query), forceRefresh)
-        return self.__ExtractStringList(data, preferredKeys=["defName", "kind", "pawnKindDefName", "name", "id"])
+        return self.__GetSearchIndex(
+            key,
+            lambda endpoint: self.__GetJson(endpoint, "/api/pawns/kinds", query=query),
+            forceRefresh,
+            lambda data: self.__ExtractStringList(data, preferredKeys=["defName", "kind", "pawnKindDefName", "name", "id"]),
+        )
 
     def GetRaidCatalog(self, forceRefresh: bool = False) -> Dict[str, List[str]]:
-        data = self.__GetCached("raidsCatalog", lambda: self.__GetJson("/api/raids/catalog"), forceRefresh)
-        strategies = self.__ExtractStringList(self.__TryGetField(data, ["raidStrategies", "strategies", "strategyDefs"]), preferredKeys=["defName", "name", "id"])
-        arrivals = self.__ExtractStringList(self.__TryGetField(data, ["arrivalModes", "arrivals", "arrivalModeDefs"]), preferredKeys=["defName", "name", "id"])
-        factions = self.__ExtractStringList(self.__TryGetField(data, ["factions", "raidFactions"]), preferredKeys=["defName", "factionDefName", "name", "id"])
+        # One fetch feeds every field, so all lists come from the same catalog.
+        cachedAt, data = self.__GetCachedEntry("raidsCatalog", self.__LoadRaidCatalog, forceRefresh)
         return {
-            "raidStrategyDefName": strategies,
-            "arrivalModeDefName": arrivals,
-            "factionDefName": factions,
+            field: self.__IndexEntry("raidsCatalog", cachedAt, data, self.__RaidCatalogExtractor(field), field).GetOptions()
+            for field in self._RaidCatalogFields
         }
 
-    def GetThingCatalog(self, techMode: str = "Range", minTechLevel: str = "", maxTechLevel: str = "", limit: int = 200, forceRefresh: bool = False) -> List[str]:
+    def GetRaidCatalogIndex(self, field: str, forceRefresh: bool = False) -> OptionSearchIndex:
+        """GetRaidCatalogIndex indexes one raid catalog list ("raidStrategyDefName", "arrivalModeDefName" or "factionDefName")."""
+
+        return self.__GetSearchIndex("raidsCatalog", self.__LoadRaidCatalog, forceRefresh, self.__RaidCatalogExtractor(field), variant=field)
+
+    def GetThingCatalog(self, techMode: str = "Range", minTechLevel: str = "", maxTechLevel: str = "", limit: int = 0, forceRefresh: bool = False) -> List[str]:
+        """GetThingCatalog returns thing defNames; `limit` 0 fetches the whole catalog."""
+
+        return self.GetThingCatalogIndex(techMode, minTechLevel, maxTechLevel, limit, forceRefresh).GetOptions()
+
+    def GetThingCatalogIndex(self, techMode: str = "Range", minTechLevel: str = "", maxTechLevel: str = "", limit: int = 0, forceRefresh: bool = False) -> OptionSearchIndex:
         query: Dict[str, str] = {
             "techMode": str(techMode),
-            "limit": str(int(limit)),
         }
+        if int(limit) > 0:
+            query["limit"] = str(int(limit))
         if str(minTechLevel).strip() != "":
             query["minTechLevel"] = str(minTechLevel).strip()
         if str(maxTechLevel).strip() != "":
             query["maxTechLevel"] = str(maxTechLevel).strip()
 
-        key = f"thingsCatalog:{query.get('techMode')}:{query.get('minTechLevel','')}:{query.get('maxTechLevel','')}:{query.get('limit')}"
-        data = self.__GetCached(key, lambda: self.__GetJson("/api/things/catalog", query=query), forceRefresh)
-        return self.__ExtractStringList(data, preferredKeys=["defName", "thingDefName", "name", "id"])
+        key = f"thingsCatalog:{query.get('techMode')}:{query.get('minTechLevel','')}:{query.get('maxTechLevel','')}:{query.get('limit', 'all')}"
+        return self.__GetSearchIndex(
+            key,
+            lambda endpoint: self.__GetJson(endpoint, "/api/things/catalog", query=query),
+            forceRefresh,
+            lambda data: self.__ExtractStringList(data, preferredKeys=["defName", "thingDefName", "name", "id"]),
+        )
 
     def GetIncidentCatalog(self, forceRefresh: bool = False) -> List[str]:
-        data = self.__GetCached("incidentsCatalog", lambda: self.__GetJson("/api/incidents/catalog"), forceRefresh)
-        return self.__ExtractStringList(data, preferredKeys=["incidentDefName", "defName", "name", "id"])
+        return self.GetIncidentCatalogIndex(forceRefresh).GetOptions()
+
+    def GetIncidentCatalogIndex(self, forceRefresh: bool = False) -> OptionSearchIndex:
+        return self.__GetSearchIndex(
+            "incidentsCatalog",
+            lambda endpoint: self.__GetJson(endpoint, "/api/incidents/catalog"),
+            forceRefresh,
+            lambda data: self.__ExtractStringList(data, preferredKeys=["incidentDefName", "defName", "name", "id"]),
+        )
 
     def GetHediffCatalog(self, forceRefresh: bool = False) -> List[str]:
-        data = self.__GetCached("hediffsCatalog", lambda: self.__GetJson("/api/hediffs/catalog"), forceRefresh)
-        return self.__ExtractStringList(data, preferredKeys=["hediffDefName", "defName", "name", "id"])
+        return self.GetHediffCatalogIndex(forceRefresh).GetOptions()
+
+    def GetHediffCatalogIndex(self, forceRefresh: bool = False) -> OptionSearchIndex:
+        return self.__GetSearchIndex(
+            "hediffsCatalog",
+            lambda endpoint: self.__GetJson(endpoint, "/api/hediffs/catalog"),
+            forceRefresh,
+            lambda data: self.__ExtractStringList(data, preferredKeys=["hediffDefName", "defName", "name", "id"]),
+        )
 
     def GetPawns(self, forceRefresh: bool = False) -> List[Tuple[str, int]]:
-        data = self.__GetCached("pawns", lambda: self.__GetJson("/api/pawns"), forceRefresh)
+        data = self.__GetCached("pawns", lambda endpoint: self.__GetJson(endpoint, "/api/pawns"), forceRefresh)
         return self.__ExtractPawnTuples(data)
 
     def __GetEndpoint(self) -> Tuple[str, int]:
@@ -102,23 +217,173 @@ class GameApiDataSource:
         except Exception:
             return "localhost", 0
 
-    def __GetJson(self, path: str, query: Optional[Dict[str, str]] = None) -> object:
-        host, port = self.__GetEndpoint()
-        return self._client.GetJson(host, port, path, query=query or {})
-
-    def __GetCached(self, key: str, loader: Callable[[], object], forceRefresh: bool) -> object:
-        now = time.time()
-        if not forceRefresh:
-            cached = self._cache.get(key)
+    def __GetJson(self, endpoint: Tuple[str, int], path: str, query: Optional[Dict[str, str]] = None) -> object:
+        return self._client.GetJson(endpoint[0], endpoint[1], path, query=query or {})
+
+    def __LoadRaidCatalog(self, endpoint: Tuple[str, int]) -> object:
+        return self.__GetJson(endpoint, "/api/raids/catalog")
+
+    def __RaidCatalogExtractor(self, field: str) -> Callable[[object], List[str]]:
+        fieldKeys, preferredKeys = self._RaidCatalogFields[field]
+        return lambda data: self.__ExtractStringList(self.__TryGetField(data, fieldKeys), preferredKeys=preferredKeys)
+
+    def __GetSearchIndex(
+        self,
+        key: str,
+        loader: Callable[[Tuple[str, int]], object],
+        forceRefresh: bool,
+        extract: Callable[[object], List[str]],
+        variant: str = "",
+    ) -> OptionSearchIndex:
+        cachedAt, data = self.__GetCachedEntry(key, loader, forceRefresh)
+        return self.__IndexEntry(key, cachedAt, data, extract, variant)
+
+    def __IndexEntry(
+        self,
+        key: str,
+        cachedAt: Optional[float],
+        data: object,
+        extract: Callable[[object], List[str]],
+        variant: str,
+    ) -> OptionSearchIndex:
+        indexKey = (key, variant)
+        if cachedAt is not None:
+            with self._lock:
+                entry = self._indexes.get(indexKey)
+                if entry is not None and entry[0] == cachedAt:
+                    return entry[1]
+
+        # Built outside the lock: a large catalog takes a moment to index.
+        index = OptionSearchIndex(extract(data))
+        if cachedAt is not None:
+            with self._lock:
+                cached = self._cache.get(key)
+                if cached is not None and cached[0] == cachedAt:
+                    self._indexes[indexKey] = (cachedAt, index)
+        return index
+
+    def __GetCached(self, key: str, loader: Callable[[Tuple[str, int]], object], forceRefresh: bool) -> object:
+        return self.__GetCachedEntry(key, loader, forceRefresh)[1]
+
+    def __GetCachedEntry(self, key: str, loader: Callable[[Tuple[str, int]], object], forceRefresh: bool) -> Tuple[Optional[float], object]:
+        # Returns the cache timestamp of the value, or None if it was not cached.
+        endpoint = self.__GetEndpoint()
+        with self._lock:
+            if endpoint != self._cachedEndpoint:
+                self._cache = {}
+                self._indexes = {}
+                self._generation += 1
+                self._cachedEndpoint = endpoint
+                self.__RestorePersisted(endpoint)
+
+            cached = self._cache.get(key) if not forceRefresh else None
+            flightKey = (endpoint, key)
+            future = self._inFlight.get(flightKey)
             if cached is not None:
                 cachedAt, value = cached
-                if (now - cachedAt) <= self._cacheSeconds:
-                    return value
+                if (time.time() - cachedAt) <= self.__GetTtlSeconds(key):
+                    return cachedAt, value
+                if future is None:
+                    # Serve the stale value now; refresh it in the background.
+                    self._inFlight[flightKey] = concurrent.futures.Future()
+                    self.__GetRefreshWorkers().submit(self.__Load, endpoint, key, loader, self._generation)
+                return cachedAt, value
+
+            # A fetch already in flight is as fresh as a forced one would be.
+            isLeader = future is None
+            if future is None:
+                self._inFlight[flightKey] = concurrent.futures.Future()
+            generation = self._generation
+
+        value = future.result() if not isLeader else self.__Load(endpoint, key, loader, generation)
+        with self._lock:
+            cached = self._cache.get(key)
+        if cached is not None and cached[1] is value:
+            return cached[0], value
+        return None, value
 
-        value = loader()
-        self._cache[key] = (now, value)
+    def __Load(self, endpoint: Tuple[str, int], key: str, loader: Callable[[Tuple[str, int]], object], generation: int) -> object:
+        flightKey = (endpoint, key)
+        with self._lock:
+            future = self._inFlight[flightKey]
+
+        try:
+            value = loader(endpoint)
+        except BaseException as error:
+            with self._lock:
+                self._inFlight.pop(flightKey, None)
+            future.set_exception(error)
+            raise
+
+        with self._lock:
+            self._inFlight.pop(flightKey, None)
+            isCurrent = generation == self._generation and not self.__IsFailure(value)
+            if isCurrent:
+                self._cache[key] = (time.time(), value)
+            fingerprint = self._fingerprint
+        if isCurrent and self._catalogStore is not None and key.startswith(self.PersistedKeyPrefixes):
+            self._catalogStore.Put(self.__FormatEndpointKey(endpoint), fingerprint, key, value)
+        future.set_result(value)
         return value
 
+    def __RestorePersisted(self, endpoint: Tuple[str, int]) -> None:
+        # Called under the lock when an endpoint is first used.
+        store = self._catalogStore
+        if store is None:
+            return
+        fingerprint, catalogs = store.Load(self.__FormatEndpointKey(endpoint))
+        self._fingerprint = fingerprint
+        for key, value in catalogs.items():
+            if key.startswith(self.PersistedKeyPrefixes):
+                # Stored as expired: served at once, revalidated on first use.
+                self._cache[key] = (0.0, value)
+        self.__GetRefreshWorkers().submit(self.__CheckFingerprint, endpoint)
+
+    def __CheckFingerprint(self, endpoint: Tuple[str, int]) -> None:
+        store = self._catalogStore
+        if store is None:
+            return
+        try:
+            status = self._client.GetJson(endpoint[0], endpoint[1], self.StatusPath)
+        except Exception as error:
+            print(f"GameApiDataSource: Failed to fetch {self.StatusPath}, keeping saved catalogs: {error}")
+            return
+        fingerprint = GameApiCatalogStore.BuildFingerprint(status)
+        if fingerprint is None:
+            # RimWorld still loading: keep serving what the last launch saw.
+            return
+
+        with self._lock:
+            if endpoint != self._cachedEndpoint or fingerprint == self._fingerprint:
+                self._fingerprint = fingerprint
+                return
+            previousFingerprint = self._fingerprint
+            self._fingerprint = fingerprint
+        endpointKey = self.__FormatEndpointKey(endpoint)
+        if previousFingerprint is None:
+            # Nothing to compare against: what was fetched so far came from this game.
+            store.Rekey(endpointKey, fingerprint)
+            return
+        store.Reset(endpointKey, fingerprint)
+        self.Invalidate(*self.PersistedKeyPrefixes)
+
+    def __FormatEndpointKey(self, endpoint: Tuple[str, int]) -> str:
+        return f"{endpoint[0]}:{endpoint[1]}"
+
+    def __GetRefreshWorkers(self) -> concurrent.futures.ThreadPoolExecutor:
+        if self._refreshWorkers is None:
+            self._refreshWorkers = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="GameApiRefresh")
+        return self._refreshWorkers
+
+    def __GetTtlSeconds(self, key: str) -> float:
+        ttl = self._TtlSeconds.get(key)
+        if ttl is None:
+            ttl = self._TtlSeconds.get(key.split(":", 1)[0], self.DefaultTtlSeconds)
+        return ttl
+
+    def __IsFailure(self, value: object) -> bool:
+        return isinstance(value, dict) and value.get("success") is False
+
     def __TryGetField(self, parsed: object, keys: List[str]) -> object:
         if isinstance(parsed, dict):
             for key in keys:
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import bisect
+import heapq
+from collections import Counter
+from typing import Dict, List, Set
+
+
+class OptionSearchIndex:
+    """OptionSearchIndex answers type-ahead queries over a large option list.
+
+    Built once per fetched catalog (off the UI thread). A sorted array of
+    lower-cased options serves prefix matches by binary search; a trigram
+    index narrows substring matches and, when those run short, ranks fuzzy
+    matches by shared trigrams. Results come prefix first, then substring,
+    then fuzzy, each capped at `limit`.
+    """
+
+    def __init__(self, options: List[str]) -> None:
+        seen: Set[str] = set()
+        self._options: List[str] = []
+        for option in options:
+            text = str(option)
+            if text.strip() and text not in seen:
+                seen.add(text)
+                self._options.append(text)
+
+        self._lowered: List[str] = [option.lower() for option in self._options]
+        self._sortedIds: List[int] = sorted(range(len(self._options)), key=lambda index: (self._lowered[index], self._options[index]))
+        self._sortedKeys: List[str] = [self._lowered[index] for index in self._sortedIds]
+
+        postings: Dict[str, List[int]] = {}
+        for index, lowered in enumerate(self._lowered):
+            for trigram in self.__Trigrams(lowered):
+                postings.setdefault(trigram, []).append(index)
+        self._trigrams = postings
+
+    def GetOptions(self) -> List[str]:
+        return list(self._options)
+
+    def __len__(self) -> int:
+        return len(self._options)
+
+    def Search(self, query: str, limit: int = 50) -> List[str]:
+        limit = max(1, int(limit))
+        needle = str(query or "").strip().lower()
+        if not needle:
+            return [self._options[index] for index in self._sortedIds[:limit]]
+
+        results: List[int] = []
+        taken: Set[int] = set()
+
+        def take(index: int) -> bool:
+            if index not in taken:
+                taken.add(index)
+                results.append(index)
+            return len(results) >= limit
+
+        start = bisect.bisect_left(self._sortedKeys, needle)
+        for position in range(start, len(self._sortedKeys)):
+            if not self._sortedKeys[position].startswith(needle):
+                break
+            if take(self._sortedIds[position]):
+                return self.__Resolve(results)
+
+        for index in self.__SubstringMatches(needle, taken, limit - len(results)):
+            if take(index):
+                return self.__Resolve(results)
+
+        if len(needle) >= 3:
+            for index in self.__FuzzyMatches(needle, taken, limit - len(results)):
+                if take(index):
+                    break
+        return self.__Resolve(results)
+
+    def __SubstringMatches(self, needle: str, taken: Set[int], limit: int) -> List[int]:
+        lowered = self._lowered
+        trigrams = self.__Trigrams(needle)
+        if not trigrams:
+            # One or two characters match almost everything: scan in sorted
+            # order and stop at the first `limit` hits.
+            found: List[int] = []
+            for index in self._sortedIds:
+                if index not in taken and needle in lowered[index]:
+                    found.append(index)
+                    if len(found) >= limit:
+                        break
+            return found
+
+        postings = sorted((self._trigrams.get(trigram, []) for trigram in trigrams), key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            if not candidates:
+                return []
+            candidates.intersection_update(posting)
+
+        matches = [index for index in candidates if index not in taken and needle in lowered[index]]
+        return heapq.nsmallest(limit, matches, key=lambda index: (len(lowered[index]), lowered[index]))
+
+    def __FuzzyMatches(self, needle: str, taken: Set[int], limit: int) -> List[int]:
+        trigrams = self.__Trigrams(needle)
+        counts: Counter[int] = Counter()
+        for trigram in trigrams:
+            counts.update(self._trigrams.get(trigram, ()))
+
+        # At least half of the query's trigrams must appear in a fuzzy match.
+        threshold = max(1, (len(trigrams) + 1) // 2)
+        matches = [index for index, count in counts.items() if count >= threshold and index not in taken]
+        return heapq.nsmallest(limit, matches, key=lambda index: (-counts[index], len(self._lowered[index]), self._lowered[index]))
+
+    def __Resolve(self, indexes: List[int]) -> List[str]:
+        return [self._options[index] for index in indexes]
+
+    def __Trigrams(self, text: str) -> Set[str]:
+        return {text[position:position + 3] for position in range(len(text) - 2)}
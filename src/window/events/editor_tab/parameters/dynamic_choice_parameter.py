@@ -4,17 +4,31 @@ import tkinter as tk
 from tkinter import ttk
 from typing import Callable, List
 
+from src.window.events.editor_tab.option_search_index import OptionSearchIndex
 from src.window.events.editor_tab.parameters.editor_template_parameter import EditorTemplateParameter
 from src.window.theme import Theme
 from src.window.busy_button_task import BusyButtonTask
 
 
 class DynamicChoiceParameter(EditorTemplateParameter):
+    """DynamicChoiceParameter is a combobox filled from a RimAPI lookup.
+
+    `fetchOptions` may return a plain list or an `OptionSearchIndex`; the
+    `GameApiDataSource` index getters hand out one shared index per cached
+    catalog, so refreshing a widget does not re-index. An editable dropdown
+    only ever holds the top `MaxVisibleOptions` matches for the typed text; a
+    readonly one (`allowManual=False`) cannot be typed into, so it lists
+    every option.
+    """
+
+    MaxVisibleOptions = 50
+    _NavigationKeys = ("Up", "Down", "Return", "KP_Enter", "Escape", "Tab")
+
     def __init__(
         self,
         key: str,
         label: str,
-        fetchOptions: Callable[[], List[str]],
+        fetchOptions: Callable[[], List[str] | OptionSearchIndex],
         default: str,
         allowManual: bool = True,
         helpText: str | None = None,
@@ -26,7 +40,8 @@ class DynamicChoiceParameter(EditorTemplateParameter):
 
         self._var: tk.StringVar | None = None
         self._combo: ttk.Combobox | None = None
-        self._refreshTask: BusyButtonTask[List[str]] | None = None
+        self._refreshTask: BusyButtonTask[OptionSearchIndex] | None = None
+        self._index: OptionSearchIndex | None = None
 
     def Build(self, parent: tk.Frame, onChanged: Callable[[], None]) -> None:
         palette = Theme.Palette
@@ -40,7 +55,7 @@ class DynamicChoiceParameter(EditorTemplateParameter):
         self._combo.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(8, 8))
         self._combo.bind("<<ComboboxSelected>>", lambda event: onChanged())
         if self._allowManual:
-            self._combo.bind("<KeyRelease>", lambda event: onChanged())
+            self._combo.bind("<KeyRelease>", lambda event: self.__OnKeyRelease(event, onChanged))
 
         refreshButton = tk.Button(
             row,
@@ -61,8 +76,8 @@ class DynamicChoiceParameter(EditorTemplateParameter):
         self._refreshTask = BusyButtonTask(
             refreshButton,
             work=self.__FetchOptions,
-            onSuccess=lambda options: self.__ApplyOptions(options, onChanged, preserveValue=True),
-            onError=lambda error: self.__ApplyOptions([], onChanged, preserveValue=True),
+            onSuccess=lambda index: self.__ApplyOptions(index, onChanged, preserveValue=True),
+            onError=lambda error: self.__ApplyOptions(OptionSearchIndex([]), onChanged, preserveValue=True),
         )
 
         self.__RefreshAsync(onChanged, preserveValue=True)
@@ -73,20 +88,40 @@ class DynamicChoiceParameter(EditorTemplateParameter):
             return
         task.Invoke()
 
-    def __FetchOptions(self) -> List[str]:
+    def __FetchOptions(self) -> OptionSearchIndex:
+        # Runs on the worker thread, so fetching and indexing never block the UI.
+        try:
+            options = self._fetchOptions()
+            if isinstance(options, OptionSearchIndex):
+                return options
+            return OptionSearchIndex([str(value) for value in (options or []) if str(value).strip()])
+        except Exception:
+            return OptionSearchIndex([])
+
+    def __OnKeyRelease(self, event: tk.Event, onChanged: Callable[[], None]) -> None:
+        if getattr(event, "keysym", "") not in self._NavigationKeys:
+            self.__FilterOptions()
+        onChanged()
+
+    def __FilterOptions(self) -> None:
+        if self._combo is None or self._var is None or self._index is None:
+            return
         try:
-            return [str(value) for value in (self._fetchOptions() or []) if str(value).strip()]
+            self._combo.configure(values=self._index.Search(str(self._var.get() or ""), self.MaxVisibleOptions))
         except Exception:
-            return []
+            pass
 
-    def __ApplyOptions(self, options: List[str], onChanged: Callable[[], None], preserveValue: bool = True) -> None:
+    def __ApplyOptions(self, index: OptionSearchIndex, onChanged: Callable[[], None], preserveValue: bool = True) -> None:
         if self._combo is None or self._var is None:
             return
 
+        self._index = index
+        options = index.GetOptions()
         current = str(self._var.get() or "")
 
+        visibleCount = self.MaxVisibleOptions if self._allowManual else len(index)
         try:
-            self._combo.configure(values=options)
+            self._combo.configure(values=index.Search("", visibleCount))
         except Exception:
             pass
 
@@ -59,7 +59,7 @@ def build_templates(dataSource: GameApiDataSource) -> List[EditorEventTemplate]:
             FloatSliderParameter("probability", "Probability", minimum=0.0, maximum=1.0, default=0.8, resolution=0.05),
             StringParameter("tags", "Tags (comma)", default="spawn,caravan"),
             DynamicMappedChoiceParameter("mapId", "Map", fetchOptions=lambda: dataSource.GetMaps(forceRefresh=False), defaultValue=0),
-            DynamicChoiceParameter("factionDefName", "Faction", fetchOptions=lambda: dataSource.GetFactions(forceRefresh=False), default=default_faction),
+            DynamicChoiceParameter("factionDefName", "Faction", fetchOptions=lambda: dataSource.GetFactionsIndex(forceRefresh=False), default=default_faction),
             BoolParameter("silent", "Silent (hide game letter)", default=True),
             MappedChoiceParameter(
                 "mode",
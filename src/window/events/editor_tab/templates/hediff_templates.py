@@ -67,7 +67,7 @@ def build_templates(dataSource: GameApiDataSource) -> List[EditorEventTemplate]:
                 DynamicChoiceParameter(
                     "hediffDefName",
                     "Hediff Def",
-                    fetchOptions=lambda: dataSource.GetHediffCatalog(forceRefresh=False),
+                    fetchOptions=lambda: dataSource.GetHediffCatalogIndex(forceRefresh=False),
                     default="Flu",
                     allowManual=True,
                 ),
@@ -85,7 +85,7 @@ def build_templates(dataSource: GameApiDataSource) -> List[EditorEventTemplate]:
                 DynamicChoiceParameter(
                     "incidentDefName",
                     "Incident Def",
-                    fetchOptions=lambda: dataSource.GetIncidentCatalog(forceRefresh=False),
+                    fetchOptions=lambda: dataSource.GetIncidentCatalogIndex(forceRefresh=False),
                     default="ShortCircuit",
                     allowManual=True,
                 ),
@@ -95,7 +95,7 @@ def build_templates(dataSource: GameApiDataSource) -> List[EditorEventTemplate]:
                 DynamicChoiceParameter(
                     "factionDefName",
                     "Faction (optional)",
-                    fetchOptions=lambda: dataSource.GetFactions(forceRefresh=False),
+                    fetchOptions=lambda: dataSource.GetFactionsIndex(forceRefresh=False),
                     default="",
                     allowManual=True,
                 ),
@@ -110,7 +110,7 @@ def build_templates(dataSource: GameApiDataSource) -> List[EditorEventTemplate]:
             StringParameter("tags", "Tags (comma)", default="event,raid"),
             DynamicMappedChoiceParameter("mapId", "Map", fetchOptions=lambda: dataSource.GetMaps(forceRefresh=False), defaultValue=0),
             ChoiceParameter("raidPreset", "Raid Type", options=["Custom", "Humans", "Mechanoids", "Insects"], default="Humans"),
-            DynamicChoiceParameter("factionDefName", "Faction (optional override)", fetchOptions=lambda: dataSource.GetFactions(forceRefresh=False), default="", allowManual=True),
+            DynamicChoiceParameter("factionDefName", "Faction (optional override)", fetchOptions=lambda: dataSource.GetFactionsIndex(forceRefresh=False), default="", allowManual=True),
             MappedChoiceParameter(
                 "method",
                 "Method",
@@ -121,7 +121,7 @@ def build_templates(dataSource: GameApiDataSource) -> List[EditorEventTemplate]:
             DynamicChoiceParameter(
                 "incidentDefName",
                 "Incident (optional override)",
-                fetchOptions=lambda: dataSource.GetIncidentCatalog(forceRefresh=False),
+                fetchOptions=lambda: dataSource.GetIncidentCatalogIndex(forceRefresh=False),
                 default="",
                 allowManual=True,
             ),
@@ -131,21 +131,21 @@ def build_templates(dataSource: GameApiDataSource) -> List[EditorEventTemplate]:
             DynamicChoiceParameter(
                 "raidStrategyDefName",
                 "Raid Strategy",
-                fetchOptions=lambda: dataSource.GetRaidCatalog(forceRefresh=False).get("raidStrategyDefName", []),
+                fetchOptions=lambda: dataSource.GetRaidCatalogIndex("raidStrategyDefName", forceRefresh=False),
                 default="",
                 allowManual=True,
             ),
             DynamicChoiceParameter(
                 "arrivalModeDefName",
                 "Arrival Mode",
-                fetchOptions=lambda: dataSource.GetRaidCatalog(forceRefresh=False).get("arrivalModeDefName", []),
+                fetchOptions=lambda: dataSource.GetRaidCatalogIndex("arrivalModeDefName", forceRefresh=False),
                 default="",
                 allowManual=True,
             ),
             DynamicChoiceParameter(
                 "pawnKindDefName",
                 "Pawn Kind (Direct)",
-                fetchOptions=lambda: dataSource.GetPawnKinds(presentOnly=False, forceRefresh=False),
+                fetchOptions=lambda: dataSource.GetPawnKindsIndex(presentOnly=False, forceRefresh=False),
                 default="",
                 allowManual=True,
             ),
@@ -73,7 +73,7 @@ def build_templates(dataSource: GameApiDataSource) -> List[EditorEventTemplate]:
                 DynamicChoiceParameter(
                     "thingDefName",
                     "Thing Def",
-                    fetchOptions=lambda: dataSource.GetThingCatalog(forceRefresh=False),
+                    fetchOptions=lambda: dataSource.GetThingCatalogIndex(forceRefresh=False),
                     default="Steel",
                     allowManual=True,
                 ),
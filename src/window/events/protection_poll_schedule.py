@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import time
+from typing import Callable, Optional, Tuple
+
+from src.rimapi.game_clock_service import GameClockService
+
+
+class ProtectionPollSchedule:
+    """ProtectionPollSchedule decides when `/api/protection` needs polling again.
+
+    While protection is off and the answer keeps repeating, the delay doubles
+    up to `maxIntervalSeconds`. While it is active, the time left comes from
+    `GameClockService` (which knows the tick rate and pause state), so the
+    label can count down without requests and the next poll lands just
+    before the expiry. Without a game clock the answer's `nowTick` is
+    projected at the nominal 60 ticks per second.
+    """
+
+    DefaultTicksPerSecond = 60.0
+
+    def __init__(
+        self,
+        gameClock: Optional[GameClockService] = None,
+        baseIntervalSeconds: float = 2.5,
+        maxIntervalSeconds: float = 60.0,
+        activeMaxIntervalSeconds: float = 30.0,
+        expiryLeadSeconds: float = 1.0,
+        minIntervalSeconds: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._baseIntervalSeconds = float(baseIntervalSeconds)
+        self._maxIntervalSeconds = max(self._baseIntervalSeconds, float(maxIntervalSeconds))
+        self._activeMaxIntervalSeconds = max(self._baseIntervalSeconds, float(activeMaxIntervalSeconds))
+        self._expiryLeadSeconds = max(0.0, float(expiryLeadSeconds))
+        self._minIntervalSeconds = max(0.05, float(minIntervalSeconds))
+        self._clock = clock
+        self._gameClock = gameClock
+
+        self._backoffSeconds = self._baseIntervalSeconds
+        self._signature: Optional[Tuple[bool, bool, int, int]] = None
+        self._observedTick: Optional[int] = None
+        self._observedAt = 0.0
+        self._untilTick = 0
+
+    def GetMaxIntervalSeconds(self) -> float:
+        return self._maxIntervalSeconds
+
+    def Reset(self) -> None:
+        """Reset forgets the back-off (e.g. after a user action changed the game)."""
+
+        self._backoffSeconds = self._baseIntervalSeconds
+        self._signature = None
+
+    def Observe(self, response: object) -> float:
+        """Observe records a poll answer and returns the delay until the next poll."""
+
+        now = self._clock()
+        parsed = self.__Parse(response)
+        if parsed is None:
+            self._signature = None
+            self._untilTick = 0
+            self._backoffSeconds = self._baseIntervalSeconds
+            return self._baseIntervalSeconds
+
+        externalActive, allBadActive, nowTick, externalUntil, allBadUntil = parsed
+        self._observedTick = nowTick
+        self._observedAt = now
+
+        signature = (externalActive, allBadActive, externalUntil, allBadUntil)
+        isActive = externalActive or allBadActive
+        if not isActive:
+            self._untilTick = 0
+            if signature == self._signature:
+                self._backoffSeconds = min(self._maxIntervalSeconds, self._backoffSeconds * 2.0)
+            else:
+                self._backoffSeconds = self._baseIntervalSeconds
+            self._signature = signature
+            return self._backoffSeconds
+
+        self._signature = signature
+        self._backoffSeconds = self._baseIntervalSeconds
+        self._untilTick = allBadUntil if allBadActive else externalUntil
+
+        secondsUntilExpiry = self.GetRemainingSeconds()
+        if secondsUntilExpiry is None or self.IsPaused():
+            # Paused: nothing expires until the game resumes (the clock
+            # re-samples quickly on a speed change, which triggers a re-poll).
+            return self._activeMaxIntervalSeconds
+        delay = secondsUntilExpiry - self._expiryLeadSeconds
+        return min(self._activeMaxIntervalSeconds, max(self._minIntervalSeconds, delay))
+
+    def IsPaused(self) -> bool:
+        estimate = self._gameClock.GetEstimate() if self._gameClock is not None else None
+        return estimate is not None and estimate.ticksPerSecond <= 0.0
+
+    def GetRemainingSeconds(self) -> Optional[float]:
+        """GetRemainingSeconds estimates real seconds left on active protection (None when inactive).
+
+        While the game is paused the time left is frozen and reported at normal speed.
+        """
+
+        if self._untilTick <= 0 or self._observedTick is None:
+            return None
+
+        estimate = self._gameClock.GetEstimate() if self._gameClock is not None else None
+        if estimate is None:
+            elapsed = max(0.0, self._clock() - self._observedAt)
+            projectedTick = self._observedTick + elapsed * self.DefaultTicksPerSecond
+            return max(0.0, (self._untilTick - projectedTick) / self.DefaultTicksPerSecond)
+        if estimate.ticksPerSecond <= 0.0:
+            return max(0.0, (self._untilTick - estimate.tick) / self.DefaultTicksPerSecond)
+        return self._gameClock.SecondsUntil(self._untilTick)
+
+    def __Parse(self, response: object) -> Optional[Tuple[bool, bool, int, int, int]]:
+        if not isinstance(response, dict) or response.get("success") is False:
+            return None
+        try:
+            return (
+                bool(response.get("externalBadEventsActive") or False),
+                bool(response.get("allBadIncidentsActive") or False),
+                int(response.get("nowTick") or 0),
+                int(response.get("externalBadEventsUntilTick") or 0),
+                int(response.get("allBadIncidentsUntilTick") or 0),
+            )
+        except Exception:
+            return None
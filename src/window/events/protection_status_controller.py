@@ -1,23 +1,45 @@
 from __future__ import annotations
 
-import threading
-import time
 import tkinter as tk
-from typing import Callable, Tuple
+from typing import Callable
 
 from src.core.localization.localizer import Localizer
-from src.window.rest_api_client import RestApiClient
+from src.rimapi.game_clock_service import GameClockService
+from src.rimapi.game_state_service import GameStateService
+from src.rimapi.game_state_value import GameStateValue
+from src.window.events.protection_poll_schedule import ProtectionPollSchedule
+from src.window.ui_thread_scheduler import UiThreadScheduler
 
 
 class ProtectionStatusController:
-    def __init__(self, apiClient: RestApiClient, getEndpoint: Callable[[], Tuple[str, int]], localizer: Localizer) -> None:
-        self._apiClient = apiClient
-        self._getEndpoint = getEndpoint
+    """ProtectionStatusController shows RimAPI's bad-event protection next to the events tabs.
+
+    Polling adapts through `ProtectionPollSchedule`; while protection is active
+    the countdown is re-read from the game clock every `CountdownIntervalMs`,
+    so it follows the game speed and stops while paused.
+    """
+
+    ProtectionPath = "/api/protection"
+    CountdownIntervalMs = 500
+
+    def __init__(
+        self,
+        gameState: GameStateService,
+        localizer: Localizer,
+        uiScheduler: UiThreadScheduler,
+        gameClock: GameClockService | None = None,
+        schedule: ProtectionPollSchedule | None = None,
+    ) -> None:
+        self._gameState = gameState
         self._localizer = localizer
+        self._uiScheduler = uiScheduler
+        self._schedule = schedule if schedule is not None else ProtectionPollSchedule(gameClock)
 
         self._labelVar: tk.StringVar | None = None
-        self._stopEvent: threading.Event | None = None
-        self._workerThread: threading.Thread | None = None
+        self._window: tk.Misc | None = None
+        self._lastResponse: object = None
+        self._countdownJob: str | None = None
+        self._onStateChanged: Callable[[GameStateValue], None] | None = None
 
     def Build(self, parent: tk.Misc, backgroundColor: str, textColor: str) -> tk.Label:
         self._labelVar = tk.StringVar(value=self._localizer.Text("protection.label.unknown"))
@@ -31,54 +53,30 @@ class ProtectionStatusController:
         return label
 
     def Start(self, window: tk.Misc) -> None:
-        if self._stopEvent is not None:
+        if self._onStateChanged is not None:
             return
 
-        stopEvent = threading.Event()
-        self._stopEvent = stopEvent
+        def onStateChanged(state: GameStateValue) -> None:
+            # Called on a poll worker; scheduling state lives on the UI thread.
+            self._uiScheduler.Post(lambda: self.__Apply(state.value))
 
-        def setTextFromWorker(text: str) -> None:
-            try:
-                window.after(0, lambda: self.SetText(text))
-            except Exception:
-                return
-
-        def workerLoop() -> None:
-            while True:
-                if stopEvent.is_set():
-                    return
-
-                host, port = self._getEndpoint()
-                try:
-                    response = self._apiClient.GetJson(host, port, "/api/protection")
-                    setTextFromWorker(self._FormatProtectionStatus(response))
-                except Exception as error:
-                    setTextFromWorker(self._localizer.Text("protection.label.error", message=str(error)))
-                stopEvent.wait(2.5)
-
-        self._workerThread = threading.Thread(target=workerLoop, name="ProtectionStatusPoll", daemon=True)
-        self._workerThread.start()
+        self._window = window
+        self._schedule.Reset()
+        self._onStateChanged = onStateChanged
+        self._gameState.Watch(self.ProtectionPath, onStateChanged, self._schedule.GetMaxIntervalSeconds())
 
     def Stop(self) -> None:
-        stopEvent = self._stopEvent
-        if stopEvent is None:
+        onStateChanged = self._onStateChanged
+        if onStateChanged is None:
             return
 
+        self._onStateChanged = None
+        self.__CancelCountdown()
+        self._window = None
         try:
-            stopEvent.set()
+            self._gameState.Unwatch(self.ProtectionPath, onStateChanged)
         except Exception:
-            pass
-
-        workerThread = self._workerThread
-
-        self._stopEvent = None
-        self._workerThread = None
-
-        if workerThread is not None:
-            try:
-                workerThread.join(timeout=0.5)
-            except Exception:
-                return
+            return
 
     def SetText(self, text: str) -> None:
         labelVar = self._labelVar
@@ -90,7 +88,41 @@ class ProtectionStatusController:
         except Exception:
             return
 
-    def _FormatProtectionStatus(self, response: object) -> str:
+    def __Apply(self, response: object) -> None:
+        if self._onStateChanged is None:
+            return
+
+        delaySeconds = self._schedule.Observe(response)
+        self._lastResponse = response
+        self._gameState.PollWithin(self.ProtectionPath, delaySeconds)
+        self.__CancelCountdown()
+        self.__RenderCountdown()
+
+    def __RenderCountdown(self) -> None:
+        self._countdownJob = None
+        remainingSeconds = self._schedule.GetRemainingSeconds()
+        self.SetText(self._FormatProtectionStatus(self._lastResponse, remainingSeconds))
+
+        window = self._window
+        if window is None or remainingSeconds is None or remainingSeconds <= 0:
+            return
+        try:
+            self._countdownJob = window.after(self.CountdownIntervalMs, self.__RenderCountdown)
+        except Exception:
+            self._countdownJob = None
+
+    def __CancelCountdown(self) -> None:
+        job = self._countdownJob
+        window = self._window
+        self._countdownJob = None
+        if job is None or window is None:
+            return
+        try:
+            window.after_cancel(job)
+        except Exception:
+            return
+
+    def _FormatProtectionStatus(self, response: object, remainingSeconds: float | None = None) -> str:
         if not isinstance(response, dict):
             return self._localizer.Text("protection.label.unknown")
 
@@ -113,11 +145,11 @@ class ProtectionStatusController:
         if not externalActive and not allBadActive:
             return self._localizer.Text("protection.label.off")
 
+        if remainingSeconds is None:
+            remainingSeconds = max(0, (allBadUntil if allBadActive else externalUntil) - nowTick) / 60.0
+        seconds = int(remainingSeconds)
+
         if allBadActive:
-            remainingTicks = max(0, allBadUntil - nowTick)
-            remainingSeconds = remainingTicks // 60
-            return self._localizer.Text("protection.label.allBad", seconds=remainingSeconds)
+            return self._localizer.Text("protection.label.allBad", seconds=seconds)
 
-        remainingTicks = max(0, externalUntil - nowTick)
-        remainingSeconds = remainingTicks // 60
-        return self._localizer.Text("protection.label.external", seconds=remainingSeconds)
+        return self._localizer.Text("protection.label.external", seconds=seconds)
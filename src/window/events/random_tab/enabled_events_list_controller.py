@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import tkinter as tk
-from typing import Callable, List
+from typing import Callable, FrozenSet, List
 
 from src.game_events.game_event_catalog_service import GameEventCatalogService
 from src.game_events.game_event_definition import GameEventDefinition
@@ -76,11 +76,23 @@ class EnabledEventsListController:
         self.__Render(preserveSelection=True, preferredSelection=selection)
 
     def GetEnabledDefinitionsAndTemplates(self) -> tuple[List[GameEventDefinition], List[GameEventTemplateDefinition]]:
-        selectedTags = {str(value).strip() for value in self._getSelectedTags() if str(value).strip()}
+        return self.GetEnabledDefinitionsAndTemplatesForTags(self.GetSelectedTagSet())
+
+    def GetEnabledDefinitionsAndTemplatesForTags(self, selectedTags: FrozenSet[str]) -> tuple[List[GameEventDefinition], List[GameEventTemplateDefinition]]:
+        """Resolve the enabled pool for an already captured tag selection.
+
+        Does not touch Tk variables, so it is safe to call from worker threads.
+        """
 
         definitions, templates = self.__GetVisibleDefinitionsAndTemplates()
 
-        return self._state.GetEnabled(definitions, templates, selectedTags)
+        return self._state.GetEnabled(definitions, templates, set(selectedTags))
+
+    def GetSelectedTagSet(self) -> FrozenSet[str]:
+        return frozenset(str(value).strip() for value in self._getSelectedTags() if str(value).strip())
+
+    def GetSelectionRevision(self) -> int:
+        return self._state.GetRevision()
 
     def __GetVisibleDefinitionsAndTemplates(self) -> tuple[List[GameEventDefinition], List[GameEventTemplateDefinition]]:
         definitions = [definition for definition in self._catalogService.GetAll() if not bool(getattr(definition, "hidden", False))]
@@ -21,11 +21,16 @@ class EnabledEventsListState:
         self._eventEnabledOverrides: Dict[str, bool] = {}
         self._templateEnabledOverrides: Dict[str, bool] = {}
         self._preferredSelection: Tuple[str, str] | None = None
+        self._revision = 0
 
     def Close(self) -> None:
         self._eventEnabledOverrides = {}
         self._templateEnabledOverrides = {}
         self._preferredSelection = None
+        self._revision += 1
+
+    def GetRevision(self) -> int:
+        return self._revision
 
     def GetPreferredSelection(self) -> Tuple[str, str] | None:
         return self._preferredSelection
@@ -60,6 +65,7 @@ class EnabledEventsListState:
 
     def Toggle(self, kind: str, identifier: str, tagEnabled: bool) -> None:
         self._preferredSelection = (kind, identifier)
+        self._revision += 1
 
         if kind == "event":
             current = self._eventEnabledOverrides.get(identifier, bool(tagEnabled))
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import random
+import threading
+from dataclasses import dataclass
+from typing import FrozenSet, List, Optional, Set, Tuple, Union
+
+from src.game_events.game_event_catalog_service import GameEventCatalogService
+from src.game_events.game_event_definition import GameEventDefinition
+from src.game_events.templates.game_event_template_catalog_service import GameEventTemplateCatalogService
+from src.game_events.templates.game_event_template_definition import GameEventTemplateDefinition
+from src.game_events.templates.game_event_template_instantiator import GameEventTemplateInstantiator
+from src.game_events.weighted_sampler import WeightedSampler
+from src.window.events.random_tab.enabled_events_list_controller import EnabledEventsListController
+
+
+RoundKey = Tuple[int, int, FrozenSet[str], int]
+PoolEntry = Union[GameEventDefinition, GameEventTemplateDefinition]
+
+
+@dataclass(frozen=True)
+class PreparedRound:
+    key: RoundKey
+    candidates: List[GameEventDefinition]
+    poolSize: int
+
+
+class NextRoundPreparer:
+    """NextRoundPreparer builds the next voting round on a worker thread.
+
+    The prepared round is keyed by the catalog versions and the tag/override
+    selection it was built from; `Take` only hands it out while that key still
+    matches, otherwise it rebuilds synchronously.
+    """
+
+    def __init__(
+        self,
+        catalogService: GameEventCatalogService,
+        templateCatalogService: GameEventTemplateCatalogService | None,
+        enabledEvents: EnabledEventsListController,
+        templateInstantiator: GameEventTemplateInstantiator,
+        candidateCount: int = 4,
+        randomSource: Optional[random.Random] = None,
+    ) -> None:
+        self._catalogService = catalogService
+        self._templateCatalogService = templateCatalogService
+        self._enabledEvents = enabledEvents
+        self._templateInstantiator = templateInstantiator
+        self._candidateCount = max(1, int(candidateCount))
+        self._random = randomSource if randomSource is not None else random.Random()
+
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._prepared: PreparedRound | None = None
+        self._cachedSampler: Tuple[RoundKey, WeightedSampler[PoolEntry]] | None = None
+
+    def StartPreparing(self) -> None:
+        """StartPreparing captures the current selection and builds the next round in the background.
+
+        Must be called from the UI thread (the tag selection lives in Tk variables).
+        """
+
+        selectedTags = self._enabledEvents.GetSelectedTagSet()
+        selectionRevision = self._enabledEvents.GetSelectionRevision()
+
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+            self._prepared = None
+
+        def worker() -> None:
+            try:
+                prepared = self.Build(selectedTags, selectionRevision)
+            except Exception:
+                return
+            with self._lock:
+                if generation == self._generation:
+                    self._prepared = prepared
+
+        threading.Thread(target=worker, name="VotingRoundPreparer", daemon=True).start()
+
+    def Take(self) -> PreparedRound:
+        """Take returns the prepared round if it is still valid, otherwise builds one now.
+
+        Must be called from the UI thread.
+        """
+
+        # Reload first so a catalog edited since preparing changes the key.
+        self.__ReloadCatalogs()
+        selectedTags = self._enabledEvents.GetSelectedTagSet()
+        selectionRevision = self._enabledEvents.GetSelectionRevision()
+        currentKey = self.__CurrentKey(selectedTags, selectionRevision)
+
+        with self._lock:
+            self._generation += 1
+            prepared = self._prepared
+            self._prepared = None
+
+        if prepared is not None and prepared.key == currentKey:
+            return prepared
+        return self.Build(selectedTags, selectionRevision)
+
+    def Cancel(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._prepared = None
+
+    def Build(self, selectedTags: FrozenSet[str], selectionRevision: int) -> PreparedRound:
+        """Build reloads changed catalogs and draws the candidates, instantiating only picked templates."""
+
+        self.__ReloadCatalogs()
+        key = self.__CurrentKey(selectedTags, selectionRevision)
+        sampler = self.__GetSampler(key, selectedTags)
+
+        # Draw in weighted order and instantiate only the templates that are actually picked.
+        chosen: List[GameEventDefinition] = []
+        chosenIds: Set[str] = set()
+        skipped = 0
+        for entry in sampler.IterateUnique():
+            if len(chosen) >= self._candidateCount:
+                break
+            if isinstance(entry, GameEventTemplateDefinition):
+                try:
+                    definition = self._templateInstantiator.Instantiate(entry)
+                except Exception:
+                    skipped += 1
+                    continue
+            else:
+                definition = entry
+            if definition.eventId in chosenIds:
+                skipped += 1
+                continue
+            chosenIds.add(definition.eventId)
+            chosen.append(definition)
+
+        # Entries that failed to instantiate or duplicated an event id are not
+        # usable; ones never drawn are assumed to be.
+        return PreparedRound(key=key, candidates=chosen, poolSize=len(sampler) - skipped)
+
+    def __ReloadCatalogs(self) -> None:
+        try:
+            self._catalogService.ReloadIfChanged()
+        except Exception:
+            pass
+        if self._templateCatalogService is not None:
+            try:
+                self._templateCatalogService.ReloadIfChanged()
+            except Exception:
+                pass
+
+    def __GetSampler(self, key: RoundKey, selectedTags: FrozenSet[str]) -> WeightedSampler[PoolEntry]:
+        cached = self._cachedSampler
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        definitions, templates = self._enabledEvents.GetEnabledDefinitionsAndTemplatesForTags(selectedTags)
+        pool: List[PoolEntry] = [*definitions, *templates]
+        sampler: WeightedSampler[PoolEntry] = WeightedSampler(pool, [float(entry.probability) for entry in pool], randomSource=self._random)
+        self._cachedSampler = (key, sampler)
+        return sampler
+
+    def __CurrentKey(self, selectedTags: FrozenSet[str], selectionRevision: int) -> RoundKey:
+        templateVersion = self._templateCatalogService.GetVersion() if self._templateCatalogService is not None else 0
+        return (self._catalogService.GetVersion(), templateVersion, selectedTags, selectionRevision)
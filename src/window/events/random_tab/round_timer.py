@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import math
+import time
+from typing import Callable
+
+
+class RoundTimer:
+    """RoundTimer tracks voting rounds against `time.monotonic()` deadlines.
+
+    The countdown is derived from the deadline instead of decrementing a counter,
+    so slow ticks or Tk stalls never stretch a round. Consecutive rounds are
+    chained deadline-to-deadline, keeping the schedule aligned with external
+    stream timers; lateness beyond the tolerance is recorded as an overrun.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic, overrunToleranceSeconds: float = 0.25) -> None:
+        self._clock = clock
+        self._overrunToleranceSeconds = max(0.0, float(overrunToleranceSeconds))
+
+        self._deadline: float | None = None
+        self._expectedTickAt: float | None = None
+        self._maxTickLatenessSeconds = 0.0
+
+    def Start(self, durationSeconds: float) -> None:
+        now = self._clock()
+        self._deadline = now + max(0.0, float(durationSeconds))
+        self._expectedTickAt = None
+        self._maxTickLatenessSeconds = 0.0
+
+    def Stop(self) -> None:
+        self._deadline = None
+        self._expectedTickAt = None
+        self._maxTickLatenessSeconds = 0.0
+
+    def IsRunning(self) -> bool:
+        return self._deadline is not None
+
+    def IsDue(self) -> bool:
+        return self._deadline is not None and self._clock() >= self._deadline
+
+    def GetRemainingSeconds(self) -> int:
+        """GetRemainingSeconds returns the whole seconds left, rounded up (0 once due)."""
+
+        if self._deadline is None:
+            return 0
+        remaining = self._deadline - self._clock()
+        if remaining <= 0:
+            return 0
+        # Small epsilon so a tick landing just after a boundary shows the new second.
+        return max(0, int(math.ceil(remaining - 0.001)))
+
+    def Advance(self, durationSeconds: float) -> float:
+        """Advance starts the next round from the previous deadline and returns its overrun in seconds.
+
+        If the previous round overran by more than a whole round, the schedule is
+        re-anchored to now instead of firing catch-up rounds.
+        """
+
+        now = self._clock()
+        duration = max(0.0, float(durationSeconds))
+        previousDeadline = self._deadline if self._deadline is not None else now
+
+        overrun = max(0.0, now - previousDeadline)
+        nextDeadline = previousDeadline + duration
+        if nextDeadline <= now:
+            nextDeadline = now + duration
+
+        self._deadline = nextDeadline
+        self._expectedTickAt = None
+        self._maxTickLatenessSeconds = 0.0
+        return overrun if overrun > self._overrunToleranceSeconds else 0.0
+
+    def MarkTick(self) -> float:
+        """MarkTick records the lateness of the tick that is running now and returns it in seconds."""
+
+        if self._expectedTickAt is None:
+            return 0.0
+        lateness = max(0.0, self._clock() - self._expectedTickAt)
+        self._expectedTickAt = None
+        if lateness > self._maxTickLatenessSeconds:
+            self._maxTickLatenessSeconds = lateness
+        return lateness if lateness > self._overrunToleranceSeconds else 0.0
+
+    def GetMaxTickLatenessSeconds(self) -> float:
+        return self._maxTickLatenessSeconds
+
+    def ScheduleNextTickMs(self) -> int:
+        """ScheduleNextTickMs returns the delay to the next whole-second boundary of the countdown.
+
+        The expected fire time is remembered so `MarkTick` can measure lateness.
+        """
+
+        if self._deadline is None:
+            return 1000
+        now = self._clock()
+        remaining = self._deadline - now
+        if remaining <= 0:
+            self._expectedTickAt = now
+            return 0
+
+        untilBoundary = remaining % 1.0
+        if untilBoundary < 0.001:
+            untilBoundary = 1.0 if remaining >= 1.0 else remaining
+        self._expectedTickAt = now + untilBoundary
+        return max(1, int(math.ceil(untilBoundary * 1000)))
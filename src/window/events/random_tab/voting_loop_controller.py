@@ -1,16 +1,18 @@
 from __future__ import annotations
 
-import random
+import concurrent.futures
 import tkinter as tk
 from typing import Callable, List
 
 from src.game_events.game_event_catalog_service import GameEventCatalogService
-from src.game_events.game_event_definition import GameEventDefinition
 from src.game_events.game_event_executor import GameEventExecutor
 from src.game_events.templates.game_event_template_catalog_service import GameEventTemplateCatalogService
 from src.game_events.templates.game_event_template_instantiator import GameEventTemplateInstantiator
 from src.voting.voting_service import VotingService
 from src.window.events.random_tab.enabled_events_list_controller import EnabledEventsListController
+from src.window.events.random_tab.next_round_preparer import NextRoundPreparer
+from src.window.events.random_tab.round_timer import RoundTimer
+from src.window.ui_thread_scheduler import UiThreadScheduler
 from src.core.localization.localizer import Localizer
 
 
@@ -29,6 +31,7 @@ class VotingLoopController:
         setStatus: Callable[[str], None],
         setRunningUi: Callable[[bool], None],
         updateTimerUi: Callable[[int], None],
+        uiScheduler: UiThreadScheduler,
         localizer: Localizer | None = None,
     ) -> None:
         self._catalogService = catalogService
@@ -37,6 +40,7 @@ class VotingLoopController:
         self._votingService = votingService
         self._executor = executor
         self._templateInstantiator = templateInstantiator
+        self._roundPreparer = NextRoundPreparer(catalogService, templateCatalogService, enabledEvents, templateInstantiator)
 
         self._getHost = getHost
         self._getPort = getPort
@@ -45,11 +49,12 @@ class VotingLoopController:
         self._setRunningUi = setRunningUi
         self._updateTimerUi = updateTimerUi
         self._localizer = localizer
+        self._uiScheduler = uiScheduler
 
         self._window: tk.Toplevel | None = None
         self._running = False
         self._countdownId: str | None = None
-        self._remainingSeconds: int = 0
+        self._roundTimer = RoundTimer()
 
     def AttachWindow(self, window: tk.Toplevel) -> None:
         self._window = window
@@ -71,7 +76,7 @@ class VotingLoopController:
         self._running = True
         self._setRunningUi(True)
 
-        self._remainingSeconds = self.__GetSafeDurationSeconds()
+        self._roundTimer.Start(self.__GetSafeDurationSeconds())
         self._setStatus(self.__Text("events.random.status.votingStarted", default="Voting started"))
 
         self.__StartRound()
@@ -80,6 +85,8 @@ class VotingLoopController:
     def Stop(self) -> None:
         self._running = False
         self.__CancelCountdown()
+        self._roundTimer.Stop()
+        self._roundPreparer.Cancel()
         try:
             self._votingService.StopPoll()
         except Exception:
@@ -89,31 +96,18 @@ class VotingLoopController:
         self._setStatus(self.__Text("events.random.status.stopped", default="Stopped"))
 
     def __StartRound(self) -> None:
-        try:
-            self._catalogService.Reload()
-        except Exception:
-            pass
-        if self._templateCatalogService is not None:
-            try:
-                self._templateCatalogService.Reload()
-            except Exception:
-                pass
-
-        definitions, templates = self._enabledEvents.GetEnabledDefinitionsAndTemplates()
-        pool = list(definitions)
-        for template in templates:
-            try:
-                pool.append(self._templateInstantiator.Instantiate(template))
-            except Exception:
-                continue
+        # Swap in the round prepared in the background during the previous round
+        # (falls back to a synchronous build when the catalog or selection changed).
+        prepared = self._roundPreparer.Take()
+        if self._running:
+            self._roundPreparer.StartPreparing()
 
-        if not pool:
+        if prepared.poolSize <= 0:
             self._votingService.StartPollWithDefinitions([])
             self._setStatus(self.__Text("events.random.status.noEnabled", default="No enabled events (check tags)"))
             return
 
-        chosen = self.__PickWeightedUnique(pool, 4)
-        self._votingService.StartPollWithDefinitions(chosen)
+        self._votingService.StartPollWithDefinitions(prepared.candidates)
         self._setStatus(self.__Text("events.random.status.newRound", default="New round started"))
 
     def __Tick(self) -> None:
@@ -124,16 +118,25 @@ class VotingLoopController:
             self.Stop()
             return
 
-        self._updateTimerUi(self._remainingSeconds)
-        if self._remainingSeconds <= 0:
+        self._roundTimer.MarkTick()
+        if self._roundTimer.IsDue():
+            self._updateTimerUi(0)
             self.__ResolveAndExecuteWinner()
-            self._remainingSeconds = self.__GetSafeDurationSeconds()
+            longestStall = self._roundTimer.GetMaxTickLatenessSeconds()
+            overrun = self._roundTimer.Advance(self.__GetSafeDurationSeconds())
+            if overrun > 0:
+                self.__ReportOverrun(overrun, longestStall)
             self.__StartRound()
-            self._countdownId = self._window.after(0, self.__Tick)
-            return
 
-        self._remainingSeconds -= 1
-        self._countdownId = self._window.after(1000, self.__Tick)
+        # Countdown is derived from the monotonic deadline; ticks land on whole-second boundaries.
+        self._updateTimerUi(self._roundTimer.GetRemainingSeconds())
+        self._countdownId = self._window.after(self._roundTimer.ScheduleNextTickMs(), self.__Tick)
+
+    def __ReportOverrun(self, overrunSeconds: float, longestStallSeconds: float) -> None:
+        try:
+            print(f"VotingLoopController: round overran its deadline by {overrunSeconds:.2f}s (longest tick stall {longestStallSeconds:.2f}s)")
+        except Exception:
+            pass
 
     def __GetSafeDurationSeconds(self) -> int:
         try:
@@ -150,19 +153,44 @@ class VotingLoopController:
             return
 
         winner = definitions[winnerIndex]
+        display = winner.label
         try:
-            results = self._executor.Execute(self._getHost(), self._getPort(), winner)
-            summary = results[0] if results else "ok"
+            if winner.userMessage is not None and str(winner.userMessage).strip() != "":
+                display = str(winner.userMessage).strip()
+        except Exception:
             display = winner.label
+
+        host = self._getHost()
+        port = self._getPort()
+        self._setStatus(self.__Text("events.random.status.executing", default=f"Executing: {display}...", display=display))
+
+        # Runs on the shared event loop; the timer keeps ticking while RimAPI is busy.
+        def onDone(future: "concurrent.futures.Future[List[str]]") -> None:
             try:
-                if winner.userMessage is not None and str(winner.userMessage).strip() != "":
-                    display = str(winner.userMessage).strip()
-            except Exception:
-                display = winner.label
-            self._setStatus(self.__Text("events.random.status.executed", default=f"Executed: {display} ({summary})", display=display, summary=summary))
+                results = future.result()
+            except Exception as error:
+                failure = error
+                self.__PostToUi(lambda: self.__FinishExecution(display, None, failure))
+                return
+            self.__PostToUi(lambda: self.__FinishExecution(display, results, None))
+
+        try:
+            self._executor.Submit(host, port, winner).add_done_callback(onDone)
         except Exception as error:
             self._setStatus(self.__Text("events.random.status.executionFailed", default=f"Execution failed: {error}", error=str(error)))
 
+    def __FinishExecution(self, display: str, results: List[str] | None, error: Exception | None) -> None:
+        if error is not None:
+            self._setStatus(self.__Text("events.random.status.executionFailed", default=f"Execution failed: {error}", error=str(error)))
+            return
+
+        summary = results[0] if results else "ok"
+        self._setStatus(self.__Text("events.random.status.executed", default=f"Executed: {display} ({summary})", display=display, summary=summary))
+
+    def __PostToUi(self, work: Callable[[], None]) -> None:
+        # Called from executor threads: Tk may only be touched from its own thread.
+        self._uiScheduler.Post(work)
+
     def __Text(self, key: str, default: str, **formatArgs: object) -> str:
         if self._localizer is None:
             return default
@@ -171,21 +199,6 @@ class VotingLoopController:
         except Exception:
             return default
 
-    def __PickWeightedUnique(self, pool: List[GameEventDefinition], count: int) -> List[GameEventDefinition]:
-        remaining = list(pool)
-        chosen: List[GameEventDefinition] = []
-
-        while remaining and len(chosen) < count:
-            weights = [max(0.0, float(item.probability)) for item in remaining]
-            if all(weight == 0.0 for weight in weights):
-                selection = random.choice(remaining)
-            else:
-                selection = random.choices(remaining, weights=weights, k=1)[0]
-            chosen.append(selection)
-            remaining = [item for item in remaining if item.eventId != selection.eventId]
-
-        return chosen
-
     def __CancelCountdown(self) -> None:
         if self._window is None:
             return
@@ -14,6 +14,7 @@ from src.window.events.random_tab.tags_panel_controller import TagsPanelControll
 from src.window.events.random_tab.vote_controls_controller import VoteControlsController
 from src.window.events.random_tab.voting_loop_controller import VotingLoopController
 from src.window.theme import Theme
+from src.window.ui_thread_scheduler import UiThreadScheduler
 from src.core.localization.localizer import Localizer
 
 
@@ -27,6 +28,7 @@ class RandomTabController:
         templateInstantiator: GameEventTemplateInstantiator,
         settingsService: SettingsService,
         setStatus: Callable[[str], None],
+        uiScheduler: UiThreadScheduler,
         localizer: Localizer | None = None,
     ) -> None:
         self._catalogService = catalogService
@@ -37,6 +39,7 @@ class RandomTabController:
         self._settingsService = settingsService
         self._setStatus = setStatus
         self._localizer = localizer
+        self._uiScheduler = uiScheduler
 
         self._window: tk.Toplevel | None = None
         self._endpointLabelVar: tk.StringVar | None = None
@@ -68,6 +71,7 @@ class RandomTabController:
             setStatus=self._setStatus,
             setRunningUi=self._voteControls.SetRunning,
             updateTimerUi=self._voteControls.UpdateTimer,
+            uiScheduler=self._uiScheduler,
             localizer=self._localizer,
         )
         self._votingLoop.AttachWindow(window)
@@ -10,6 +10,8 @@ from src.game_events.templates.game_event_template_catalog_service import GameEv
 from src.game_events.templates.game_event_template_instantiator import GameEventTemplateInstantiator
 from src.game_events.templates.template_distribution_sampler import TemplateDistributionSampler
 from src.game_events.templates.template_value_resolver import TemplateValueResolver
+from src.rimapi.game_clock_service import GameClockService
+from src.rimapi.game_state_service import GameStateService
 from src.voting.voting_service import VotingService
 from src.core.settings.settings_service import SettingsService
 from src.core.localization.localizer_provider import LocalizerProvider
@@ -18,6 +20,7 @@ from src.window.events.events_catalog_loader import EventsCatalogLoader
 from src.window.events.catalog_item import CatalogItem
 from src.window.events.catalog_tab import CatalogTab
 from src.window.events.editor_tab.editor_tab import EditorTab
+from src.window.events.editor_tab.game_api_catalog_store import GameApiCatalogStore
 from src.window.events.event_test_runner import EventTestRunner
 from src.window.events.events_window_view import EventsWindowView
 from src.window.events.events_window_state import EventsWindowState
@@ -38,9 +41,12 @@ class EventsWindowService:
         executor: GameEventExecutor,
         settingsService: SettingsService,
         apiClient: RestApiClient,
+        gameStateService: GameStateService,
         localizerProvider: LocalizerProvider,
-        uiScheduler: UiThreadScheduler | None = None,
+        uiScheduler: UiThreadScheduler,
         templateCatalogService: GameEventTemplateCatalogService | None = None,
+        gameClockService: GameClockService | None = None,
+        catalogStore: GameApiCatalogStore | None = None,
     ) -> None:
         self._localizerProvider = localizerProvider
         self._localizer = self._localizerProvider.Get()
@@ -50,7 +56,7 @@ class EventsWindowService:
         self._endpointProvider = RimApiEndpointProvider(settingsService)
 
         self._windowState = EventsWindowState()
-        self._protectionStatus = ProtectionStatusController(apiClient, self._endpointProvider.GetEndpoint, self._localizer)
+        self._protectionStatus = ProtectionStatusController(gameStateService, self._localizer, self._uiScheduler, gameClockService)
         self._items: List[CatalogItem] = []
 
         self._testRunner = EventTestRunner(executor, self._localizer)
@@ -62,7 +68,7 @@ class EventsWindowService:
         self._catalogTab = CatalogTab(self.__OnSelectionChanged, onTestAllRequested=self.__StartTestAllRun, localizer=self._localizer)
         self._catalogActions = EventsCatalogActions(self._catalogTab, self.__GetItems, self.__SetStatus, self._localizer)
 
-        self._editorTab = EditorTab(settingsService, executor, apiClient, self.__SetStatus, localizer=self._localizer)
+        self._editorTab = EditorTab(settingsService, executor, apiClient, self.__SetStatus, localizer=self._localizer, gameClock=gameClockService, catalogStore=catalogStore)
 
         templateInstantiator = GameEventTemplateInstantiator(TemplateDistributionSampler(), TemplateValueResolver())
         self._randomTab = RandomTabController(
@@ -73,6 +79,7 @@ class EventsWindowService:
             templateInstantiator,
             settingsService,
             self.__SetStatus,
+            self._uiScheduler,
             localizer=self._localizer,
         )
 
@@ -141,10 +148,6 @@ class EventsWindowService:
         self._testRunner.StartForVisibleCatalogItems(window, host, port, self._catalogTab, self._items, self.__SetStatus)
 
     def __ReloadAndRender(self) -> None:
-        if self._uiScheduler is None:
-            self.__ReloadAndRenderBlocking()
-            return
-
         window = self._windowState.window
         if window is None:
             return
@@ -184,23 +187,6 @@ class EventsWindowService:
 
         threading.Thread(target=worker, name="EventsReload", daemon=True).start()
 
-    def __ReloadAndRenderBlocking(self) -> None:
-        try:
-            merged, normalCount, randomCount = self._catalogLoader.Reload()
-            self._items = merged
-
-            self._catalogTab.SetItems(self._items)
-            if self._items:
-                self._catalogTab.SelectFirst()
-                self.__OnSelectionChanged()
-            else:
-                self._catalogTab.ClearDetails(self._localizer.Text("events.details.noEventsLoaded"))
-
-            self._randomTab.ReloadTags()
-            self.__SetStatus(self._localizer.Text("events.status.loaded", normalCount=normalCount, randomCount=randomCount))
-        except Exception as error:
-            self.__SetStatus(self._localizer.Text("events.status.reloadFailed", error=str(error)))
-
     def __SetBusy(self, isBusy: bool) -> None:
         reloadButton = self._windowState.reloadButton
         openButton = self._windowState.openButton
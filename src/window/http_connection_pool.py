@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import http.client
+import select
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Mapping, Optional, Tuple
+
+from src.window.request_tracer import RequestTrace
+
+
+class HttpResponseData:
+    """HttpResponseData is a fully read HTTP response."""
+
+    def __init__(self, status: int, reason: str, body: bytes, headers: Dict[str, str]) -> None:
+        self.status = status
+        self.reason = reason
+        self.body = body
+        self.headers = headers
+
+
+class _RequestNotSent(Exception):
+    """Raised (from the socket error) when a request failed before it was written."""
+
+
+class HttpConnectionPool:
+    """HttpConnectionPool keeps idle keep-alive connections per (host, port).
+
+    Connections are checked out for exactly one request, so the pool can be
+    shared across threads. Idle sockets the server already closed are
+    dropped at checkout. If a reused socket still turns out stale, the
+    request is retried once on a fresh connection, but only when it was
+    never written or the method is idempotent: a POST the server may have
+    received is not sent twice. Only `maxIdlePerHost` idle connections are
+    kept per endpoint; extra connections are closed after use.
+    """
+
+    IdempotentMethods = frozenset({"GET", "HEAD", "OPTIONS"})
+
+    # Errors that mean a reused keep-alive socket went stale before we used it.
+    _StaleErrors = (
+        http.client.RemoteDisconnected,
+        http.client.BadStatusLine,
+        http.client.CannotSendRequest,
+        http.client.ResponseNotReady,
+        ConnectionResetError,
+        ConnectionAbortedError,
+        BrokenPipeError,
+    )
+
+    def __init__(self, maxIdlePerHost: int = 4, connectTimeoutSeconds: float = 5.0) -> None:
+        self._maxIdlePerHost = max(0, int(maxIdlePerHost))
+        self._connectTimeoutSeconds = float(connectTimeoutSeconds) if float(connectTimeoutSeconds) > 0 else 5.0
+        self._lock = threading.Lock()
+        self._idle: Dict[Tuple[str, int], Deque[http.client.HTTPConnection]] = {}
+
+    def Request(
+        self,
+        host: str,
+        port: int,
+        method: str,
+        target: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        timeoutSeconds: float = 10.0,
+        trace: Optional[RequestTrace] = None,
+    ) -> HttpResponseData:
+        """Request performs one HTTP call and reads the whole body.
+
+        Raises OSError / http.client.HTTPException when the endpoint cannot be reached.
+        Phase timings are added to `trace` when one is given.
+        """
+
+        key = (str(host), int(port))
+        if trace is not None:
+            queuedAt = time.monotonic()
+            connection, isReused = self.__Acquire(key)
+            trace.queue += time.monotonic() - queuedAt
+        else:
+            connection, isReused = self.__Acquire(key)
+        try:
+            return self.__Send(key, connection, method, target, body, headers, timeoutSeconds, trace)
+        except _RequestNotSent as error:
+            connection.close()
+            if not isReused:
+                raise error.__cause__ from None
+        except self._StaleErrors:
+            connection.close()
+            # The request went out; only repeat it when doing so is harmless.
+            if not isReused or str(method).upper() not in self.IdempotentMethods:
+                raise
+        except BaseException:
+            connection.close()
+            raise
+
+        # The pooled socket was stale; retry once on a brand new connection.
+        connection = self.__Connect(key)
+        try:
+            return self.__Send(key, connection, method, target, body, headers, timeoutSeconds, trace)
+        except _RequestNotSent as error:
+            connection.close()
+            raise error.__cause__ from None
+        except BaseException:
+            connection.close()
+            raise
+
+    def CloseAll(self) -> None:
+        with self._lock:
+            pooled = [connection for connections in self._idle.values() for connection in connections]
+            self._idle = {}
+        for connection in pooled:
+            try:
+                connection.close()
+            except Exception:
+                pass
+
+    def GetIdleCount(self, host: str, port: int) -> int:
+        with self._lock:
+            return len(self._idle.get((str(host), int(port)), ()))
+
+    def __Send(
+        self,
+        key: Tuple[str, int],
+        connection: http.client.HTTPConnection,
+        method: str,
+        target: str,
+        body: Optional[bytes],
+        headers: Optional[Mapping[str, str]],
+        timeoutSeconds: float,
+        trace: Optional[RequestTrace],
+    ) -> HttpResponseData:
+        if trace is None:
+            self.__ApplyTimeout(connection, timeoutSeconds)
+            self.__Write(connection, method, target, body, headers)
+            response = connection.getresponse()
+            data = response.read()
+        else:
+            connectStartedAt = time.monotonic()
+            self.__ApplyTimeout(connection, timeoutSeconds)
+            sentAt = time.monotonic()
+            trace.connect += sentAt - connectStartedAt
+            self.__Write(connection, method, target, body, headers)
+            response = connection.getresponse()
+            headersAt = time.monotonic()
+            trace.firstByte += headersAt - sentAt
+            data = response.read()
+            trace.body += time.monotonic() - headersAt
+            trace.status = int(response.status)
+            trace.bytes = len(data)
+        result = HttpResponseData(
+            status=int(response.status),
+            reason=str(response.reason or ""),
+            body=data,
+            headers={str(name): str(value) for name, value in response.getheaders()},
+        )
+
+        if response.will_close:
+            connection.close()
+        else:
+            self.__Release(key, connection)
+        return result
+
+    def __Write(
+        self,
+        connection: http.client.HTTPConnection,
+        method: str,
+        target: str,
+        body: Optional[bytes],
+        headers: Optional[Mapping[str, str]],
+    ) -> None:
+        try:
+            connection.request(method, target, body=body, headers=dict(headers or {}))
+        except (http.client.CannotSendRequest, BrokenPipeError, ConnectionResetError, ConnectionAbortedError) as error:
+            # The server closed before taking the request, so it cannot have run it.
+            raise _RequestNotSent() from error
+
+    def __Acquire(self, key: Tuple[str, int]) -> Tuple[http.client.HTTPConnection, bool]:
+        while True:
+            with self._lock:
+                connections = self._idle.get(key)
+                if not connections:
+                    break
+                connection = connections.pop()
+            if self.__IsAlive(connection):
+                return connection, True
+            connection.close()
+        return self.__Connect(key), False
+
+    def __IsAlive(self, connection: http.client.HTTPConnection) -> bool:
+        # An idle keep-alive socket has nothing to read; readable means the
+        # server closed it (EOF) or sent something unexpected.
+        sock = connection.sock
+        if sock is None:
+            return False
+        try:
+            readable, _, _ = select.select([sock], [], [], 0)
+        except (OSError, ValueError):
+            return False
+        return not readable
+
+    def __Release(self, key: Tuple[str, int], connection: http.client.HTTPConnection) -> None:
+        with self._lock:
+            connections = self._idle.setdefault(key, deque())
+            if len(connections) < self._maxIdlePerHost:
+                connections.append(connection)
+                return
+        connection.close()
+
+    def __Connect(self, key: Tuple[str, int]) -> http.client.HTTPConnection:
+        host, port = key
+        return http.client.HTTPConnection(host, port, timeout=self._connectTimeoutSeconds)
+
+    def __ApplyTimeout(self, connection: http.client.HTTPConnection, timeoutSeconds: float) -> None:
+        timeout = float(timeoutSeconds) if float(timeoutSeconds) > 0 else None
+        if connection.sock is None:
+            # Connect with the (shorter) connect timeout, then switch to the request timeout.
+            connection.timeout = min(self._connectTimeoutSeconds, timeout) if timeout is not None else self._connectTimeoutSeconds
+            connection.connect()
+        connection.timeout = timeout
+        if connection.sock is not None:
+            connection.sock.settimeout(timeout)
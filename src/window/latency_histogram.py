@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from typing import Dict, List, Tuple
+
+
+class LatencyHistogram:
+    """LatencyHistogram is a small HDR-style histogram of microsecond values.
+
+    Values below `2 * halfBucketCount` get one bucket each; above that every
+    power of two is split into `halfBucketCount` linear sub-buckets, so the
+    relative error stays below 1 / halfBucketCount (about 6% by default) from
+    microseconds to minutes with a few hundred buckets at most. Counts are
+    kept sparse. Not thread-safe; callers serialize access.
+    """
+
+    def __init__(self, halfBucketCount: int = 16) -> None:
+        self._half = max(2, int(halfBucketCount))
+        self._linearLimit = self._half * 2
+        self._linearBits = self._linearLimit.bit_length()
+        self._counts: Dict[int, int] = {}
+        self._total = 0
+        self._sum = 0
+        self._min = 0
+        self._max = 0
+
+    def Record(self, valueMicroseconds: int) -> None:
+        value = max(0, int(valueMicroseconds))
+        index = self.__IndexOf(value)
+        self._counts[index] = self._counts.get(index, 0) + 1
+        if self._total == 0 or value < self._min:
+            self._min = value
+        if value > self._max:
+            self._max = value
+        self._total += 1
+        self._sum += value
+
+    def GetCount(self) -> int:
+        return self._total
+
+    def GetPercentile(self, percentile: float) -> int:
+        """GetPercentile returns the upper bound of the bucket holding the given percentile (0-100)."""
+
+        if self._total == 0:
+            return 0
+        threshold = max(1, int(round(self._total * min(100.0, max(0.0, float(percentile))) / 100.0)))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= threshold:
+                return min(self._max, self.__BucketRange(index)[1])
+        return self._max
+
+    def ToDict(self) -> Dict[str, object]:
+        buckets: List[List[int]] = []
+        for index in sorted(self._counts):
+            low, high = self.__BucketRange(index)
+            buckets.append([low, high, self._counts[index]])
+        return {
+            "count": self._total,
+            "minUs": self._min,
+            "maxUs": self._max,
+            "meanUs": round(self._sum / self._total, 1) if self._total else 0,
+            "p50Us": self.GetPercentile(50),
+            "p90Us": self.GetPercentile(90),
+            "p99Us": self.GetPercentile(99),
+            "p999Us": self.GetPercentile(99.9),
+            "buckets": buckets,
+        }
+
+    def __IndexOf(self, value: int) -> int:
+        if value < self._linearLimit:
+            return value
+        shift = value.bit_length() - self._linearBits + 1
+        subBucket = value >> shift  # in [half, 2 * half)
+        return self._linearLimit + (shift - 1) * self._half + (subBucket - self._half)
+
+    def __BucketRange(self, index: int) -> Tuple[int, int]:
+        if index < self._linearLimit:
+            return index, index
+        offset = index - self._linearLimit
+        shift = offset // self._half + 1
+        subBucket = offset % self._half + self._half
+        low = subBucket << shift
+        return low, low + (1 << shift) - 1
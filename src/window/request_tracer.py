@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Deque, Dict, List, Optional, Tuple
+
+from src.window.latency_histogram import LatencyHistogram
+
+
+class RequestTrace:
+    """RequestTrace collects the phase timings of one HTTP call (seconds, monotonic)."""
+
+    Phases = ("queue", "connect", "firstByte", "body", "parse", "total")
+
+    def __init__(self, method: str, route: str) -> None:
+        self.method = method
+        self.route = route
+        self.status = 0
+        self.bytes = 0
+        self.error = ""
+        self.startedAt = time.monotonic()
+        self.queue = 0.0
+        self.connect = 0.0
+        self.firstByte = 0.0
+        self.body = 0.0
+        self.parse = 0.0
+        self.total = 0.0
+
+    def ToDict(self) -> Dict[str, object]:
+        data: Dict[str, object] = {
+            "method": self.method,
+            "route": self.route,
+            "status": self.status,
+            "bytes": self.bytes,
+        }
+        for phase in self.Phases:
+            data[f"{phase}Ms"] = round(float(getattr(self, phase)) * 1000.0, 3)
+        if self.error:
+            data["error"] = self.error
+        return data
+
+
+class RequestTracer:
+    """RequestTracer keeps recent RimAPI request timings for diagnosing slow events.
+
+    Disabled by default: `Begin` then returns None and every instrumentation
+    point reduces to an `is not None` check. When enabled, finished traces go
+    to a ring buffer of the last `capacity` requests and to per-route
+    (method + templated path) histograms for each phase.
+    """
+
+    def __init__(self, enabled: bool = False, capacity: int = 512) -> None:
+        self._enabled = bool(enabled)
+        self._lock = threading.Lock()
+        self._recent: Deque[RequestTrace] = deque(maxlen=max(1, int(capacity)))
+        self._histograms: Dict[Tuple[str, str], Dict[str, LatencyHistogram]] = {}
+        self._statusCounts: Dict[Tuple[str, str], Dict[str, int]] = {}
+        self._bytes: Dict[Tuple[str, str], int] = {}
+
+    def IsEnabled(self) -> bool:
+        return self._enabled
+
+    def SetEnabled(self, enabled: bool) -> None:
+        self._enabled = bool(enabled)
+
+    def Begin(self, method: str, route: str) -> Optional[RequestTrace]:
+        if not self._enabled:
+            return None
+        return RequestTrace(method, route)
+
+    def Finish(self, trace: Optional[RequestTrace]) -> None:
+        if trace is None:
+            return
+        trace.total = time.monotonic() - trace.startedAt
+        key = (trace.method, trace.route)
+        statusKey = str(trace.status) if trace.status else (trace.error or "error")
+        with self._lock:
+            self._recent.append(trace)
+            histograms = self._histograms.get(key)
+            if histograms is None:
+                histograms = {phase: LatencyHistogram() for phase in RequestTrace.Phases}
+                self._histograms[key] = histograms
+            for phase in RequestTrace.Phases:
+                histograms[phase].Record(int(float(getattr(trace, phase)) * 1_000_000))
+            statusCounts = self._statusCounts.setdefault(key, {})
+            statusCounts[statusKey] = statusCounts.get(statusKey, 0) + 1
+            self._bytes[key] = self._bytes.get(key, 0) + int(trace.bytes)
+
+    def GetRecent(self) -> List[Dict[str, object]]:
+        with self._lock:
+            return [trace.ToDict() for trace in self._recent]
+
+    def GetHistograms(self) -> Dict[str, object]:
+        routes: List[Dict[str, object]] = []
+        with self._lock:
+            for key in sorted(self._histograms):
+                method, route = key
+                routes.append(
+                    {
+                        "method": method,
+                        "route": route,
+                        "statuses": dict(self._statusCounts.get(key, {})),
+                        "bytes": self._bytes.get(key, 0),
+                        "phases": {phase: histogram.ToDict() for phase, histogram in self._histograms[key].items()},
+                    }
+                )
+        return {"routes": routes}
+
+    def DumpJson(self, includeRecent: bool = False) -> str:
+        """DumpJson returns the per-route histograms (and optionally the ring buffer) as JSON."""
+
+        data = self.GetHistograms()
+        if includeRecent:
+            data["recent"] = self.GetRecent()
+        return json.dumps(data, indent=2)
+
+    def WriteJson(self, path: Path, includeRecent: bool = True) -> None:
+        path.write_text(self.DumpJson(includeRecent=includeRecent), encoding="utf-8")
+
+    def Reset(self) -> None:
+        with self._lock:
+            self._recent.clear()
+            self._histograms = {}
+            self._statusCounts = {}
+            self._bytes = {}
@@ -1,14 +1,71 @@
+import asyncio
 import json
-import urllib.error
-import urllib.parse
-import urllib.request
+import time
 from typing import Dict, Optional, Tuple
 
+from src.window.async_http_client import AsyncHttpClient
+from src.window.encoded_http_request import EncodedHttpRequest
+from src.window.endpoint_health_tracker import EndpointHealthTracker
+from src.window.http_connection_pool import HttpConnectionPool, HttpResponseData
+from src.window.request_tracer import RequestTrace, RequestTracer
+
 
 class RestApiClient:
-    """RestApiClient executes configured REST actions."""
+    """RestApiClient executes configured REST actions.
+
+    Blocking calls go through a shared keep-alive `HttpConnectionPool`; the
+    `*Async` variants use an `AsyncHttpClient` and must be awaited on the
+    shared event loop. Both produce the same result shapes.
+
+    Action/params calls take string params and coerce JSON values back from
+    text; `ExecuteEncoded*` send a pre-rendered `EncodedHttpRequest` as-is.
+
+    Every call goes through an `EndpointHealthTracker`: while RimAPI is down
+    (loading a save, 503s, hangs) calls fail fast with
+    `EndpointHealthTracker.UnavailableMessage`, a `GET /api/status` probe
+    closes the circuit again, and default timeouts follow observed latency.
+
+    When the `RequestTracer` is enabled each call records queue, connect,
+    first-byte, body and parse times per method + templated path.
+    """
+
+    ProbePath = "/api/status"
+    ProbeTimeoutSeconds = 2.0
+    _UnavailableStatuses = (502, 503, 504)
+
+    def __init__(
+        self,
+        connectionPool: Optional[HttpConnectionPool] = None,
+        queryTimeoutSeconds: float = 8.0,
+        jsonTimeoutSeconds: float = 10.0,
+        asyncClient: Optional[AsyncHttpClient] = None,
+        healthTracker: Optional[EndpointHealthTracker] = None,
+        tracer: Optional[RequestTracer] = None,
+    ) -> None:
+        self._connectionPool = connectionPool if connectionPool is not None else HttpConnectionPool()
+        self._asyncClient = asyncClient if asyncClient is not None else AsyncHttpClient()
+        self._healthTracker = healthTracker if healthTracker is not None else EndpointHealthTracker()
+        self._tracer = tracer if tracer is not None else RequestTracer()
+        self._queryTimeoutSeconds = float(queryTimeoutSeconds)
+        self._jsonTimeoutSeconds = float(jsonTimeoutSeconds)
+
+    def Close(self) -> None:
+        self._connectionPool.CloseAll()
+
+    async def CloseAsync(self) -> None:
+        await self._asyncClient.CloseAll()
+
+    def GetTracer(self) -> RequestTracer:
+        return self._tracer
+
+    def IsAvailable(self, host: str, port: int) -> bool:
+        """IsAvailable is False while the endpoint's circuit is open (calls would fail fast)."""
+
+        safeHost = host or "localhost"
+        safePort = port if 0 < port <= 65535 else 8765
+        return self._healthTracker.IsAvailable(safeHost, safePort)
 
-    def Execute(self, host: str, port: int, action: Dict[str, object], params: Dict[str, str], headers: Optional[Dict[str, str]] = None) -> str:
+    def Execute(self, host: str, port: int, action: Dict[str, object], params: Dict[str, str], headers: Optional[Dict[str, str]] = None, timeoutSeconds: Optional[float] = None) -> str:
         """Execute performs HTTP call.
 
         Args:
@@ -16,127 +73,108 @@ class RestApiClient:
             port: API port.
             action: Action config with method/path/payload.
             params: User-provided parameters.
+            timeoutSeconds: Optional override of the default request timeout.
 
         Returns:
             Short status text.
         """
 
-        safeHost = host or "localhost"
-        safePort = port if 0 < port <= 65535 else 8765
-        method = str(action.get("method", "GET")).upper()
-        pathTemplate = str(action.get("path", "/"))
-        payloadKind = str(action.get("payload", "query"))
-
-        renderedPath, remainingParams = self.__RenderPath(pathTemplate, params)
+        try:
+            prepared = self.__Prepare(host, port, action, params, headers, timeoutSeconds)
+            return self.__FormatSummary(*self.__Send(*prepared))
+        except Exception as error:
+            return str(error)
 
-        baseUrl = f"http://{safeHost}:{safePort}".rstrip("/")
-        url = f"{baseUrl}{renderedPath}"
+    async def ExecuteAsync(self, host: str, port: int, action: Dict[str, object], params: Dict[str, str], headers: Optional[Dict[str, str]] = None, timeoutSeconds: Optional[float] = None) -> str:
+        """ExecuteAsync is the awaitable counterpart of Execute."""
 
         try:
-            request, timeoutSeconds = self.__BuildRequest(method, url, payloadKind, remainingParams, headers=headers)
-            response = urllib.request.urlopen(request, timeout=timeoutSeconds)
-            body = response.read().decode("utf-8", "ignore")
-            return self.__Summarize(body)
-        except urllib.error.HTTPError as error:
-            try:
-                body = error.read().decode("utf-8", "ignore")
-                summary = self.__Summarize(body)
-                return f"HTTP {error.code} {error.reason}: {summary}"
-            except Exception:
-                return f"HTTP {error.code} {error.reason}"
+            prepared = self.__Prepare(host, port, action, params, headers, timeoutSeconds)
+            return self.__FormatSummary(*await self.__SendAsync(*prepared))
+        except asyncio.TimeoutError:
+            return "timed out"
         except Exception as error:
             return str(error)
 
-    def ExecuteDetailed(self, host: str, port: int, action: Dict[str, object], params: Dict[str, str], headers: Optional[Dict[str, str]] = None) -> Dict[str, object]:
+    def ExecuteDetailed(self, host: str, port: int, action: Dict[str, object], params: Dict[str, str], headers: Optional[Dict[str, str]] = None, timeoutSeconds: Optional[float] = None) -> Dict[str, object]:
         """ExecuteDetailed performs the HTTP call and returns status + full response body.
 
         This is intended for debugging/test runs where callers need the full response,
         not just the summarized status text.
         """
 
-        safeHost = host or "localhost"
-        safePort = port if 0 < port <= 65535 else 8765
-        method = str(action.get("method", "GET")).upper()
-        pathTemplate = str(action.get("path", "/"))
-        payloadKind = str(action.get("payload", "query"))
+        try:
+            prepared = self.__Prepare(host, port, action, params, headers, timeoutSeconds)
+            return self.__FormatDetailed(*self.__Send(*prepared))
+        except Exception as error:
+            return self.__FormatDetailedError(str(error))
 
-        renderedPath, remainingParams = self.__RenderPath(pathTemplate, params)
+    async def ExecuteDetailedAsync(self, host: str, port: int, action: Dict[str, object], params: Dict[str, str], headers: Optional[Dict[str, str]] = None, timeoutSeconds: Optional[float] = None) -> Dict[str, object]:
+        """ExecuteDetailedAsync is the awaitable counterpart of ExecuteDetailed."""
 
-        baseUrl = f"http://{safeHost}:{safePort}".rstrip("/")
-        url = f"{baseUrl}{renderedPath}"
+        try:
+            prepared = self.__Prepare(host, port, action, params, headers, timeoutSeconds)
+            return self.__FormatDetailed(*await self.__SendAsync(*prepared))
+        except asyncio.TimeoutError:
+            return self.__FormatDetailedError("timed out")
+        except Exception as error:
+            return self.__FormatDetailedError(str(error))
+
+    async def ExecuteEncodedAsync(self, host: str, port: int, encoded: EncodedHttpRequest, headers: Optional[Dict[str, str]] = None, timeoutSeconds: Optional[float] = None) -> str:
+        """ExecuteEncodedAsync sends an already encoded request and returns short status text."""
 
         try:
-            request, timeoutSeconds = self.__BuildRequest(method, url, payloadKind, remainingParams, headers=headers)
-            response = urllib.request.urlopen(request, timeout=timeoutSeconds)
-            body = response.read().decode("utf-8", "ignore")
-            status = 0
-            try:
-                status = int(response.getcode() or 0)
-            except Exception:
-                status = 0
+            prepared = self.__PrepareEncoded(host, port, encoded, headers, timeoutSeconds)
+            return self.__FormatSummary(*await self.__SendAsync(*prepared))
+        except asyncio.TimeoutError:
+            return "timed out"
+        except Exception as error:
+            return str(error)
 
-            return {
-                "ok": True,
-                "status": status,
-                "summary": self.__Summarize(body),
-                "body": body,
-            }
-        except urllib.error.HTTPError as error:
-            try:
-                body = error.read().decode("utf-8", "ignore")
-            except Exception:
-                body = ""
+    async def ExecuteEncodedDetailedAsync(self, host: str, port: int, encoded: EncodedHttpRequest, headers: Optional[Dict[str, str]] = None, timeoutSeconds: Optional[float] = None) -> Dict[str, object]:
+        """ExecuteEncodedDetailedAsync is the detailed counterpart of ExecuteEncodedAsync."""
 
-            summary = self.__Summarize(body)
-            return {
-                "ok": False,
-                "status": int(getattr(error, "code", 0) or 0),
-                "error": f"HTTP {error.code} {error.reason}: {summary}",
-                "summary": summary,
-                "body": body,
-            }
+        try:
+            prepared = self.__PrepareEncoded(host, port, encoded, headers, timeoutSeconds)
+            return self.__FormatDetailed(*await self.__SendAsync(*prepared))
+        except asyncio.TimeoutError:
+            return self.__FormatDetailedError("timed out")
         except Exception as error:
-            return {
-                "ok": False,
-                "status": 0,
-                "error": str(error),
-                "summary": str(error),
-                "body": "",
-            }
+            return self.__FormatDetailedError(str(error))
 
     def GetJson(self, host: str, port: int, path: str, query: Optional[Dict[str, str]] = None, headers: Optional[Dict[str, str]] = None) -> object:
         safeHost = host or "localhost"
         safePort = port if 0 < port <= 65535 else 8765
         renderedPath = str(path or "/")
 
-        baseUrl = f"http://{safeHost}:{safePort}".rstrip("/")
-        url = f"{baseUrl}{renderedPath}"
+        target = renderedPath
         if query:
-            url = self.__AttachQuery(url, {str(key): str(value) for key, value in dict(query).items()})
+            target = EncodedHttpRequest.AttachQuery(target, dict(query))
+        url = f"http://{safeHost}:{safePort}{target}"
 
-        request = urllib.request.Request(url, method="GET")
-        self.__ApplyHeaders(request, headers)
         try:
-            response = urllib.request.urlopen(request, timeout=10)
-            body = response.read().decode("utf-8", "ignore")
+            timeout = self._healthTracker.GetTimeout(safeHost, safePort, self._jsonTimeoutSeconds, "GET", renderedPath)
+            response, trace = self.__Send(safeHost, safePort, "GET", target, None, self.__BuildHeaders(headers), timeout, renderedPath)
+            body = response.body.decode("utf-8", "ignore")
+            if response.status >= 400:
+                summary = self.__Summarize(body)
+                self._tracer.Finish(trace)
+                return {
+                    "success": False,
+                    "status": response.status,
+                    "error": f"HTTP {response.status} {response.reason}: {summary}".strip(),
+                    "body": body,
+                    "url": url,
+                }
+            parseStartedAt = time.monotonic() if trace is not None else 0.0
             try:
                 return json.loads(body)
             except Exception as error:
                 raise ValueError(f"Invalid JSON response: {error}")
-        except urllib.error.HTTPError as error:
-            try:
-                body = error.read().decode("utf-8", "ignore")
-            except Exception:
-                body = ""
-
-            summary = self.__Summarize(body)
-            return {
-                "success": False,
-                "status": int(getattr(error, "code", 0) or 0),
-                "error": f"HTTP {getattr(error, 'code', '')} {getattr(error, 'reason', '')}: {summary}".strip(),
-                "body": body,
-                "url": url,
-            }
+            finally:
+                if trace is not None:
+                    trace.parse += time.monotonic() - parseStartedAt
+                    self._tracer.Finish(trace)
         except Exception as error:
             return {
                 "success": False,
@@ -146,50 +184,213 @@ class RestApiClient:
                 "url": url,
             }
 
-    def __BuildRequest(self, method: str, url: str, payloadKind: str, params: Dict[str, str], headers: Optional[Dict[str, str]]) -> Tuple[urllib.request.Request, int]:
+    def __Prepare(
+        self,
+        host: str,
+        port: int,
+        action: Dict[str, object],
+        params: Dict[str, str],
+        headers: Optional[Dict[str, str]],
+        timeoutSeconds: Optional[float],
+    ) -> Tuple[str, int, str, str, Optional[bytes], Dict[str, str], float, str]:
+        safeHost = host or "localhost"
+        safePort = port if 0 < port <= 65535 else 8765
+        method = str(action.get("method", "GET")).upper()
+        pathTemplate = str(action.get("path", "/"))
+        payloadKind = str(action.get("payload", "query"))
+
+        path, remainingParams = EncodedHttpRequest.RenderPath(pathTemplate, params)
+
         if method == "GET":
-            finalUrl = self.__AttachQuery(url, params)
-            request = urllib.request.Request(finalUrl, method="GET")
-            self.__ApplyHeaders(request, headers)
-            return request, 8
+            target = EncodedHttpRequest.AttachQuery(path, remainingParams)
+            timeout = self.__ResolveTimeout(safeHost, safePort, timeoutSeconds, self._queryTimeoutSeconds, "GET", pathTemplate)
+            return safeHost, safePort, "GET", target, None, self.__BuildHeaders(headers), timeout, pathTemplate
 
         if payloadKind == "json":
             jsonBody: Dict[str, object] = {}
-            for key, value in params.items():
+            for key, value in remainingParams.items():
                 jsonBody[key] = self.__CoerceValue(value)
             dataBytes = json.dumps(jsonBody).encode("utf-8")
-            request = urllib.request.Request(url, data=dataBytes, method=method)
-            request.add_header("Content-Type", "application/json")
-            self.__ApplyHeaders(request, headers)
-            return request, 10
+            requestHeaders = {"Content-Type": "application/json"}
+            requestHeaders.update(self.__BuildHeaders(headers))
+            timeout = self.__ResolveTimeout(safeHost, safePort, timeoutSeconds, self._jsonTimeoutSeconds, method, pathTemplate)
+            return safeHost, safePort, method, path, dataBytes, requestHeaders, timeout, pathTemplate
 
-        finalUrl = self.__AttachQuery(url, params)
-        request = urllib.request.Request(finalUrl, data=b"", method=method)
-        self.__ApplyHeaders(request, headers)
-        return request, 8
+        target = EncodedHttpRequest.AttachQuery(path, remainingParams)
+        timeout = self.__ResolveTimeout(safeHost, safePort, timeoutSeconds, self._queryTimeoutSeconds, method, pathTemplate)
+        return safeHost, safePort, method, target, b"", self.__BuildHeaders(headers), timeout, pathTemplate
 
-    def __ApplyHeaders(self, request: urllib.request.Request, headers: Optional[Dict[str, str]]) -> None:
-        if not headers:
+    def __PrepareEncoded(
+        self,
+        host: str,
+        port: int,
+        encoded: EncodedHttpRequest,
+        headers: Optional[Dict[str, str]],
+        timeoutSeconds: Optional[float],
+    ) -> Tuple[str, int, str, str, Optional[bytes], Dict[str, str], float, str]:
+        safeHost = host or "localhost"
+        safePort = port if 0 < port <= 65535 else 8765
+
+        requestHeaders: Dict[str, str] = {}
+        if encoded.contentType:
+            requestHeaders["Content-Type"] = encoded.contentType
+        requestHeaders.update(self.__BuildHeaders(headers))
+
+        defaultTimeout = self._jsonTimeoutSeconds if encoded.contentType == "application/json" else self._queryTimeoutSeconds
+        timeout = self.__ResolveTimeout(safeHost, safePort, timeoutSeconds, defaultTimeout, encoded.method, encoded.route)
+        return safeHost, safePort, encoded.method, encoded.target, encoded.body, requestHeaders, timeout, encoded.route
+
+    def __ResolveTimeout(self, host: str, port: int, timeoutSeconds: Optional[float], defaultSeconds: float, method: str, route: str) -> float:
+        # An explicit per-request timeout wins; defaults adapt to the route's observed latency.
+        if timeoutSeconds is not None:
+            return timeoutSeconds
+        return self._healthTracker.GetTimeout(host, port, defaultSeconds, method, route)
+
+    def __Send(
+        self,
+        host: str,
+        port: int,
+        method: str,
+        target: str,
+        body: Optional[bytes],
+        headers: Dict[str, str],
+        timeout: float,
+        route: str,
+    ) -> Tuple[HttpResponseData, Optional[RequestTrace]]:
+        trace = self._tracer.Begin(method, route)
+        try:
+            decision = self._healthTracker.Decide(host, port)
+            if decision == "probe":
+                try:
+                    probe = self._connectionPool.Request(host, port, "GET", self.ProbePath, timeoutSeconds=self.ProbeTimeoutSeconds)
+                    isHealthy = probe.status not in self._UnavailableStatuses
+                except Exception:
+                    isHealthy = False
+                self._healthTracker.RecordProbe(host, port, isHealthy)
+                if not isHealthy:
+                    raise ConnectionError(EndpointHealthTracker.UnavailableMessage)
+            elif decision == "reject":
+                raise ConnectionError(EndpointHealthTracker.UnavailableMessage)
+
+            startedAt = time.monotonic()
+            try:
+                response = self._connectionPool.Request(host, port, method, target, body, headers, timeout, trace)
+            except Exception:
+                self._healthTracker.RecordFailure(host, port)
+                raise
+            self.__RecordResponse(host, port, response, time.monotonic() - startedAt, method, route)
+            return response, trace
+        except BaseException as error:
+            self.__FinishFailedTrace(trace, error)
+            raise
+
+    async def __SendAsync(
+        self,
+        host: str,
+        port: int,
+        method: str,
+        target: str,
+        body: Optional[bytes],
+        headers: Dict[str, str],
+        timeout: float,
+        route: str,
+    ) -> Tuple[HttpResponseData, Optional[RequestTrace]]:
+        trace = self._tracer.Begin(method, route)
+        try:
+            decision = self._healthTracker.Decide(host, port)
+            if decision == "probe":
+                try:
+                    probe = await self._asyncClient.Request(host, port, "GET", self.ProbePath, timeoutSeconds=self.ProbeTimeoutSeconds)
+                    isHealthy = probe.status not in self._UnavailableStatuses
+                except Exception:
+                    isHealthy = False
+                except BaseException:
+                    self._healthTracker.RecordProbe(host, port, False)
+                    raise
+                self._healthTracker.RecordProbe(host, port, isHealthy)
+                if not isHealthy:
+                    raise ConnectionError(EndpointHealthTracker.UnavailableMessage)
+            elif decision == "reject":
+                raise ConnectionError(EndpointHealthTracker.UnavailableMessage)
+
+            startedAt = time.monotonic()
+            try:
+                response = await self._asyncClient.Request(host, port, method, target, body, headers, timeout, trace)
+            except Exception:
+                self._healthTracker.RecordFailure(host, port)
+                raise
+            self.__RecordResponse(host, port, response, time.monotonic() - startedAt, method, route)
+            return response, trace
+        except BaseException as error:
+            self.__FinishFailedTrace(trace, error)
+            raise
+
+    def __FinishFailedTrace(self, trace: Optional[RequestTrace], error: BaseException) -> None:
+        if trace is None:
+            return
+        trace.error = "timed out" if isinstance(error, asyncio.TimeoutError) else type(error).__name__
+        self._tracer.Finish(trace)
+
+    def __RecordResponse(self, host: str, port: int, response: HttpResponseData, elapsedSeconds: float, method: str, route: str) -> None:
+        # Only "not ready" gateway-style statuses count against the endpoint; 4xx/500 from a game action
+        # mean RimAPI is up and answered.
+        if response.status in self._UnavailableStatuses:
+            self._healthTracker.RecordFailure(host, port)
             return
+        self._healthTracker.RecordSuccess(host, port, elapsedSeconds, method, route)
+
+    def __FormatSummary(self, response: HttpResponseData, trace: Optional[RequestTrace] = None) -> str:
+        body = response.body.decode("utf-8", "ignore")
+        summary = self.__SummarizeTraced(body, trace)
+        if response.status >= 400:
+            return f"HTTP {response.status} {response.reason}: {summary}"
+        return summary
+
+    def __FormatDetailed(self, response: HttpResponseData, trace: Optional[RequestTrace] = None) -> Dict[str, object]:
+        body = response.body.decode("utf-8", "ignore")
+        summary = self.__SummarizeTraced(body, trace)
+        if response.status >= 400:
+            return {
+                "ok": False,
+                "status": response.status,
+                "error": f"HTTP {response.status} {response.reason}: {summary}",
+                "summary": summary,
+                "body": body,
+            }
+
+        return {
+            "ok": True,
+            "status": response.status,
+            "summary": summary,
+            "body": body,
+        }
+
+    def __FormatDetailedError(self, message: str) -> Dict[str, object]:
+        return {
+            "ok": False,
+            "status": 0,
+            "error": message,
+            "summary": message,
+            "body": "",
+        }
+
+    def __SummarizeTraced(self, body: str, trace: Optional[RequestTrace]) -> str:
+        if trace is None:
+            return self.__Summarize(body)
+        parseStartedAt = time.monotonic()
+        summary = self.__Summarize(body)
+        trace.parse += time.monotonic() - parseStartedAt
+        self._tracer.Finish(trace)
+        return summary
+
+    def __BuildHeaders(self, headers: Optional[Dict[str, str]]) -> Dict[str, str]:
+        built: Dict[str, str] = {}
+        if not headers:
+            return built
         for headerName, headerValue in headers.items():
             if headerName and headerValue is not None:
-                request.add_header(str(headerName), str(headerValue))
-
-    def __RenderPath(self, pathTemplate: str, params: Dict[str, str]) -> Tuple[str, Dict[str, str]]:
-        rendered = pathTemplate
-        remaining: Dict[str, str] = dict(params or {})
-        for key, value in list(remaining.items()):
-            placeholder = "{" + str(key) + "}"
-            if placeholder in rendered:
-                rendered = rendered.replace(placeholder, urllib.parse.quote(str(value)))
-                del remaining[key]
-        return rendered, remaining
-
-    def __AttachQuery(self, url: str, params: Dict[str, str]) -> str:
-        if not params:
-            return url
-        encoded = urllib.parse.urlencode(params)
-        return f"{url}?{encoded}"
+                built[str(headerName)] = str(headerValue)
+        return built
 
     def __CoerceValue(self, value: str) -> object:
         trimmed = (value or "").strip()
@@ -0,0 +1,95 @@
+import asyncio
+import sys
+from pathlib import Path
+import unittest
+
+projectRoot = Path(__file__).resolve().parents[2]
+if str(projectRoot) not in sys.path:
+    sys.path.append(str(projectRoot))
+
+from src.window.async_http_client import AsyncHttpClient
+
+
+class StandInServer:
+    """Answers GETs with keep-alive; reads a POST and hangs up without answering."""
+
+    def __init__(self) -> None:
+        self.requests = []
+        self.connections = 0
+        self._server = None
+
+    async def Start(self) -> int:
+        self._server = await asyncio.start_server(self.__Handle, "127.0.0.1", 0)
+        return int(self._server.sockets[0].getsockname()[1])
+
+    async def Stop(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def __Handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            while True:
+                requestLine = await reader.readline()
+                if not requestLine:
+                    return
+                length = 0
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    if name.strip().lower() == "content-length":
+                        length = int(value.strip())
+                await reader.readexactly(length)
+                method, target = requestLine.decode("latin-1").split(" ")[:2]
+                self.requests.append((method, target))
+                if method == "POST":
+                    return
+                body = b'{"success":true}'
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: " + str(len(body)).encode() + b"\r\n\r\n" + body)
+                await writer.drain()
+        finally:
+            writer.close()
+
+
+class AsyncHttpClientTestCase(unittest.TestCase):
+    def testPostIsNotResentAfterServerReceivedIt(self) -> None:
+        async def scenario() -> StandInServer:
+            server = StandInServer()
+            port = await server.Start()
+            client = AsyncHttpClient()
+            try:
+                response = await client.Request("127.0.0.1", port, "GET", "/api/status", timeoutSeconds=2.0)
+                self.assertEqual(response.status, 200)
+                with self.assertRaises((OSError, asyncio.IncompleteReadError)):
+                    await client.Request("127.0.0.1", port, "POST", "/api/incidents/execute", body=b"{}", timeoutSeconds=2.0)
+            finally:
+                await client.CloseAll()
+                await server.Stop()
+            return server
+
+        server = asyncio.run(scenario())
+        self.assertEqual(server.requests, [("GET", "/api/status"), ("POST", "/api/incidents/execute")])
+
+    def testGetReusesConnection(self) -> None:
+        async def scenario() -> StandInServer:
+            server = StandInServer()
+            port = await server.Start()
+            client = AsyncHttpClient()
+            try:
+                for _ in range(3):
+                    response = await client.Request("127.0.0.1", port, "GET", "/api/ticks", timeoutSeconds=2.0)
+                    self.assertEqual(response.body, b'{"success":true}')
+            finally:
+                await client.CloseAll()
+                await server.Stop()
+            return server
+
+        server = asyncio.run(scenario())
+        self.assertEqual(server.connections, 1)
+        self.assertEqual(len(server.requests), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import unittest
+
+projectRoot = Path(__file__).resolve().parents[2]
+if str(projectRoot) not in sys.path:
+    sys.path.append(str(projectRoot))
+
+from src.test_support.fake_clock import FakeClock
+from src.window.endpoint_health_tracker import EndpointHealthTracker
+from src.window.rest_api_client import RestApiClient
+
+
+class LoadingGameHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    gameReady = False
+    paths = []
+
+    def log_message(self, format: str, *args: object) -> None:
+        return
+
+    def do_GET(self) -> None:
+        LoadingGameHandler.paths.append(self.path)
+        status = 200 if LoadingGameHandler.gameReady else 503
+        body = json.dumps({"success": LoadingGameHandler.gameReady}).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class EndpointHealthTrackerTestCase(unittest.TestCase):
+    def testOpensAfterThresholdAndProbesOnce(self) -> None:
+        clock = FakeClock()
+        tracker = EndpointHealthTracker(failureThreshold=2, openSeconds=5.0, clock=clock)
+        tracker.RecordFailure("h", 1)
+        self.assertEqual(tracker.Decide("h", 1), "allow")
+        tracker.RecordFailure("h", 1)
+        self.assertEqual(tracker.Decide("h", 1), "reject")
+        self.assertFalse(tracker.IsAvailable("h", 1))
+
+        clock.now += 5.0
+        self.assertEqual(tracker.Decide("h", 1), "probe")
+        self.assertEqual(tracker.Decide("h", 1), "reject")
+        tracker.RecordProbe("h", 1, False)
+
+        clock.now += 5.0
+        self.assertEqual(tracker.Decide("h", 1), "reject")
+        clock.now += 5.0
+        self.assertEqual(tracker.Decide("h", 1), "probe")
+        tracker.RecordProbe("h", 1, True)
+        self.assertEqual(tracker.Decide("h", 1), "allow")
+
+    def testTimeoutFollowsLatency(self) -> None:
+        tracker = EndpointHealthTracker(minTimeoutSeconds=0.5, latencyMultiplier=4.0, minLatencySamples=4)
+        self.assertEqual(tracker.GetTimeout("h", 1, 8.0), 8.0)
+        for latency in (0.05, 0.1, 0.2, 0.3):
+            tracker.RecordSuccess("h", 1, latency)
+        self.assertAlmostEqual(tracker.GetTimeout("h", 1, 8.0), 1.2)
+        tracker.RecordSuccess("h", 1, 5.0)
+        self.assertEqual(tracker.GetTimeout("h", 1, 8.0), 8.0)
+
+    def testTimeoutIsTrackedPerRoute(self) -> None:
+        tracker = EndpointHealthTracker(minTimeoutSeconds=0.5, latencyMultiplier=4.0, minLatencySamples=4)
+        for _ in range(4):
+            tracker.RecordSuccess("h", 1, 0.05, "GET", "/api/status")
+        self.assertAlmostEqual(tracker.GetTimeout("h", 1, 8.0, "GET", "/api/status"), 0.5)
+        self.assertEqual(tracker.GetTimeout("h", 1, 8.0, "GET", "/api/raids/catalog"), 8.0)
+
+        for _ in range(4):
+            tracker.RecordSuccess("h", 1, 0.05, "POST", "/api/events/{id}")
+        self.assertEqual(tracker.GetTimeout("h", 1, 8.0, "POST", "/api/events/{id}"), 8.0)
+
+    def testClientFailsFastUntilStatusProbeSucceeds(self) -> None:
+        LoadingGameHandler.gameReady = False
+        LoadingGameHandler.paths = []
+        server = ThreadingHTTPServer(("127.0.0.1", 0), LoadingGameHandler)
+        port = int(server.server_address[1])
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        clock = FakeClock()
+        client = RestApiClient(healthTracker=EndpointHealthTracker(failureThreshold=2, openSeconds=5.0, clock=clock))
+        try:
+            for _ in range(2):
+                self.assertIn("503", str(client.GetJson("127.0.0.1", port, "/api/maps")))
+            self.assertFalse(client.IsAvailable("127.0.0.1", port))
+            self.assertEqual(client.Execute("127.0.0.1", port, {"method": "GET", "path": "/api/maps"}, {}), EndpointHealthTracker.UnavailableMessage)
+            self.assertEqual(LoadingGameHandler.paths, ["/api/maps", "/api/maps"])
+
+            LoadingGameHandler.gameReady = True
+            clock.now += 5.0
+            self.assertEqual(client.Execute("127.0.0.1", port, {"method": "GET", "path": "/api/maps"}, {}), "success: True")
+            self.assertEqual(LoadingGameHandler.paths[2:], ["/api/status", "/api/maps"])
+            self.assertTrue(client.IsAvailable("127.0.0.1", port))
+        finally:
+            client.Close()
+            server.shutdown()
+            server.server_close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,208 @@
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+import unittest
+
+projectRoot = Path(__file__).resolve().parents[2]
+if str(projectRoot) not in sys.path:
+    sys.path.append(str(projectRoot))
+
+from src.window.events.editor_tab.game_api_catalog_store import GameApiCatalogStore
+from src.window.events.editor_tab.game_api_data_source import GameApiDataSource
+
+
+class StaticSettingsService:
+    def Get(self) -> SimpleNamespace:
+        return SimpleNamespace(rimApiHost="127.0.0.1", rimApiPort=8765)
+
+
+class SlowApiClient:
+    def __init__(self, delaySeconds: float) -> None:
+        self._delaySeconds = delaySeconds
+        self._lock = threading.Lock()
+        self.calls = []
+        self.responses = []
+        self.responsesByPath = {}
+
+    def GetJson(self, host, port, path, query=None, headers=None):
+        with self._lock:
+            self.calls.append(path)
+            if path in self.responsesByPath:
+                response = self.responsesByPath[path]
+            elif self.responses:
+                response = self.responses.pop(0)
+            else:
+                response = [{"defName": "Steel"}, {"defName": "Silver"}]
+        time.sleep(self._delaySeconds)
+        return response
+
+
+class FailingStatusApiClient(SlowApiClient):
+    def GetJson(self, host, port, path, query=None, headers=None):
+        if path == GameApiDataSource.StatusPath:
+            with self._lock:
+                self.calls.append(path)
+            raise ValueError("Invalid JSON response")
+        return super().GetJson(host, port, path, query, headers)
+
+
+class GameApiDataSourceTestCase(unittest.TestCase):
+    def testConcurrentCallersShareOneFetch(self) -> None:
+        client = SlowApiClient(0.2)
+        dataSource = GameApiDataSource(StaticSettingsService(), client)
+        barrier = threading.Barrier(8)
+        results = []
+
+        def worker() -> None:
+            barrier.wait()
+            results.append(dataSource.GetThingCatalog())
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5.0)
+
+        self.assertEqual(client.calls, ["/api/things/catalog"])
+        self.assertEqual(results, [["Silver", "Steel"]] * 8)
+
+        dataSource.GetThingCatalog()
+        self.assertEqual(len(client.calls), 1)
+
+    def testInvalidateDuringFetchDoesNotCacheStaleResult(self) -> None:
+        client = SlowApiClient(0.2)
+        dataSource = GameApiDataSource(StaticSettingsService(), client)
+        fetch = threading.Thread(target=dataSource.GetMaps)
+        fetch.start()
+        time.sleep(0.05)
+        dataSource.InvalidateAll()
+        fetch.join(timeout=5.0)
+
+        dataSource.GetMaps()
+        self.assertEqual(client.calls, ["/api/maps", "/api/maps"])
+
+    def testEndpointChangeDuringFetchStartsANewFetch(self) -> None:
+        client = SlowApiClient(0.3)
+        settings = SimpleNamespace(rimApiHost="127.0.0.1", rimApiPort=8765)
+        settingsService = SimpleNamespace(Get=lambda: settings)
+        client.responses = [[{"defName": "OldGame"}], [{"defName": "NewGame"}]]
+        dataSource = GameApiDataSource(settingsService, client)
+        fetch = threading.Thread(target=dataSource.GetFactions)
+        fetch.start()
+        time.sleep(0.05)
+
+        settings.rimApiPort = 8766
+        self.assertEqual(dataSource.GetFactions(), ["NewGame"])
+        fetch.join(timeout=5.0)
+        self.assertEqual(dataSource.GetFactions(), ["NewGame"])
+        self.assertEqual(client.calls, ["/api/factions", "/api/factions"])
+
+    def testServesStaleValueWhileRefreshingInBackground(self) -> None:
+        client = SlowApiClient(0.2)
+        client.responses = [{"success": False, "error": "loading"}, [{"defName": "Tribal"}]]
+        dataSource = GameApiDataSource(StaticSettingsService(), client)
+        dataSource._TtlSeconds = {"factions": 0.0}
+
+        self.assertEqual(dataSource.GetFactions(), [])
+        self.assertEqual(dataSource.GetFactions(), ["Tribal"])  # the failure was not cached
+
+        startedAt = time.monotonic()
+        self.assertEqual(dataSource.GetFactions(), ["Tribal"])
+        self.assertEqual(dataSource.GetFactions(), ["Tribal"])
+        self.assertLess(time.monotonic() - startedAt, 0.1)
+        time.sleep(0.05)
+        self.assertEqual(len(client.calls), 3)  # one background refresh, shared by both readers
+
+        time.sleep(0.4)
+        self.assertEqual(dataSource.GetFactions(), ["Silver", "Steel"])
+
+    def testSearchIndexIsSharedUntilTheCachedEntryChanges(self) -> None:
+        client = SlowApiClient(0.0)
+        client.responses = [[{"defName": "Steel"}], [{"defName": "Plasteel"}]]
+        dataSource = GameApiDataSource(StaticSettingsService(), client)
+
+        index = dataSource.GetThingCatalogIndex()
+        self.assertIs(dataSource.GetThingCatalogIndex(), index)
+        self.assertEqual(dataSource.GetThingCatalog(), ["Steel"])
+
+        refreshed = dataSource.GetThingCatalogIndex(forceRefresh=True)
+        self.assertIsNot(refreshed, index)
+        self.assertEqual(refreshed.GetOptions(), ["Plasteel"])
+        self.assertIs(dataSource.GetThingCatalogIndex(), refreshed)
+
+        strategies = dataSource.GetRaidCatalogIndex("raidStrategyDefName")
+        self.assertIsNot(dataSource.GetRaidCatalogIndex("arrivalModeDefName"), strategies)
+        self.assertIs(dataSource.GetRaidCatalogIndex("raidStrategyDefName"), strategies)
+
+    def testRaidCatalogIsFetchedOncePerRefresh(self) -> None:
+        client = SlowApiClient(0.0)
+        client.responsesByPath = {
+            "/api/raids/catalog": {"raidStrategies": [{"defName": "ImmediateAttack"}], "arrivalModes": [{"defName": "EdgeWalkIn"}], "factions": [{"defName": "Pirate"}]},
+        }
+        dataSource = GameApiDataSource(StaticSettingsService(), client)
+
+        catalog = dataSource.GetRaidCatalog(forceRefresh=True)
+        self.assertEqual(client.calls.count("/api/raids/catalog"), 1)
+        self.assertEqual(catalog, {"raidStrategyDefName": ["ImmediateAttack"], "arrivalModeDefName": ["EdgeWalkIn"], "factionDefName": ["Pirate"]})
+        self.assertEqual(dataSource.GetRaidCatalogIndex("factionDefName").GetOptions(), ["Pirate"])
+        self.assertEqual(client.calls.count("/api/raids/catalog"), 1)
+
+        dataSource.WarmUpAll()
+        self.assertEqual(client.calls.count("/api/raids/catalog"), 2)
+
+    def testPersistedCatalogsLoadInstantlyOnNextLaunch(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            cachePath = Path(directory) / "catalogs.json"
+            firstStore = GameApiCatalogStore(cachePath)
+            firstLaunch = GameApiDataSource(StaticSettingsService(), SlowApiClient(0.0), firstStore)
+            self.assertEqual(firstLaunch.GetHediffCatalog(), ["Silver", "Steel"])
+            firstLaunch.GetPawns()
+            firstStore.Flush()
+
+            client = SlowApiClient(0.3)
+            client.responsesByPath = {"/api/status": {"success": False, "error": "loading"}, "/api/hediffs/catalog": [{"defName": "Flu"}]}
+            secondLaunch = GameApiDataSource(StaticSettingsService(), client, GameApiCatalogStore(cachePath))
+            startedAt = time.monotonic()
+            self.assertEqual(secondLaunch.GetHediffCatalog(), ["Silver", "Steel"])
+            self.assertLess(time.monotonic() - startedAt, 0.1)
+
+            time.sleep(0.8)
+            self.assertEqual(secondLaunch.GetHediffCatalog(), ["Flu"])
+            self.assertIn("/api/status", client.calls)
+
+    def testCatalogsFetchedBeforeFirstFingerprintAreKept(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            cachePath = Path(directory) / "catalogs.json"
+            store = GameApiCatalogStore(cachePath)
+            client = SlowApiClient(0.1)
+            client.responsesByPath = {"/api/status": {"gameVersion": "1.5"}}
+            dataSource = GameApiDataSource(StaticSettingsService(), client, store)
+            self.assertEqual(dataSource.GetHediffCatalog(), ["Silver", "Steel"])
+            time.sleep(0.3)
+            store.Flush()
+
+            fingerprint, catalogs = GameApiCatalogStore(cachePath).Load("127.0.0.1:8765")
+            self.assertEqual(fingerprint, GameApiCatalogStore.BuildFingerprint({"gameVersion": "1.5"}))
+            self.assertEqual(catalogs, {"hediffsCatalog": [{"defName": "Steel"}, {"defName": "Silver"}]})
+            self.assertEqual(dataSource.GetHediffCatalog(), ["Silver", "Steel"])
+            self.assertEqual(client.calls.count("/api/hediffs/catalog"), 1)
+
+    def testFailedStatusFetchKeepsSavedCatalogs(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            cachePath = Path(directory) / "catalogs.json"
+            store = GameApiCatalogStore(cachePath)
+            store.Put("127.0.0.1:8765", "abc", "factions", ["Tribal"])
+
+            client = FailingStatusApiClient(0.0)
+            dataSource = GameApiDataSource(StaticSettingsService(), client, store)
+            self.assertEqual(dataSource.GetFactions(), ["Tribal"])
+            time.sleep(0.1)
+            self.assertEqual(client.calls.count("/api/status"), 1)
+            self.assertEqual(store.Load("127.0.0.1:8765")[0], "abc")
+
+
+if __name__ == "__main__":
+    unittest.main()
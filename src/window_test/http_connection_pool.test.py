@@ -0,0 +1,108 @@
+import http.client
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import unittest
+
+projectRoot = Path(__file__).resolve().parents[2]
+if str(projectRoot) not in sys.path:
+    sys.path.append(str(projectRoot))
+
+from src.window.http_connection_pool import HttpConnectionPool
+
+
+class CountingHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    connections = 0
+    posts = 0
+    dropAfterResponse = False
+
+    def setup(self) -> None:
+        super().setup()
+        CountingHandler.connections += 1
+
+    def log_message(self, format: str, *args: object) -> None:
+        return
+
+    def do_GET(self) -> None:
+        body = json.dumps({"success": True, "path": self.path}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        if CountingHandler.dropAfterResponse:
+            # Close without announcing it, like a server dropping an idle keep-alive socket.
+            self.close_connection = True
+
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        CountingHandler.posts += 1
+        # Take the request, then drop the connection before answering.
+        self.close_connection = True
+
+
+class HttpConnectionPoolTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        CountingHandler.connections = 0
+        CountingHandler.posts = 0
+        CountingHandler.dropAfterResponse = False
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), CountingHandler)
+        self._port = int(self._server.server_address[1])
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        self._pool = HttpConnectionPool(maxIdlePerHost=2, connectTimeoutSeconds=2.0)
+
+    def tearDown(self) -> None:
+        self._pool.CloseAll()
+        self._server.shutdown()
+        self._server.server_close()
+
+    def testReusesKeepAliveConnection(self) -> None:
+        for index in range(5):
+            response = self._pool.Request("127.0.0.1", self._port, "GET", f"/api/ping?n={index}", timeoutSeconds=2.0)
+            self.assertEqual(response.status, 200)
+            self.assertEqual(json.loads(response.body)["path"], f"/api/ping?n={index}")
+        self.assertEqual(CountingHandler.connections, 1)
+        self.assertEqual(self._pool.GetIdleCount("127.0.0.1", self._port), 1)
+
+    def testReconnectsWhenPooledSocketIsStale(self) -> None:
+        CountingHandler.dropAfterResponse = True
+        first = self._pool.Request("127.0.0.1", self._port, "GET", "/api/ping", timeoutSeconds=2.0)
+        second = self._pool.Request("127.0.0.1", self._port, "GET", "/api/status", timeoutSeconds=2.0)
+        self.assertEqual(first.status, 200)
+        self.assertEqual(second.status, 200)
+        self.assertEqual(json.loads(second.body)["path"], "/api/status")
+        self.assertEqual(CountingHandler.connections, 2)
+
+    def testPostIsNotResentAfterServerReceivedIt(self) -> None:
+        self._pool.Request("127.0.0.1", self._port, "GET", "/api/ping", timeoutSeconds=2.0)
+        with self.assertRaises((OSError, http.client.HTTPException)):
+            self._pool.Request("127.0.0.1", self._port, "POST", "/api/incidents/execute", body=b"{}", timeoutSeconds=2.0)
+        self.assertEqual(CountingHandler.posts, 1)
+
+    def testSharedAcrossThreads(self) -> None:
+        statuses = []
+        lock = threading.Lock()
+
+        def worker() -> None:
+            for _ in range(10):
+                response = self._pool.Request("127.0.0.1", self._port, "GET", "/api/ticks", timeoutSeconds=2.0)
+                with lock:
+                    statuses.append(response.status)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(statuses, [200] * 40)
+        self.assertLessEqual(self._pool.GetIdleCount("127.0.0.1", self._port), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import random
+import sys
+import time
+from pathlib import Path
+import unittest
+
+projectRoot = Path(__file__).resolve().parents[2]
+if str(projectRoot) not in sys.path:
+    sys.path.append(str(projectRoot))
+
+from src.window.events.editor_tab.option_search_index import OptionSearchIndex
+
+
+class OptionSearchIndexTestCase(unittest.TestCase):
+    def testRanksPrefixThenSubstringThenFuzzy(self) -> None:
+        index = OptionSearchIndex(["MeleeWeapon_LongSword", "Steel", "Silver", "SteelSword", "Plasteel", "Steel", "Stele"])
+
+        self.assertEqual(len(index), 6)
+        self.assertEqual(index.Search("ste"), ["Steel", "SteelSword", "Stele", "Plasteel"])
+        self.assertEqual(index.Search("sword"), ["SteelSword", "MeleeWeapon_LongSword"])
+        self.assertEqual(index.Search("longswrd")[:1], ["MeleeWeapon_LongSword"])
+        self.assertEqual(index.Search("", limit=2), ["MeleeWeapon_LongSword", "Plasteel"])
+        self.assertEqual(index.Search("s", limit=3), ["Silver", "Steel", "SteelSword"])
+
+    def testKeystrokeQueriesStayUnderOneMillisecond(self) -> None:
+        randomSource = random.Random(7)
+        parts = ["Steel", "Gun", "Melee", "Apparel", "Plasteel", "Chunk", "Meal", "Bionic", "Arm", "Leg", "Sword", "Bow", "Hat", "Jade", "Wood"]
+        options = [f"{randomSource.choice(parts)}_{randomSource.choice(parts)}{number}" for number in range(8000)]
+        index = OptionSearchIndex(options)
+
+        queries = []
+        for word in ["plasteel_sw", "bionicarm", "gun_m", "chunkjade", "meal"]:
+            queries.extend(word[:length] for length in range(1, len(word) + 1))
+
+        startedAt = time.perf_counter()
+        for query in queries:
+            self.assertLessEqual(len(index.Search(query, limit=50)), 50)
+        averageMs = (time.perf_counter() - startedAt) * 1000.0 / len(queries)
+        self.assertLess(averageMs, 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import sys
+from pathlib import Path
+import unittest
+
+projectRoot = Path(__file__).resolve().parents[2]
+if str(projectRoot) not in sys.path:
+    sys.path.append(str(projectRoot))
+
+from src.rimapi.game_clock_service import GameClockService
+from src.test_support.fake_clock import FakeClock
+from src.window.events.protection_poll_schedule import ProtectionPollSchedule
+
+
+def BuildResponse(nowTick: int, externalUntil: int = 0) -> dict:
+    return {
+        "success": True,
+        "externalBadEventsActive": externalUntil > nowTick,
+        "allBadIncidentsActive": False,
+        "nowTick": nowTick,
+        "externalBadEventsUntilTick": externalUntil,
+        "allBadIncidentsUntilTick": 0,
+    }
+
+
+class ProtectionPollScheduleTestCase(unittest.TestCase):
+    def testBacksOffWhileInactiveAndUnchanged(self) -> None:
+        clock = FakeClock()
+        schedule = ProtectionPollSchedule(baseIntervalSeconds=2.5, maxIntervalSeconds=60.0, clock=clock)
+
+        delays = []
+        for step in range(7):
+            delays.append(schedule.Observe(BuildResponse(step * 600)))
+            clock.now += delays[-1]
+
+        self.assertEqual(delays, [2.5, 5.0, 10.0, 20.0, 40.0, 60.0, 60.0])
+        self.assertIsNone(schedule.GetRemainingSeconds())
+        self.assertEqual(schedule.Observe({"success": False, "error": "down"}), 2.5)
+
+    def testCountsDownFromGameClockAndPollsJustBeforeExpiry(self) -> None:
+        clock = FakeClock()
+        gameClock = GameClockService(None, clock=clock)
+        schedule = ProtectionPollSchedule(gameClock, expiryLeadSeconds=1.0, activeMaxIntervalSeconds=30.0, clock=clock)
+
+        gameClock.Observe({"ticksGame": 0, "timeSpeed": 2})  # Fast: 180 ticks per second
+        # 12000 ticks left -> 66.7 s, capped at 30.
+        self.assertEqual(schedule.Observe(BuildResponse(0, externalUntil=12000)), 30.0)
+
+        clock.now += 10.0
+        self.assertAlmostEqual(schedule.GetRemainingSeconds(), (12000 - 1800) / 180.0)
+
+        clock.now += 50.0
+        delay = schedule.Observe(BuildResponse(10800, externalUntil=12000))
+        self.assertAlmostEqual(delay, 1200 / 180.0 - 1.0)
+
+    def testPausedGameFreezesCountdown(self) -> None:
+        clock = FakeClock()
+        gameClock = GameClockService(None, clock=clock)
+        schedule = ProtectionPollSchedule(gameClock, activeMaxIntervalSeconds=30.0, clock=clock)
+
+        gameClock.Observe({"ticksGame": 6000, "timeSpeed": 0})
+        self.assertEqual(schedule.Observe(BuildResponse(6000, externalUntil=9000)), 30.0)
+        clock.now += 20.0
+        self.assertTrue(schedule.IsPaused())
+        self.assertAlmostEqual(schedule.GetRemainingSeconds(), 50.0)
+
+if __name__ == "__main__":
+    unittest.main()
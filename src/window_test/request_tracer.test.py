@@ -0,0 +1,81 @@
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import unittest
+
+projectRoot = Path(__file__).resolve().parents[2]
+if str(projectRoot) not in sys.path:
+    sys.path.append(str(projectRoot))
+
+from src.window.latency_histogram import LatencyHistogram
+from src.window.request_tracer import RequestTracer
+from src.window.rest_api_client import RestApiClient
+
+
+class EchoHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, format: str, *args: object) -> None:
+        return
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length", "0") or 0)
+        self.rfile.read(length)
+        body = json.dumps({"success": True}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class RequestTracerTestCase(unittest.TestCase):
+    def testHistogramPercentilesStayWithinBucketPrecision(self) -> None:
+        histogram = LatencyHistogram()
+        for value in range(1, 10001):
+            histogram.Record(value)
+        self.assertEqual(histogram.GetCount(), 10000)
+        for percentile, exact in ((50, 5000), (90, 9000), (99, 9900)):
+            self.assertLessEqual(abs(histogram.GetPercentile(percentile) - exact) / exact, 1.0 / 16)
+        self.assertEqual(histogram.GetPercentile(100), 10000)
+
+    def testDisabledTracerRecordsNothing(self) -> None:
+        tracer = RequestTracer()
+        self.assertIsNone(tracer.Begin("GET", "/api/ping"))
+        tracer.Finish(None)
+        self.assertEqual(tracer.GetHistograms(), {"routes": []})
+
+    def testClientTracesTemplatedRoute(self) -> None:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), EchoHandler)
+        port = int(server.server_address[1])
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        tracer = RequestTracer(enabled=True, capacity=2)
+        client = RestApiClient(tracer=tracer)
+        try:
+            action = {"method": "POST", "path": "/api/maps/{mapId}/spawn", "payload": "json"}
+            for mapId in ("0", "1", "2"):
+                self.assertEqual(client.Execute("127.0.0.1", port, action, {"mapId": mapId, "defName": "Steel"}), "success: True")
+
+            recent = tracer.GetRecent()
+            self.assertEqual(len(recent), 2)
+            self.assertEqual(recent[-1]["route"], "/api/maps/{mapId}/spawn")
+            self.assertEqual(recent[-1]["status"], 200)
+            self.assertGreater(recent[-1]["bytes"], 0)
+
+            dumped = json.loads(tracer.DumpJson())
+            self.assertEqual(len(dumped["routes"]), 1)
+            route = dumped["routes"][0]
+            self.assertEqual(route["statuses"], {"200": 3})
+            self.assertEqual(set(route["phases"]), {"queue", "connect", "firstByte", "body", "parse", "total"})
+            self.assertEqual(route["phases"]["total"]["count"], 3)
+        finally:
+            client.Close()
+            server.shutdown()
+            server.server_close()
+
+
+if __name__ == "__main__":
+    unittest.main()
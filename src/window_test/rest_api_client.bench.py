@@ -0,0 +1,101 @@
+"""Benchmark pooled RestApiClient calls against fresh urllib connections.
+
+Runs a local keep-alive stand-in for RimAPI and times N sequential GET and
+POST calls both ways. Usage: python src/window_test/rest_api_client.bench.py [count]
+"""
+
+import json
+import sys
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+projectRoot = Path(__file__).resolve().parents[2]
+if str(projectRoot) not in sys.path:
+    sys.path.append(str(projectRoot))
+
+from src.window.rest_api_client import RestApiClient
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, format: str, *args: object) -> None:
+        return
+
+    def do_GET(self) -> None:
+        self.__Reply({"success": True, "data": {"protection": False}})
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length", "0") or 0)
+        if length > 0:
+            self.rfile.read(length)
+        self.__Reply({"success": True})
+
+    def __Reply(self, document: object) -> None:
+        body = json.dumps(document).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def TimeCalls(label: str, count: int, call) -> None:
+    call()
+    started = time.perf_counter()
+    for _ in range(count):
+        call()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<28} {count} calls  {elapsed * 1000:8.1f} ms  {elapsed / count * 1e6:8.1f} us/call")
+
+
+def Main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    port = int(server.server_address[1])
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    client = RestApiClient()
+    baseUrl = f"http://127.0.0.1:{port}"
+    postBody = json.dumps({"incidentDefName": "RaidEnemy", "points": 300}).encode("utf-8")
+
+    def urllibGet() -> None:
+        with urllib.request.urlopen(f"{baseUrl}/api/protection", timeout=10) as response:
+            json.loads(response.read().decode("utf-8"))
+
+    def urllibPost() -> None:
+        request = urllib.request.Request(f"{baseUrl}/api/incidents/execute", data=postBody, method="POST")
+        request.add_header("Content-Type", "application/json")
+        with urllib.request.urlopen(request, timeout=10) as response:
+            response.read()
+
+    def pooledGet() -> None:
+        client.GetJson("127.0.0.1", port, "/api/protection")
+
+    def pooledPost() -> None:
+        client.Execute("127.0.0.1", port, {"method": "POST", "path": "/api/incidents/execute", "payload": "json"}, {"incidentDefName": "RaidEnemy", "points": "300"})
+
+    try:
+        TimeCalls("urlopen GET", count, urllibGet)
+        TimeCalls("pooled GetJson", count, pooledGet)
+        TimeCalls("urlopen POST", count, urllibPost)
+        TimeCalls("pooled Execute POST", count, pooledPost)
+        client.GetTracer().SetEnabled(True)
+        TimeCalls("pooled GetJson (traced)", count, pooledGet)
+        TimeCalls("pooled Execute POST (traced)", count, pooledPost)
+        for route in client.GetTracer().GetHistograms()["routes"]:
+            phases = ", ".join(f"{name} p50={data['p50Us']}us p99={data['p99Us']}us" for name, data in route["phases"].items())
+            print(f"{route['method']} {route['route']}: {phases}")
+    finally:
+        client.Close()
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    Main()
@@ -0,0 +1,66 @@
+import sys
+from pathlib import Path
+import unittest
+
+projectRoot = Path(__file__).resolve().parents[2]
+if str(projectRoot) not in sys.path:
+    sys.path.append(str(projectRoot))
+
+from src.test_support.fake_clock import FakeClock
+from src.window.events.random_tab.round_timer import RoundTimer
+
+
+class RoundTimerTestCase(unittest.TestCase):
+    def testCountdownIsDerivedFromDeadline(self) -> None:
+        clock = FakeClock()
+        timer = RoundTimer(clock=clock)
+        timer.Start(60)
+        self.assertEqual(timer.GetRemainingSeconds(), 60)
+
+        clock.now += 12.4
+        self.assertEqual(timer.GetRemainingSeconds(), 48)
+        self.assertEqual(timer.ScheduleNextTickMs(), 600)
+        self.assertFalse(timer.IsDue())
+
+        clock.now += 47.6
+        self.assertTrue(timer.IsDue())
+        self.assertEqual(timer.GetRemainingSeconds(), 0)
+
+    def testSlowTicksDoNotStretchTheRound(self) -> None:
+        clock = FakeClock()
+        timer = RoundTimer(clock=clock)
+        timer.Start(60)
+        for _ in range(120):
+            delaySeconds = timer.ScheduleNextTickMs() / 1000.0
+            clock.now += delaySeconds + 0.15
+            timer.MarkTick()
+            if timer.IsDue():
+                break
+        self.assertTrue(timer.IsDue())
+        self.assertLessEqual(clock.now - 100.0, 60.0 + 0.15 + 1e-6)
+        self.assertAlmostEqual(timer.GetMaxTickLatenessSeconds(), 0.15, places=6)
+
+    def testAdvanceChainsDeadlinesAndReportsOverrun(self) -> None:
+        clock = FakeClock()
+        timer = RoundTimer(clock=clock)
+        timer.Start(30)
+
+        clock.now += 30.1
+        self.assertEqual(timer.Advance(30), 0.0)
+        self.assertEqual(timer.GetRemainingSeconds(), 30)
+
+        clock.now += 31.9
+        self.assertAlmostEqual(timer.Advance(30), 2.0, places=6)
+        self.assertEqual(timer.GetRemainingSeconds(), 28)
+
+    def testLongStallReanchorsSchedule(self) -> None:
+        clock = FakeClock()
+        timer = RoundTimer(clock=clock)
+        timer.Start(10)
+        clock.now += 45.0
+        self.assertAlmostEqual(timer.Advance(10), 35.0, places=6)
+        self.assertEqual(timer.GetRemainingSeconds(), 10)
+
+
+if __name__ == "__main__":
+    unittest.main()